@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import struct
 import re
+from functools import lru_cache
 from typing import Any
 
 # Rating scaling constants
@@ -21,6 +22,7 @@ _YEAR_FIELD_CACHE: dict[str, bool] = {}
 # Fields whose raw values are stored as offsets from YEAR_BASE (small ints) in some
 # rosters, but may appear as absolute years in others. We guard in the converters.
 _YEAR_FIELD_ALLOWLIST = {"DRAFTEDYEAR", "HISTORICYEAR", "BIRTHYEAR"}
+_F32 = struct.Struct("<f")
 
 
 def _normalize_year_key(value: str) -> str:
@@ -85,10 +87,20 @@ HEIGHT_MIN_INCHES = 48   # 4'0"
 HEIGHT_MAX_INCHES = 120  # 10'0"
 
 
+# Bitfields up to this width get a precomputed raw -> rating table.
+RATING_TABLE_MAX_BITS = 12
+
+
 def convert_raw_to_rating(raw: int, length: int) -> int:
     """
     Convert a raw bitfield value into the 25-99 display rating scale using proportional mapping.
     """
+    if type(raw) is int and type(length) is int and 0 < length <= RATING_TABLE_MAX_BITS and 0 <= raw < (1 << length):
+        return _rating_table(length)[raw]
+    return _compute_raw_to_rating(raw, length)
+
+
+def _compute_raw_to_rating(raw: int, length: int) -> int:
     try:
         max_raw = (1 << length) - 1
         if max_raw <= 0:
@@ -103,6 +115,19 @@ def convert_raw_to_rating(raw: int, length: int) -> int:
         return RATING_MIN
 
 
+@lru_cache(maxsize=None)
+def _rating_table(length: int) -> tuple[int, ...]:
+    """Every display rating for a ``length``-bit field, indexed by raw value."""
+    return tuple(_compute_raw_to_rating(raw, length) for raw in range(1 << length))
+
+
+def raw_to_rating_table(length: int) -> tuple[int, ...] | None:
+    """Return the display rating for every raw value of a ``length``-bit field, or None if too wide."""
+    if type(length) is not int or not 0 < length <= RATING_TABLE_MAX_BITS:
+        return None
+    return _rating_table(length)
+
+
 def convert_rating_to_raw(rating: float, length: int) -> int:
     """
     Convert a 25-99 rating back into a raw bitfield value using proportional mapping.
@@ -154,7 +179,7 @@ def read_weight(mem, addr: int) -> float:
     try:
         b = mem.read_bytes(addr, 4)
         if len(b) == 4:
-            return struct.unpack("<f", b)[0]
+            return _F32.unpack(b)[0]
     except Exception:
         pass
     return 0.0
@@ -163,7 +188,7 @@ def read_weight(mem, addr: int) -> float:
 def write_weight(mem, addr: int, val: float) -> bool:
     """Write a weight value (float32 pounds) to memory."""
     try:
-        raw = struct.pack("<f", float(val))
+        raw = _F32.pack(float(val))
         mem.write_bytes(addr, raw)
         return True
     except Exception:
@@ -242,6 +267,14 @@ def to_int(value: Any) -> int:
         return 0
 
 
+def utf16_terminated(raw: bytes) -> bytes:
+    """Cut UTF-16LE bytes at the first NUL code unit (a zero byte pair on an even offset)."""
+    pos = raw.find(b"\x00\x00")
+    while pos != -1 and pos & 1:
+        pos = raw.find(b"\x00\x00", pos + 1)
+    return raw if pos == -1 else raw[:pos]
+
+
 NON_NUMERIC_RE = re.compile(r"[^0-9.-]")
 
 
@@ -258,7 +291,9 @@ __all__ = [
     "HEIGHT_UNIT_SCALE",
     "HEIGHT_MIN_INCHES",
     "HEIGHT_MAX_INCHES",
+    "RATING_TABLE_MAX_BITS",
     "convert_raw_to_rating",
+    "raw_to_rating_table",
     "convert_rating_to_raw",
     "convert_minmax_potential_to_raw",
     "convert_raw_to_minmax_potential",
@@ -270,5 +305,6 @@ __all__ = [
     "convert_tendency_raw_to_rating",
     "convert_rating_to_tendency_raw",
     "to_int",
+    "utf16_terminated",
     "NON_NUMERIC_RE",
 ]
\ No newline at end of file
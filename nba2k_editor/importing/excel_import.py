@@ -16,11 +16,13 @@ from ..core.conversions import (
     convert_raw_to_rating,
     convert_tendency_raw_to_rating,
     raw_height_to_inches,
+    utf16_terminated,
 )
 from ..core import offsets as offsets_mod
 from ..core.offsets import NAME_MAX_CHARS, PLAYER_STRIDE
 from ..core.perf import timed
 from ..models.data_model import PlayerDataModel
+from ..models.schema import TYPE_COLOR, TYPE_FLOAT, TYPE_POINTER, TYPE_STRING, field_type_flags
 from ..models.player import Player
 
 try:  # Lazy dependency
@@ -65,6 +67,8 @@ _ENTITY_CONFIG: dict[str, dict[str, Any]] = {
 }
 
 _FALLBACK = object()
+_F32 = struct.Struct("<f")
+_F64 = struct.Struct("<d")
 
 
 @dataclass(frozen=True)
@@ -126,17 +130,9 @@ def _decode_string_from_record(record: memoryview, offset: int, max_chars: int,
     if end > len(record):
         return _FALLBACK
     raw = record[offset:end].tobytes()
-    try:
-        if encoding == "ascii":
-            text = raw.decode("ascii", errors="ignore")
-        else:
-            text = raw.decode("utf-16le", errors="ignore")
-    except Exception:
-        return _FALLBACK
-    zero = text.find("\x00")
-    if zero != -1:
-        text = text[:zero]
-    return text
+    if encoding == "ascii":
+        return raw.split(b"\x00", 1)[0].decode("ascii", errors="ignore")
+    return utf16_terminated(raw).decode("utf-16le", errors="ignore")
 
 
 def _decode_float_from_record(record: memoryview, offset: int, byte_len: int) -> object:
@@ -144,9 +140,8 @@ def _decode_float_from_record(record: memoryview, offset: int, byte_len: int) ->
     end = offset + need
     if offset < 0 or end > len(record):
         return _FALLBACK
-    raw = record[offset:end].tobytes()
     try:
-        return struct.unpack("<d" if byte_len >= 8 else "<f", raw)[0]
+        return (_F64 if need == 8 else _F32).unpack_from(record, offset)[0]
     except Exception:
         return _FALLBACK
 
@@ -189,12 +184,13 @@ def _decode_field_value_from_record(
     if requires_deref or deref_offset:
         return _FALLBACK
     field_type_norm = model._normalize_field_type(field_type)
+    type_flags = field_type_flags(field_type)
     length_raw = length_bits
     if length_bits <= 0 and byte_length > 0:
         length_bits = byte_length * 8
     name_lower = str(field_name or "").strip().lower()
     category_lower = str(category or "").strip().lower()
-    if model._is_string_type(field_type_norm):
+    if type_flags & TYPE_STRING:
         max_chars = length_raw if length_raw > 0 else byte_length
         if max_chars <= 0:
             if "name" in name_lower and NAME_MAX_CHARS > 0:
@@ -210,7 +206,7 @@ def _decode_field_value_from_record(
         if not isinstance(val, (int, float)):
             return _FALLBACK
         return int(round(val))
-    if model._is_float_type(field_type_norm):
+    if type_flags & TYPE_FLOAT:
         byte_len = model._effective_byte_length(byte_length, length_bits, default=4)
         return _decode_float_from_record(record, offset, byte_len)
     raw_val = _decode_bits_from_record(record, offset, start_bit, length_bits)
@@ -222,7 +218,7 @@ def _decode_field_value_from_record(
     if values:
         idx = model._clamp_enum_index(raw_int, values, length_bits)
         return idx
-    if model._is_pointer_type(field_type_norm) or model._is_color_type(field_type_norm):
+    if type_flags & (TYPE_POINTER | TYPE_COLOR):
         if model._is_team_pointer_field(entity_type, category, field_name, field_type_norm):
             team_name = model._team_pointer_to_display_name(raw_int)
             if team_name:
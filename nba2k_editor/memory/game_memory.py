@@ -9,12 +9,17 @@ from __future__ import annotations
 import ctypes
 import struct
 import sys
+import threading
+from contextlib import contextmanager
 from ctypes import wintypes
+from typing import Iterator, Sequence
 
 from ..core.config import ALLOWED_MODULE_NAMES, MODULE_NAME
+from ..core.conversions import utf16_terminated
 from ..logs.logging import MEMORY_LOGGER, LOG_ERROR, LOG_INFO
 from .win32 import (
     PROCESS_ALL_ACCESS,
+    STILL_ACTIVE,
     TH32CS_SNAPMODULE,
     TH32CS_SNAPMODULE32,
     TH32CS_SNAPPROCESS,
@@ -27,10 +32,39 @@ from .win32 import (
     Process32NextW,
     OpenProcess,
     CloseHandle,
+    GetExitCodeProcess,
     ReadProcessMemory,
     WriteProcessMemory,
 )
 
+_PAGE_SIZE = 0x1000
+_PAGE_MASK = ~(_PAGE_SIZE - 1)
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_ERROR_INVALID_HANDLE = 6
+
+
+def _encode_string_into(buf: bytearray, text: str, max_chars: int, encoding: str) -> int:
+    """
+    Encode ``text`` into ``buf`` as a fixed-size, NUL-terminated field of ``max_chars`` characters.
+
+    The text is cut to ``max_chars - 1`` characters (and to the field size in bytes, for
+    UTF-16 surrogate pairs) and the rest of the field is zero-filled. Returns the field size.
+    """
+    if encoding == "ascii":
+        unit = 1
+        encoded = text[: max_chars - 1].encode("ascii", errors="ignore")
+    else:
+        unit = 2
+        encoded = text[: max_chars - 1].encode("utf-16le")
+    size = max_chars * unit
+    used = min(len(encoded), size - unit)
+    view = memoryview(buf)
+    view[:used] = memoryview(encoded)[:used]
+    view[used:size] = bytes(size - used)
+    return size
+
 
 class GameMemory:
     """Utility class encapsulating process lookup and memory access."""
@@ -45,6 +79,18 @@ class GameMemory:
         self.pointer_size = ctypes.sizeof(ctypes.c_void_p)
         self.last_dynamic_base_report: dict[str, object] | None = None
         self.last_dynamic_base_overrides: dict[str, int] | None = None
+        # Page snapshots used by read_uint64_many; only valid for the handle they were read from.
+        self._page_cache: dict[int, bytes] = {}
+        self._page_cache_handle: wintypes.HANDLE | None = None
+        # Reused encode buffer for fixed-size string writes.
+        self._str_scratch: bytearray | None = None
+        # Per-thread 8-byte scratch used by read_small.
+        self._scratch_local = threading.local()
+        # Depth of nested session() blocks; while positive an open handle is trusted as-is.
+        self._session_depth = 0
+        # Set once open_process has validated the handle; cleared by close() and by a failed read
+        # or write whose handle or process is gone, so the next open_process re-checks the process.
+        self._handle_ok = False
 
     def _detect_pointer_size(self, handle: wintypes.HANDLE | None) -> int:
         default = ctypes.sizeof(ctypes.c_void_p)
@@ -167,7 +213,14 @@ class GameMemory:
         return None
 
     def open_process(self) -> bool:
-        """Open the game process and resolve its base address."""
+        """
+        Open the game process and resolve its base address.
+
+        A validated handle is trusted on later calls until close() or a read or write that finds
+        the handle or process gone, so hot paths that start with open_process() skip the lookup.
+        """
+        if self.hproc and (self._handle_ok or self._session_depth):
+            return True
         if sys.platform != "win32":
             self.close()
             return False
@@ -176,6 +229,7 @@ class GameMemory:
             self.close()
             return False
         if self.pid == pid and self.hproc:
+            self._handle_ok = True
             return True
         self.close()
         handle = OpenProcess(PROCESS_ALL_ACCESS, False, pid)
@@ -191,8 +245,25 @@ class GameMemory:
         self.hproc = handle
         self.base_addr = base
         self.pointer_size = self._detect_pointer_size(handle)
+        self._handle_ok = True
         return True
 
+    @contextmanager
+    def session(self) -> Iterator[bool]:
+        """
+        Validate the process handle once and trust it until the block exits.
+
+        Inside the block open_process returns immediately while a handle is open instead of
+        re-enumerating processes on every call; nested sessions reuse the outer validation.
+        Yields whether the process is open.
+        """
+        ok = bool(self.hproc) if self._session_depth else self.open_process()
+        self._session_depth += 1
+        try:
+            yield ok
+        finally:
+            self._session_depth -= 1
+
     def close(self) -> None:
         """Close any open process handle and reset state."""
         if self.hproc:
@@ -203,7 +274,9 @@ class GameMemory:
         self.pid = None
         self.hproc = None
         self.base_addr = None
+        self._handle_ok = False
         self.pointer_size = ctypes.sizeof(ctypes.c_void_p)
+        self.clear_page_cache()
 
     def _get_module_base(self, pid: int, module_name: str) -> int | None:
         """Return the base address of module_name in the given process."""
@@ -230,6 +303,26 @@ class GameMemory:
     # ------------------------------------------------------------------
     # Memory access helpers
     # ------------------------------------------------------------------
+    def _note_access_failure(self, winerr: int | None) -> None:
+        """
+        Drop handle trust after a failed read or write when the handle or process is gone.
+
+        Partial copies and unreadable addresses (e.g. a probe past the end of a region) leave
+        the handle trusted; only an invalid handle or an exited process forces a re-check.
+        """
+        if winerr == _ERROR_INVALID_HANDLE:
+            self._handle_ok = False
+            return
+        if GetExitCodeProcess is None or not self.hproc:
+            return
+        exit_code = wintypes.DWORD()
+        try:
+            alive = GetExitCodeProcess(self.hproc, ctypes.byref(exit_code)) and exit_code.value == STILL_ACTIVE
+        except Exception:
+            alive = False
+        if not alive:
+            self._handle_ok = False
+
     def _check_open(self, op: str | None = None, addr: int | None = None, length: int | None = None) -> None:
         if self.hproc is None or self.base_addr is None:
             if op is not None and addr is not None and length is not None:
@@ -238,12 +331,27 @@ class GameMemory:
 
     def read_bytes(self, addr: int, length: int) -> bytes:
         """Read length bytes from absolute address addr."""
-        self._check_open("read", addr, length)
         buf = (ctypes.c_ubyte * length)()
+        self.read_into(addr, buf)
+        return bytes(buf)
+
+    def read_into(self, addr: int, buf: bytearray | memoryview | ctypes.Array, length: int | None = None) -> int:
+        """
+        Read into an existing writable buffer instead of allocating a new bytes object.
+
+        Reads ``length`` bytes (default: the whole buffer) and returns the number read; raises
+        like read_bytes on failure or partial reads.
+        """
+        if length is None:
+            length = len(buf)
+        self._check_open("read", addr, length)
+        if not isinstance(buf, ctypes.Array):
+            buf = (ctypes.c_ubyte * length).from_buffer(buf)
         read_count = ctypes.c_size_t()
         try:
             ok = ReadProcessMemory(self.hproc, ctypes.c_void_p(addr), buf, length, ctypes.byref(read_count))
         except Exception as exc:
+            self._note_access_failure(getattr(exc, "winerror", None))
             self._log_event(
                 LOG_ERROR,
                 "read",
@@ -256,6 +364,7 @@ class GameMemory:
             raise
         if not ok:
             winerr = ctypes.get_last_error()
+            self._note_access_failure(winerr)
             self._log_event(
                 LOG_ERROR,
                 "read",
@@ -276,17 +385,52 @@ class GameMemory:
             )
             raise RuntimeError(f"Partial read at 0x{addr:X}: {read_count.value}/{length} bytes")
         self._log_event(LOG_INFO, "read", addr, length, "success", validation="exact")
-        return bytes(buf)
+        return length
+
+    def read_small(self, addr: int, length: int) -> memoryview:
+        """
+        Read up to 8 bytes into a per-thread scratch buffer and return a view of them.
+
+        The view is overwritten by the next read_small on the same thread, so callers must
+        consume it immediately. Longer reads fall back to read_bytes.
+        """
+        if length > 8:
+            return memoryview(self.read_bytes(addr, length))
+        view, target = self._small_scratch()[:2]
+        self.read_into(addr, target, length)
+        return view[:length]
 
-    def write_bytes(self, addr: int, data: bytes) -> None:
-        """Write data to absolute address addr."""
+    def _small_scratch(self) -> tuple:
+        """Return this thread's 8-byte scratch as (view, byte array, c_uint32, c_uint64) aliases."""
+        local = self._scratch_local
+        scratch = getattr(local, "scratch", None)
+        if scratch is None:
+            buf = bytearray(8)
+            scratch = local.scratch = (
+                memoryview(buf),
+                (ctypes.c_ubyte * 8).from_buffer(buf),
+                ctypes.c_uint32.from_buffer(buf),
+                ctypes.c_uint64.from_buffer(buf),
+            )
+        return scratch
+
+    def write_bytes(self, addr: int, data: bytes | bytearray | memoryview) -> None:
+        """Write data to absolute address addr; writable buffers are passed through without a copy."""
         length = len(data)
         self._check_open("write", addr, length)
-        buf = (ctypes.c_ubyte * length).from_buffer_copy(data)
+        buf = None
+        if isinstance(data, (bytearray, memoryview)):
+            try:
+                buf = (ctypes.c_ubyte * length).from_buffer(data)
+            except (TypeError, ValueError):
+                buf = None
+        if buf is None:
+            buf = (ctypes.c_ubyte * length).from_buffer_copy(data)
         written = ctypes.c_size_t()
         try:
             ok = WriteProcessMemory(self.hproc, ctypes.c_void_p(addr), buf, length, ctypes.byref(written))
         except Exception as exc:
+            self._note_access_failure(getattr(exc, "winerror", None))
             self._log_event(
                 LOG_ERROR,
                 "write",
@@ -299,6 +443,7 @@ class GameMemory:
             raise
         if not ok:
             winerr = ctypes.get_last_error()
+            self._note_access_failure(winerr)
             self._log_event(
                 LOG_ERROR,
                 "write",
@@ -324,61 +469,156 @@ class GameMemory:
         """Write a pointer-sized value to absolute address addr."""
         size = self.pointer_size or ctypes.sizeof(ctypes.c_void_p)
         if size <= 4:
-            data = struct.pack("<I", int(value) & 0xFFFFFFFF)
+            data = _U32.pack(int(value) & 0xFFFFFFFF)
         else:
-            data = struct.pack("<Q", int(value) & 0xFFFFFFFFFFFFFFFF)
+            data = _U64.pack(int(value) & 0xFFFFFFFFFFFFFFFF)
         self.write_bytes(addr, data)
 
+    def read_uint8(self, addr: int) -> int:
+        return self.read_small(addr, 1)[0]
+
+    def read_uint16(self, addr: int) -> int:
+        return _U16.unpack(self.read_small(addr, 2))[0]
+
     def read_uint32(self, addr: int) -> int:
-        data = self.read_bytes(addr, 4)
-        return struct.unpack("<I", data)[0]
+        _view, target, u32, _u64 = self._small_scratch()
+        self.read_into(addr, target, 4)
+        return u32.value
 
     def write_uint32(self, addr: int, value: int) -> None:
-        data = struct.pack("<I", value & 0xFFFFFFFF)
-        self.write_bytes(addr, data)
+        self.write_bytes(addr, _U32.pack(value & 0xFFFFFFFF))
 
     def read_uint64(self, addr: int) -> int:
-        data = self.read_bytes(addr, 8)
-        return struct.unpack("<Q", data)[0]
+        # Pointer derefs are the hottest read: fill the scratch in place and take the value
+        # straight from its c_uint64 alias (the target is little-endian, like the host).
+        _view, target, _u32, u64 = self._small_scratch()
+        self.read_into(addr, target, 8)
+        return u64.value
+
+    def read_uint64_offsets(self, base: int, offsets: Sequence[int]) -> dict[int, int]:
+        """
+        Read the 64-bit values at ``base + offset`` for each offset, keyed by offset.
+
+        Offsets within one page of each other share a single ReadProcessMemory; nothing is
+        cached, so the values are always current. Raises like read_bytes on failure.
+        """
+        values: dict[int, int] = {}
+        ordered = sorted(set(int(off) for off in offsets))
+        idx = 0
+        while idx < len(ordered):
+            lo = ordered[idx]
+            end = idx + 1
+            while end < len(ordered) and ordered[end] + 8 - lo <= _PAGE_SIZE:
+                end += 1
+            chunk = ordered[idx:end]
+            data = self.read_bytes(base + lo, chunk[-1] + 8 - lo)
+            for off in chunk:
+                values[off] = _U64.unpack_from(data, off - lo)[0]
+            idx = end
+        return values
+
+    def clear_page_cache(self) -> None:
+        """Drop page snapshots captured by read_uint64_many."""
+        self._page_cache.clear()
+        self._page_cache_handle = None
+
+    def _load_pages(self, pages: Sequence[int]) -> None:
+        """Read missing pages into the page cache, one ReadProcessMemory per contiguous run."""
+        cache = self._page_cache
+        missing = sorted(page for page in set(pages) if page not in cache)
+        idx = 0
+        while idx < len(missing):
+            run_start = missing[idx]
+            run_len = 1
+            while idx + run_len < len(missing) and missing[idx + run_len] == run_start + run_len * _PAGE_SIZE:
+                run_len += 1
+            idx += run_len
+            try:
+                data = self.read_bytes(run_start, run_len * _PAGE_SIZE)
+            except Exception:
+                # A run can straddle an unmapped page; retry page by page so readable ones still land.
+                if run_len == 1:
+                    continue
+                for page_idx in range(run_len):
+                    page = run_start + page_idx * _PAGE_SIZE
+                    try:
+                        cache[page] = self.read_bytes(page, _PAGE_SIZE)
+                    except Exception:
+                        continue
+                continue
+            for page_idx in range(run_len):
+                start = page_idx * _PAGE_SIZE
+                cache[run_start + page_idx * _PAGE_SIZE] = data[start : start + _PAGE_SIZE]
+
+    def read_uint64_many(self, addresses: Sequence[int]) -> list[int | None]:
+        """
+        Read several 64-bit values, issuing one ReadProcessMemory per contiguous page window.
+
+        Pages are cached until the process handle changes or clear_page_cache() is called,
+        so callers walking pointer chains should clear the cache at the start of each pass.
+        Entries are None when their page could not be read.
+        """
+        self._check_open("read", addresses[0] if addresses else 0, 8)
+        if self._page_cache_handle != self.hproc:
+            self._page_cache.clear()
+            self._page_cache_handle = self.hproc
+        pages: list[int] = []
+        for addr in addresses:
+            page = int(addr) & _PAGE_MASK
+            pages.append(page)
+            if int(addr) + 8 > page + _PAGE_SIZE:
+                pages.append(page + _PAGE_SIZE)
+        self._load_pages(pages)
+        cache = self._page_cache
+        values: list[int | None] = []
+        for addr in addresses:
+            addr = int(addr)
+            page = addr & _PAGE_MASK
+            rel = addr - page
+            data = cache.get(page)
+            if data is None:
+                values.append(None)
+                continue
+            if rel + 8 > _PAGE_SIZE:
+                tail = cache.get(page + _PAGE_SIZE)
+                if tail is None:
+                    values.append(None)
+                    continue
+                data = data[rel:] + tail[: rel + 8 - _PAGE_SIZE]
+                rel = 0
+            values.append(_U64.unpack_from(data, rel)[0])
+        return values
 
     def read_wstring(self, addr: int, max_chars: int) -> str:
         """Read a UTF-16LE string of at most max_chars characters from addr."""
         raw = self.read_bytes(addr, max_chars * 2)
-        try:
-            s = raw.decode("utf-16le", errors="ignore")
-        except Exception:
-            return ""
-        end = s.find("\x00")
-        if end != -1:
-            s = s[:end]
-        return s
+        # Only the text before the terminator is decoded; the tail is usually stale bytes.
+        return utf16_terminated(raw).decode("utf-16le", errors="ignore")
 
     def write_wstring_fixed(self, addr: int, value: str, max_chars: int) -> None:
         """Write a fixed length null-terminated UTF-16LE string at addr."""
-        value = value[: max_chars - 1]
-        encoded = value.encode("utf-16le") + b"\x00\x00"
-        padded = encoded.ljust(max_chars * 2, b"\x00")
-        self.write_bytes(addr, padded)
+        self._write_fixed_string(addr, value, max_chars, "utf16")
+
+    def _write_fixed_string(self, addr: int, value: str, max_chars: int, encoding: str) -> None:
+        if max_chars <= 0:
+            raise ValueError("String length must be positive")
+        size = max_chars * (1 if encoding == "ascii" else 2)
+        scratch = self._str_scratch
+        if scratch is None or len(scratch) < size:
+            # Replace rather than resize: a ctypes view from an earlier write may still pin the old buffer.
+            scratch = self._str_scratch = bytearray(max(size, 256))
+        written = _encode_string_into(scratch, value, max_chars, encoding)
+        self.write_bytes(addr, memoryview(scratch)[:written])
 
     # ASCII string helpers
     def read_ascii(self, addr: int, max_chars: int) -> str:
         """Read an ASCII string of up to max_chars bytes from addr."""
         raw = self.read_bytes(addr, max_chars)
-        try:
-            s = raw.decode("ascii", errors="ignore")
-        except Exception:
-            return ""
-        end = s.find("\x00")
-        if end != -1:
-            s = s[:end]
-        return s
+        return raw.split(b"\x00", 1)[0].decode("ascii", errors="ignore")
 
     def write_ascii_fixed(self, addr: int, value: str, max_chars: int) -> None:
         """Write a fixed length null-terminated ASCII string at addr."""
-        value = value[: max_chars - 1]
-        encoded = value.encode("ascii", errors="ignore") + b"\x00"
-        padded = encoded.ljust(max_chars, b"\x00")
-        self.write_bytes(addr, padded)
+        self._write_fixed_string(addr, value, max_chars, "ascii")
 
 
 __all__ = ["GameMemory"]
\ No newline at end of file
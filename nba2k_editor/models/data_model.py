@@ -6,13 +6,22 @@ This module lifts the non-UI portions of PlayerDataModel from the monolithic
 """
 from __future__ import annotations
 
+import itertools
+import logging
+import math
+import mmap
+import operator
 import re
 import struct
 import threading
 import unicodedata
-from collections import Counter
+from array import array
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Sequence
+from typing import Callable, Dict, Iterable, Iterator, Sequence
 
 from ..core.conversions import (
     BADGE_LEVEL_NAMES,
@@ -23,6 +32,7 @@ from ..core.conversions import (
     convert_year_to_raw,
     convert_rating_to_raw,
     convert_raw_to_rating,
+    raw_to_rating_table,
     convert_minmax_potential_to_raw,
     convert_raw_to_minmax_potential,
     convert_rating_to_tendency_raw,
@@ -32,6 +42,7 @@ from ..core.conversions import (
     read_weight,
     write_weight,
     to_int,
+    utf16_terminated,
 )
 from ..core import offsets as offsets_mod
 from ..core.config import TEAM_DATA_CANDIDATES
@@ -79,14 +90,443 @@ from ..core.offsets import (
     STADIUM_NAME_LENGTH,
     STADIUM_NAME_ENCODING,
     initialize_offsets,
+    _find_offset_entry,
     _load_categories,
 )
 from ..memory.game_memory import GameMemory
 from .player import Player
-from .schema import FieldMetadata, FieldWriteSpec
+from .schema import (
+    TYPE_COLOR,
+    TYPE_FLOAT,
+    TYPE_POINTER,
+    TYPE_STRING,
+    FieldMetadata,
+    FieldWriteSpec,
+    effective_byte_length as _effective_byte_length,
+    field_bit_layout,
+    field_type_flags,
+)
+
+_LOGGER = logging.getLogger(__name__)
 
 FREE_AGENT_TEAM_ID = -1
 MAX_TEAMS_SCAN = MAX_TEAMS_SCAN  # re-export for clarity
+_SCAN_WINDOW_BYTES = 1 << 20
+# Batch reads kept in flight ahead of the decoder during a table scan.
+_SCAN_READ_LOOKAHEAD = 2
+# Marker for "no scoped base snapshot active" (None is a valid held result).
+_NOT_HELD = object()
+_NO_TEAM_ID = -(1 << 63)
+# States held per player index in the PlayerDataModel._player_flag_cache columns.
+_FLAG_UNKNOWN = 0
+_FLAG_FALSE = 1
+_FLAG_TRUE = 2
+_TEAM_POINTER_CACHE_SIZE = 4096
+# Step kinds produced by PlayerDataModel._compile_field_plan.
+_PLAN_BUFFER = 0
+_PLAN_RAW = 1
+_PLAN_TABLE = 2
+_PLAN_DISPLAY = 3
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_F32 = struct.Struct("<f")
+_UINT_STRUCTS = {
+    8: struct.Struct("<B"),
+    16: struct.Struct("<H"),
+    32: _U32,
+    64: _U64,
+}
+_F64 = struct.Struct("<d")
+# GameMemory integer reader covering a field of N bytes (index N), used by _read_bitfield.
+_UINT_READER_BY_SIZE = (
+    "read_uint8",
+    "read_uint8",
+    "read_uint16",
+    "read_uint32",
+    "read_uint32",
+    "read_uint64",
+    "read_uint64",
+    "read_uint64",
+    "read_uint64",
+)
+_TEAM_SLOT_POINTERS = struct.Struct(f"<{TEAM_PLAYER_SLOT_COUNT}Q")
+_HAS_CTRL = re.compile(r"[\x00-\x1f]").search
+_HEX_LETTERS = frozenset("abcdefABCDEF")
+_HEX_RE = re.compile(r"0x[0-9a-fA-F]+")
+_TEAM_NUM_RE = re.compile(r"team\s+(\d+)$")
+_CE_COMMENTS_BLOCK = re.compile(rb"<Comments>(.*?)</Comments>", re.S)
+# "<index> - <name>" lines inside a Cheat Engine table's <Comments> block.
+_CE_COMMENT_RE = re.compile(r"^[ \t]*([0-9A-Fa-f]+)[ \t]*-[ \t]*(.+?)\s*$", re.M)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_key(value: object) -> str:
+    """Stripped, lower-cased form of an entity/category/field label; labels repeat across decodes."""
+    return str(value or "").strip().lower()
+
+
+# Field type strings come from a small schema vocabulary, so the classifiers are memoized.
+@lru_cache(maxsize=256)
+def _normalize_field_type(field_type: str | None) -> str:
+    return str(field_type or "").strip().lower()
+
+
+def _is_string_type(field_type: str | None) -> bool:
+    return bool(field_type_flags(field_type) & TYPE_STRING)
+
+
+@lru_cache(maxsize=256)
+def _string_encoding_for_type(field_type: str | None) -> str:
+    ftype = _normalize_field_type(field_type)
+    if any(tag in ftype for tag in ("wstring", "wstr", "utf16", "wide")):
+        return "utf16"
+    if any(tag in ftype for tag in ("ascii", "string", "text", "char")):
+        return "ascii"
+    return "utf16"
+
+
+def _is_float_type(field_type: str | None) -> bool:
+    return bool(field_type_flags(field_type) & TYPE_FLOAT)
+
+
+@lru_cache(maxsize=256)
+def _float_codec(field_type: str | None, byte_length: int, length_bits: int) -> struct.Struct | None:
+    """Return the IEEE-754 codec the typed accessors use for a float field, or None for other types."""
+    if "float" not in (field_type or "").lower():
+        return None
+    return _F64 if _effective_byte_length(byte_length, length_bits, default=4) >= 8 else _F32
+
+
+def _is_pointer_type(field_type: str | None) -> bool:
+    return bool(field_type_flags(field_type) & TYPE_POINTER)
+
+
+def _is_color_type(field_type: str | None) -> bool:
+    return bool(field_type_flags(field_type) & TYPE_COLOR)
+
+
+@lru_cache(maxsize=128)
+def _hex_params(length_bits: int, byte_length: int) -> tuple[str, int]:
+    """Return the ``0x``-prefixed, zero-padded format template and value mask for a hex field."""
+    if length_bits > 0:
+        width = max(1, (length_bits + 3) // 4)
+        mask = (1 << length_bits) - 1
+    else:
+        byte_len = _effective_byte_length(byte_length, length_bits, default=4)
+        width = max(1, byte_len * 2)
+        mask = (1 << (byte_len * 8)) - 1
+    return "0x{:0%dX}" % width, mask
+
+
+@lru_cache(maxsize=4096)
+def _format_hex(value: int, length_bits: int, byte_length: int) -> str:
+    template, mask = _hex_params(length_bits, byte_length)
+    return template.format(value & mask)
+
+
+@lru_cache(maxsize=64)
+def _splice_mask(field_specs: tuple[tuple[int, int, int, bool, int, str, int], ...]) -> tuple[int, int, int]:
+    """
+    Return ``(lo, hi, mask)`` covering the inline copy specs used by ``copy_player_data``.
+
+    ``mask`` has a bit set for every record bit in ``[lo, hi)`` owned by one of the fields
+    (bit 0 is the low bit of byte ``lo``). Float fields own their whole IEEE-754 value and
+    ignore the start bit, mirroring the typed float read/write path.
+    """
+    ranges: list[tuple[int, int, int]] = []
+    for offset, start_bit, length, _deref, _deref_offset, field_type, byte_length in field_specs:
+        if "float" in field_type:
+            width = 8 if _effective_byte_length(byte_length, length, default=4) >= 8 else 4
+            ranges.append((offset, width * 8, 0))
+        else:
+            ranges.append((offset, length, start_bit))
+    lo = min(offset for offset, _, _ in ranges)
+    hi = max(offset + (start_bit + bits + 7) // 8 for offset, bits, start_bit in ranges)
+    mask = 0
+    for offset, bits, start_bit in ranges:
+        mask |= ((1 << bits) - 1) << ((offset - lo) * 8 + start_bit)
+    return lo, hi, mask
+
+
+def _coalesce_assignments(assignments: Sequence[FieldWriteSpec]) -> list[list[FieldWriteSpec]]:
+    """
+    Group write specs that target the same struct and whose byte spans touch or overlap.
+
+    Each group keeps the original assignment order so overlapping writes resolve as they
+    would sequentially. Specs with a non-positive length or negative offset stay on their own.
+    """
+    spans: list[tuple[tuple[bool, int], int, int, int]] = []
+    groups: list[list[int]] = []
+    for idx, (offset, start_bit, length, _value, requires_deref, deref_offset) in enumerate(assignments):
+        if length <= 0 or offset < 0 or start_bit < 0:
+            groups.append([idx])
+            continue
+        target = (True, deref_offset) if requires_deref and deref_offset else (False, 0)
+        spans.append((target, offset, offset + (start_bit + length + 7) // 8, idx))
+    spans.sort()
+    current: list[int] = []
+    current_target: tuple[bool, int] | None = None
+    current_hi = 0
+    for target, lo, hi, idx in spans:
+        if current and target == current_target and lo <= current_hi:
+            current.append(idx)
+            if hi > current_hi:
+                current_hi = hi
+            continue
+        if current:
+            groups.append(current)
+        current = [idx]
+        current_target = target
+        current_hi = hi
+    if current:
+        groups.append(current)
+    return [[assignments[idx] for idx in sorted(group)] for group in groups]
+
+
+def _post_height(raw: int, _bits: int) -> int:
+    inches = raw_height_to_inches(raw)
+    if inches < HEIGHT_MIN_INCHES:
+        return HEIGHT_MIN_INCHES
+    if inches > HEIGHT_MAX_INCHES:
+        return HEIGHT_MAX_INCHES
+    return inches
+
+
+def _post_year(raw: int, _bits: int) -> int:
+    return convert_raw_to_year(raw)
+
+
+def _post_badge(raw: int, _bits: int) -> int:
+    max_lvl = max(0, len(BADGE_LEVEL_NAMES) - 1)
+    if raw < 0:
+        return 0
+    if raw > max_lvl:
+        return max_lvl
+    return raw
+
+
+def _post_identity(raw: int, _bits: int) -> int:
+    return raw
+
+
+@lru_cache(maxsize=4096)
+def _int_postprocessor(is_player: bool, category_lower: str, name_lower: str, field_name: str) -> Callable[[int, int], object]:
+    """
+    Pick the display conversion for a plain integer field from its entity, category and name.
+
+    Called with ``(raw, length_bits)``; enum and pointer fields are handled before this.
+    """
+    if is_player and name_lower == "height":
+        return _post_height
+    if category_lower in ("attributes", "durability"):
+        return convert_raw_to_rating
+    if category_lower == "potential":
+        if "min" in name_lower or "max" in name_lower:
+            return convert_raw_to_minmax_potential
+        return convert_raw_to_rating
+    if category_lower == "tendencies":
+        return convert_tendency_raw_to_rating
+    if is_year_offset_field(field_name):
+        return _post_year
+    if category_lower == "badges":
+        return _post_badge
+    return _post_identity
+
+
+def _setter_int(value: object) -> int | None:
+    """
+    Integer for a typed setter, or None when ``value`` is blank or does not parse.
+
+    Numbers are truncated; strings are decimal, or hexadecimal with a ``0x`` prefix.
+    """
+    if isinstance(value, (int, float)):
+        try:
+            return int(value)
+        except (OverflowError, ValueError):
+            return None
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return None
+        try:
+            return int(text, 16) if text[:2] in ("0x", "0X") else int(text)
+        except ValueError:
+            return None
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _bit_window(start_bit: int, length: int) -> tuple[int, int, int]:
+    """
+    Return ``(bytes_needed, mask, clear_mask)`` for a bitfield at ``start_bit`` of ``length`` bits.
+
+    ``mask`` selects the field's bits in place and ``clear_mask`` is its complement within the
+    covering bytes, so a read-modify-write is ``(current & clear_mask) | ((value << start_bit) & mask)``.
+    """
+    bytes_needed = (start_bit + length + 7) // 8
+    mask = ((1 << length) - 1) << start_bit
+    return bytes_needed, mask, ((1 << (bytes_needed * 8)) - 1) ^ mask
+
+
+def _meta_bit_layout(
+    meta: FieldMetadata | dict[str, object],
+    start_bit: int,
+    length: int,
+    byte_length: int,
+    type_flags: int,
+) -> tuple[int, int, int]:
+    """``(bytes_needed, mask, read_len)`` for a field: precomputed on FieldMetadata, memoized for dicts."""
+    if isinstance(meta, FieldMetadata):
+        return meta.bytes_needed, meta.mask, meta.read_len
+    return field_bit_layout(start_bit, length, byte_length, type_flags)[1:]
+
+
+def _meta_type_flags(meta: FieldMetadata | dict[str, object], field_type: str) -> int:
+    """TYPE_* bits for a field: precomputed on FieldMetadata, classified (and memoized) for dicts."""
+    if isinstance(meta, FieldMetadata):
+        return meta.type_flags
+    return field_type_flags(field_type)
+
+
+class _LRUCache(OrderedDict):
+    """Dict that evicts its least recently used key once it holds more than ``maxsize`` keys."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+def _is_ascii_printable(value: str) -> bool:
+    """True when every character is printable ASCII (0x20-0x7E); both checks run in C."""
+    return value.isascii() and value.isprintable()
+
+
+def _decode_fixed_string(buffer: memoryview, offset: int, max_chars: int, enc: str) -> str:
+    """Decode a fixed-width, NUL-terminated string from a record buffer ("" when out of range)."""
+    if offset < 0 or max_chars <= 0:
+        return ""
+    if enc == "ascii":
+        end = offset + max_chars
+        if end > len(buffer):
+            return ""
+        return buffer[offset:end].tobytes().split(b"\x00", 1)[0].decode("ascii", errors="ignore")
+    end = offset + max_chars * 2
+    if end > len(buffer):
+        return ""
+    return utf16_terminated(buffer[offset:end].tobytes()).decode("utf-16le", errors="ignore")
+
+
+def _decode_string_column(
+    buffer: bytes, count: int, stride: int, offset: int, max_chars: int, enc: str
+) -> list[str]:
+    """
+    Decode the same fixed-width string field from ``count`` consecutive records.
+
+    Returns stripped values; rows whose field falls outside the buffer decode to "".
+    """
+    if count <= 0:
+        return []
+    if offset < 0 or max_chars <= 0:
+        view = memoryview(buffer)
+        return [_decode_fixed_string(view, row * stride + offset, max_chars, enc).strip() for row in range(count)]
+    byte_len = max_chars if enc == "ascii" else max_chars * 2
+    rows = min(count, (len(buffer) - offset - byte_len) // stride + 1) if len(buffer) >= offset + byte_len else 0
+    positions = range(offset, offset + rows * stride, stride)
+    if enc == "ascii":
+        values = [
+            buffer[pos : pos + byte_len].split(b"\x00", 1)[0].decode("ascii", errors="ignore").strip()
+            for pos in positions
+        ]
+    else:
+        values = [
+            utf16_terminated(buffer[pos : pos + byte_len]).decode("utf-16le", errors="ignore").strip()
+            for pos in positions
+        ]
+    if rows < count:
+        values.extend([""] * (count - rows))
+    return values
+
+
+def _unpack_int_column(
+    buffer: bytes, count: int, stride: int, offset: int, field: struct.Struct
+) -> list[int | None]:
+    """
+    Unpack one fixed-width integer field from ``count`` consecutive records.
+
+    Rows whose field falls outside the buffer yield None so callers can fall back to a direct read.
+    """
+    if count <= 0:
+        return []
+    width = field.size
+    if 0 <= offset and offset + width <= stride and len(buffer) == count * stride:
+        # Pad bytes skip the rest of each record, so iter_unpack walks the column in C.
+        row = struct.Struct(f"<{offset}x{field.format[-1]}{stride - offset - width}x")
+        return [value for (value,) in row.iter_unpack(buffer)]
+    values: list[int | None] = []
+    for pos in range(offset, offset + count * stride, stride):
+        values.append(field.unpack_from(buffer, pos)[0] if 0 <= pos and pos + width <= len(buffer) else None)
+    return values
+
+
+def _named_record_rows(first_names: Sequence[str], last_names: Sequence[str]) -> list[int]:
+    """
+    Return the rows holding a real name: at least one part set and both parts printable ASCII.
+
+    Non-ASCII names are common for uninitialized slots, so they are filtered before any
+    per-row team resolution or Player construction.
+    """
+    return [
+        row
+        for row, (first, last) in enumerate(zip(first_names, last_names))
+        if (first or last) and _is_ascii_printable(first) and _is_ascii_printable(last)
+    ]
+
+
+def _panel_read_wstring(mem: GameMemory, addr: int, size_val: int, length_val: int) -> object | None:
+    if size_val <= 0:
+        return None
+    return mem.read_wstring(addr, size_val // 2).strip("\x00")
+
+
+def _panel_read_ascii(mem: GameMemory, addr: int, size_val: int, length_val: int) -> object | None:
+    if size_val <= 0:
+        return None
+    return mem.read_ascii(addr, size_val).strip("\x00")
+
+
+def _panel_read_float(mem: GameMemory, addr: int, size_val: int, length_val: int) -> object | None:
+    byte_len = size_val if size_val > 0 else ((length_val + 7) // 8 if length_val > 0 else 0)
+    if byte_len <= 0:
+        return None
+    raw = mem.read_bytes(addr, byte_len)
+    if byte_len == 4:
+        return _F32.unpack(raw)[0]
+    if byte_len == 8:
+        return _F64.unpack(raw)[0]
+    return None
+
+
+# Panel readers keyed by lower-cased schema type; anything else is read as an integer/bitfield.
+_PANEL_READERS = {
+    "string_utf16": _panel_read_wstring,
+    "wstring": _panel_read_wstring,
+    "string": _panel_read_ascii,
+    "text": _panel_read_ascii,
+    "cstring": _panel_read_ascii,
+    "ascii": _panel_read_ascii,
+    "float": _panel_read_float,
+}
 
 
 class PlayerDataModel:
@@ -102,21 +542,40 @@ class PlayerDataModel:
         self.team_list: list[tuple[int, str]] = []
         self._team_display_map_cache: dict[int, str] | None = None
         self._team_name_index_cache: dict[str, int] | None = None
+        self._team_name_index_lower_cache: dict[str, int] | None = None
+        self._team_filter_index_cache: dict[str, int] | None = None
         self._ordered_team_names_cache: list[str] | None = None
+        self._team_pointer_name_cache: _LRUCache | None = None
         self.staff_list: list[tuple[int, str]] = []
         self.stadium_list: list[tuple[int, str]] = []
-        self._cached_free_agents: list[Player] = []
+        self._cached_free_agents: tuple[Player, ...] = ()
+        self._player_team_ids: tuple[array, array] | None = None
+        self._player_team_ids_source: list[Player] | None = None
+        self._roster_name_tokens_cache: list[tuple[Player, str, str, str, str]] | None = None
+        self._roster_name_tokens_source: list[Player] | None = None
+        self._name_pair_cache: dict[str, list[tuple[str, str]]] = {}
+        self._team_field_spec_cache: tuple[tuple[tuple[str, int, int, str], ...], int] | None = None
+        self._coerce_route_cache: dict[tuple[str, str, str, str, bool], str] = {}
+        self._copy_spec_cache: tuple[dict[str, list[dict]], dict[str, tuple]] | None = None
+        self._category_key_cache: tuple[dict[str, list[dict]], int, dict[str, str]] | None = None
+        self._panel_entries_cache: tuple[list[tuple[str, str, str, dict]], dict | None] | None = None
         self._player_flag_entries: dict[str, dict[str, object] | None] = {}
-        self._player_flag_cache: dict[str, dict[int, bool]] = {}
+        self._player_flag_cache: dict[str, bytearray] = {}
         self._resolved_player_base: int | None = None
         self._resolved_team_base: int | None = None
         self._resolved_staff_base: int | None = None
         self._resolved_stadium_base: int | None = None
         self._resolved_base_pid: int | None = None
+        self._record_addr_cache: dict[tuple[str, int], int] = {}
+        self._held_bases: dict[str, int | None] | None = None
+        self._record_buf_cache: dict[tuple[str, int, int | None], tuple[int, memoryview] | None] | None = None
+        self._bulk_deref_caches: dict[int, dict[int, int]] | None = None
         self._resolved_league_bases: dict[str, int | None] = {}
         self._league_pointer_cache: dict[str, tuple[list[dict[str, object]], int]] = {}
         self._staff_name_fields: dict[str, dict[str, object] | None] = {"first": None, "last": None}
         self._stadium_name_field: dict[str, object] | None = None
+        self._roster_version = 0
+        self._assigned_indexes_cache: tuple[int, frozenset[int]] | None = None
         self._dirty_entities: dict[str, bool] = {
             "players": True,
             "teams": True,
@@ -125,6 +584,9 @@ class PlayerDataModel:
         }
         self._name_index_lock = threading.Lock()
         self._name_index_build_token = 0
+        self._name_index_executor: ThreadPoolExecutor | None = None
+        self._name_index_future: Future | None = None
+        self._scan_read_executor: ThreadPoolExecutor | None = None
         _models_dir = Path(__file__).resolve().parent
         for name in TEAM_DATA_CANDIDATES:
             path = _models_dir / name
@@ -178,6 +640,14 @@ class PlayerDataModel:
             key = str(entity or "").strip().lower()
             if key:
                 self._dirty_entities[key] = True
+                if key == "teams":
+                    # Roster edits invalidate anything derived from the team slot pointers.
+                    self._roster_version += 1
+                if key in ("players", "teams"):
+                    # Column snapshots are rebuilt from the players on next use.
+                    self._player_team_ids = None
+                    if key == "players":
+                        self._player_flag_cache = {}
 
     def clear_dirty(self, *entities: str) -> None:
         targets = entities or ("players", "teams", "staff", "stadiums")
@@ -231,10 +701,13 @@ class PlayerDataModel:
         STADIUM_NAME_OFFSET = offsets_mod.STADIUM_NAME_OFFSET
         STADIUM_NAME_LENGTH = offsets_mod.STADIUM_NAME_LENGTH
         STADIUM_NAME_ENCODING = offsets_mod.STADIUM_NAME_ENCODING
+        self._team_field_spec_cache = None
+        self._panel_entries_cache = None
         # Name field resolution depends on the active offsets + categories.
         self._resolve_name_fields()
         self._resolved_league_bases.clear()
         self._league_pointer_cache.clear()
+        self._clear_record_addr_cache()
 
     def _resolve_name_fields(self) -> None:
         """Resolve staff/stadium name field metadata from loaded categories."""
@@ -288,16 +761,16 @@ class PlayerDataModel:
         self._stadium_name_field = _build_field(stadium_entry, offsets_mod.STADIUM_STRIDE)
 
         def _log_field(label: str, field: dict[str, object] | None) -> None:
-            if not field:
+            if not field or not _LOGGER.isEnabledFor(logging.DEBUG):
                 return
-            try:
-                deref_flag = "yes" if field.get("requires_deref") else "no"
-                print(
-                    f"[data_model] {label} name field offset=0x{int(field['offset']):X} "
-                    f"len={field['length']} enc={field['encoding']} deref={deref_flag}"
-                )
-            except Exception:
-                pass
+            _LOGGER.debug(
+                "[data_model] %s name field offset=0x%X len=%s enc=%s deref=%s",
+                label,
+                int(field["offset"]),
+                field["length"],
+                field["encoding"],
+                "yes" if field.get("requires_deref") else "no",
+            )
 
         _log_field("staff(first)", self._staff_name_fields.get("first"))
         _log_field("staff(last)", self._staff_name_fields.get("last"))
@@ -310,6 +783,10 @@ class PlayerDataModel:
         self._resolved_staff_base = None
         self._resolved_stadium_base = None
         self._resolved_base_pid = None
+        self._clear_record_addr_cache()
+        clear_pages = getattr(self.mem, "clear_page_cache", None)
+        if clear_pages is not None:
+            clear_pages()
 
     def prime_bases(self, *, force: bool = False, open_process: bool = True) -> None:
         """Resolve and cache player/team bases once per process launch."""
@@ -326,6 +803,7 @@ class PlayerDataModel:
             self._resolved_team_base = None
             self._resolved_staff_base = None
             self._resolved_stadium_base = None
+            self._clear_record_addr_cache()
         self._resolved_base_pid = pid
         self._sync_offset_constants()
         if self._resolved_player_base is None:
@@ -396,6 +874,12 @@ class PlayerDataModel:
 
     def _build_name_index_map(self) -> None:
         """Rebuild mapping of normalized full names to player indices."""
+        self._roster_name_tokens_cache = None
+        self._name_pair_cache = {}
+        self._player_team_ids = None
+        # Supersede any background build still running on an older roster snapshot.
+        with self._name_index_lock:
+            self._name_index_build_token += 1
         self.name_index_map = self._build_name_index_map_from_players(self.players)
 
     def _build_name_index_map_from_players(self, players: Sequence[Player]) -> dict[str, list[int]]:
@@ -411,6 +895,7 @@ class PlayerDataModel:
         return name_index_map
 
     def _build_name_index_map_async(self) -> None:
+        self._name_pair_cache = {}
         players_snapshot = list(self.players)
         if not players_snapshot:
             self.name_index_map = {}
@@ -426,7 +911,21 @@ class PlayerDataModel:
                     return
                 self.name_index_map = name_index_map
 
-        threading.Thread(target=_worker, name="NameIndexBuilder", daemon=True).start()
+        executor = self._name_index_executor
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="NameIndexBuilder")
+            self._name_index_executor = executor
+        self._name_index_future = executor.submit(_worker)
+
+    def _current_name_index(self) -> Dict[str, list[int]]:
+        """Return ``name_index_map``, first waiting for a background rebuild that is still running."""
+        future = self._name_index_future
+        if future is not None and not future.done():
+            try:
+                future.result()
+            except Exception:
+                pass
+        return self.name_index_map
 
     def _match_name_tokens(self, first: str, last: str) -> list[int]:
         """Return roster indices that match the supplied first/last name tokens."""
@@ -439,9 +938,10 @@ class PlayerDataModel:
             return []
         seen: set[int] = set()
         matches: list[int] = []
-        if self.name_index_map:
+        name_index_map = self._current_name_index()
+        if name_index_map:
             for key in keys:
-                for idx in self.name_index_map.get(key, []):
+                for idx in name_index_map.get(key, []):
                     if idx not in seen:
                         seen.add(idx)
                         matches.append(idx)
@@ -458,7 +958,16 @@ class PlayerDataModel:
 
     def _candidate_name_pairs(self, raw_name: str) -> list[tuple[str, str]]:
         """Derive plausible (first, last) name pairs from raw import values."""
-        text = str(raw_name or "").replace("\u00a0", " ")
+        cache = self._name_pair_cache
+        key = str(raw_name or "")
+        pairs = cache.get(key)
+        if pairs is None:
+            pairs = cache[key] = self._derive_name_pairs(key)
+        return pairs
+
+    @staticmethod
+    def _derive_name_pairs(raw_name: str) -> list[tuple[str, str]]:
+        text = raw_name.replace("\u00a0", " ")
         text = " ".join(text.split())
         if not text:
             return []
@@ -600,6 +1109,7 @@ class PlayerDataModel:
             return self._resolved_league_bases[pointer_key]
         if not self.mem.open_process():
             return None
+        self._begin_chain_resolution(chains)
         for chain in chains or []:
             base = self._resolve_pointer_from_chain(chain)
             if base is None or base <= 0:
@@ -611,10 +1121,7 @@ class PlayerDataModel:
                 except Exception:
                     continue
             self._resolved_league_bases[pointer_key] = base
-            try:
-                print(f"[data_model] league base '{pointer_key}' resolved to 0x{base:X}")
-            except Exception:
-                pass
+            _LOGGER.debug("[data_model] league base '%s' resolved to 0x%X", pointer_key, base)
             return base
         self._resolved_league_bases[pointer_key] = None
         return None
@@ -628,7 +1135,7 @@ class PlayerDataModel:
         pointer_key, chains, stride, default_limit = self._league_pointer_for_category(category_name)
         if stride <= 0 or not chains:
             return []
-        str_fields = [f for f in fields if self._is_string_type(str(f.get("type")))]
+        str_fields = [f for f in fields if field_type_flags(str(f.get("type"))) & TYPE_STRING]
         probe_field = str_fields[0] if str_fields else None
 
         def _validator(base_addr: int) -> bool:
@@ -664,27 +1171,36 @@ class PlayerDataModel:
         if base_ptr is None:
             return []
         limit = max_records if max_records is not None else default_limit
+        field_pairs = [(str(field.get("name", "")), field) for field in fields]
+        plan = self._compile_field_plan(entity_type="league", category=category_name, fields=field_pairs, record_size=stride)
         records: list[dict[str, object]] = []
         empty_streak = 0
+        # Rows are fully decoded before the next read, so one buffer serves every record.
+        read_into = getattr(self.mem, "read_into", None)
+        pooled = bytearray(stride) if read_into is not None else None
+        pooled_view = memoryview(pooled) if pooled is not None else None
         for idx in range(max(1, limit)):
             record_addr = base_ptr + idx * stride
             try:
-                buf = self.mem.read_bytes(record_addr, stride)
+                if pooled is not None:
+                    read_into(record_addr, pooled)
+                    buf = pooled_view
+                else:
+                    buf = memoryview(self.mem.read_bytes(record_addr, stride))
             except Exception:
                 break
             row: dict[str, object] = {"_index": idx}
             any_values = False
-            for field in fields:
-                name = str(field.get("name", ""))
-                val = self.decode_field_value_from_buffer(
-                    entity_type="league",
-                    entity_index=idx,
-                    category=category_name,
-                    field_name=name,
-                    meta=field,
-                    record_buffer=buf,
-                    record_addr=record_addr,
-                )
+            decoded = self.decode_fields_from_buffer(
+                entity_type="league",
+                entity_index=idx,
+                category=category_name,
+                fields=field_pairs,
+                record_buffer=buf,
+                record_addr=record_addr,
+                plan=plan,
+            )
+            for (name, _field), val in zip(field_pairs, decoded):
                 if isinstance(val, str):
                     val = val.strip()
                 row[name] = val
@@ -776,16 +1292,14 @@ class PlayerDataModel:
         variants: list[str] = []
         seen: set[str] = set()
         for first, last in self._candidate_name_pairs(raw_name):
-            first_variants = self._expand_first_name_variants(first) or [first]
-            last_variants = self._expand_last_name_variants(last) or [last]
-            for first_name in first_variants:
-                for last_name in last_variants:
-                    combined = f"{first_name} {last_name}".strip()
-                    key = combined.lower()
-                    if not combined or key in seen:
-                        continue
-                    seen.add(key)
-                    variants.append(combined)
+            first_variants = [(name, name.lower()) for name in self._expand_first_name_variants(first) or [first]]
+            last_variants = [(name, name.lower()) for name in self._expand_last_name_variants(last) or [last]]
+            for (first_name, first_lower), (last_name, last_lower) in itertools.product(first_variants, last_variants):
+                key = f"{first_lower} {last_lower}".strip()
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                variants.append(f"{first_name} {last_name}".strip())
         return variants
 
     def _match_player_indices(self, raw_name: str) -> list[int]:
@@ -815,6 +1329,36 @@ class PlayerDataModel:
 
         return difflib.SequenceMatcher(None, left, right).ratio()
 
+    def _roster_name_tokens(self) -> list[tuple[Player, str, str, str, str]]:
+        """
+        Return ``(player, first_s, last_s, first_n, last_n)`` for every named roster entry.
+
+        Tokens are computed once per roster load, and again after update_player renames an
+        entry, instead of once per fuzzy lookup.
+        """
+        players = self.players
+        cached = self._roster_name_tokens_cache
+        if cached is not None and self._roster_name_tokens_source is players:
+            return cached
+        tokens: list[tuple[Player, str, str, str, str]] = []
+        for player in players:
+            pf_s = self._sanitize_name_token(player.first_name)
+            pl_s = self._sanitize_name_token(player.last_name)
+            if not pf_s and not pl_s:
+                continue
+            tokens.append(
+                (
+                    player,
+                    pf_s,
+                    pl_s,
+                    self._normalize_family_token(player.first_name),
+                    self._normalize_family_token(player.last_name),
+                )
+            )
+        self._roster_name_tokens_cache = tokens
+        self._roster_name_tokens_source = players
+        return tokens
+
     def _rank_roster_candidates(self, raw_name: str, limit: int = 5) -> list[tuple[str, float]]:
         """Return roster names most similar to ``raw_name`` with alignment-aware scoring."""
         combos: list[dict[str, str]] = []
@@ -847,11 +1391,7 @@ class PlayerDataModel:
         if not combos:
             return []
         scored: list[tuple[float, Player]] = []
-        for player in self.players:
-            pf_s = self._sanitize_name_token(player.first_name)
-            pl_s = self._sanitize_name_token(player.last_name)
-            pf_n = self._normalize_family_token(player.first_name)
-            pl_n = self._normalize_family_token(player.last_name)
+        for player, pf_s, pl_s, pf_n, pl_n in self._roster_name_tokens():
             best_score = 0.0
             for combo in combos:
                 first_score = self._token_similarity(combo["first_s"], pf_s)
@@ -999,15 +1539,15 @@ class PlayerDataModel:
         _reorder_category("Tendencies", TEND_IMPORT_ORDER)
         _reorder_category("Durability", DUR_IMPORT_ORDER)
         _reorder_category("Potential", POTENTIAL_IMPORT_ORDER)
-        ordered: dict[str, list[dict]] = {}
-        preferred = ["Body", "Vitals", "Attributes", "Durability", "Potential", "Tendencies", "Badges"]
+        preferred = ("Body", "Vitals", "Attributes", "Durability", "Potential", "Tendencies", "Badges")
+        # Reorder in place: re-inserting a key moves it to the end, so push the preferred
+        # categories first and then everything else in its original order.
+        remaining = [name for name in cats if name not in preferred]
         for name in preferred:
             if name in cats:
-                ordered[name] = cats[name]
-        for name, fields in cats.items():
-            if name not in ordered:
-                ordered[name] = fields
-        self.categories = ordered
+                cats[name] = cats.pop(name)
+        for name in remaining:
+            cats[name] = cats.pop(name)
 
     # ------------------------------------------------------------------
     # Cheat Engine team table support
@@ -1016,26 +1556,15 @@ class PlayerDataModel:
         """Parse the <Comments> section of a CE table to extract team names."""
         mapping: Dict[int, str] = {}
         try:
-            with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                text = f.read()
-            start = text.find("<Comments>")
-            end = text.find("</Comments>", start + 1)
-            if start == -1 or end == -1:
-                return mapping
-            comments = text[start + len("<Comments>") : end]
-            for line in comments.strip().splitlines():
-                line = line.strip()
-                if not line or "-" not in line:
-                    continue
-                idx_str, name = line.split("-", 1)
-                idx_str = idx_str.strip()
-                name = name.strip()
-                base = 16 if any(c in idx_str.upper() for c in "ABCDEF") else 10
-                try:
-                    idx = int(idx_str, base)
-                    mapping[idx] = name
-                except ValueError:
-                    continue
+            with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                block = _CE_COMMENTS_BLOCK.search(mm)
+                if block is None:
+                    return mapping
+                comments = block.group(1).decode("utf-8", errors="ignore")
+            for match in _CE_COMMENT_RE.finditer(comments):
+                idx_str = match.group(1)
+                base = 10 if _HEX_LETTERS.isdisjoint(idx_str) else 16
+                mapping[int(idx_str, base)] = match.group(2)
         except Exception:
             pass
         return mapping
@@ -1083,6 +1612,66 @@ class PlayerDataModel:
             return None
         return base + stadium_index * STADIUM_RECORD_SIZE
 
+    def _cached_record_address(self, kind: str, index: int) -> int | None:
+        """Staff/stadium record address memoized per ``(kind, index)`` until bases or entities are invalidated."""
+        cache = self._record_addr_cache
+        key = (kind, index)
+        addr = cache.get(key)
+        if addr is not None:
+            return addr
+        if kind == "staff":
+            addr = self._staff_record_address(index)
+        else:
+            addr = self._stadium_record_address(index)
+        if addr is not None:
+            cache[key] = addr
+        return addr
+
+    def _clear_record_addr_cache(self) -> None:
+        self._record_addr_cache.clear()
+
+    def _chain_root_address(self, chain_entry: object) -> int | None:
+        """Return the first address dereferenced by a pointer chain, if any."""
+        base = self.mem.base_addr
+        if base is None:
+            return None
+        if isinstance(chain_entry, dict):
+            base_rva = to_int(chain_entry.get("rva"))
+            if base_rva == 0 or chain_entry.get("direct_table"):
+                return None
+            return base_rva if chain_entry.get("absolute") else base + base_rva
+        if isinstance(chain_entry, tuple) and len(chain_entry) == 3:
+            return base + to_int(chain_entry[0])
+        return None
+
+    def _begin_chain_resolution(self, chains: Sequence[object]) -> None:
+        """
+        Start a pointer-chain resolution pass: drop stale page snapshots and prefetch
+        every chain root with one batched read so candidates share page windows.
+        """
+        clear_pages = getattr(self.mem, "clear_page_cache", None)
+        read_many = getattr(self.mem, "read_uint64_many", None)
+        if clear_pages is None or read_many is None:
+            return
+        clear_pages()
+        roots = [addr for addr in (self._chain_root_address(chain) for chain in chains or []) if addr]
+        if not roots:
+            return
+        try:
+            read_many(roots)
+        except Exception:
+            pass
+
+    def _read_chain_uint64(self, addr: int) -> int:
+        """Read one pointer while walking a chain, served from the page cache when available."""
+        read_many = getattr(self.mem, "read_uint64_many", None)
+        if read_many is None:
+            return self.mem.read_uint64(addr)
+        value = read_many([addr])[0]
+        if value is None:
+            raise RuntimeError(f"Failed to read pointer at 0x{addr:X}")
+        return value
+
     def _resolve_pointer_from_chain(self, chain_entry: object) -> int | None:
         """
         Resolve a pointer chain entry produced by the offsets loader.
@@ -1101,7 +1690,7 @@ class PlayerDataModel:
                 final_offset = to_int(chain_entry.get("final_offset") or chain_entry.get("finalOffset"))
                 if direct_table:
                     return base_addr + final_offset
-                ptr = self.mem.read_uint64(base_addr)
+                ptr = self._read_chain_uint64(base_addr)
             except Exception:
                 return None
             steps = chain_entry.get("steps") or []
@@ -1115,7 +1704,7 @@ class PlayerDataModel:
                     if step.get("dereference"):
                         if ptr == 0:
                             return None
-                        ptr = self.mem.read_uint64(ptr)
+                        ptr = self._read_chain_uint64(ptr)
                     extra = to_int(
                         step.get("post_add")
                         or step.get("postAdd")
@@ -1137,19 +1726,124 @@ class PlayerDataModel:
             try:
                 rva_off, final_off, extra_deref = chain_entry
                 p0_addr = self.mem.base_addr + rva_off
-                p = self.mem.read_uint64(p0_addr)
+                p = self._read_chain_uint64(p0_addr)
                 if extra_deref:
                     if p == 0:
                         return None
-                    p = self.mem.read_uint64(p)
+                    p = self._read_chain_uint64(p)
                 return p + final_off
             except Exception:
                 return None
         return None
 
+    @contextmanager
+    def _hold_resolved_bases(self) -> Iterator[None]:
+        """
+        Resolve the player and team bases once and reuse the results until the block exits.
+
+        Inside the block, failed resolutions are not retried either, so helpers called several
+        times during one refresh do not re-walk pointer chains or reopen the process.
+        Nested use keeps the outermost snapshot.
+        """
+        if self._held_bases is not None:
+            yield
+            return
+        session = getattr(self.mem, "session", None)
+        with session() if callable(session) else nullcontext():
+            held = {"player": self._resolve_player_base_ptr(), "team": self._resolve_team_base_ptr()}
+            self._held_bases = held
+            try:
+                yield
+            finally:
+                self._held_bases = None
+
+    @contextmanager
+    def record_buffer_scope(self) -> Iterator[None]:
+        """
+        Read each record touched by ``decode_field_value`` once and decode later fields from that copy.
+
+        Use around a refresh that reads many fields of the same records; the buffers are dropped
+        when the outermost block exits, so edits made afterwards are always read live.
+        """
+        if self._record_buf_cache is not None:
+            yield
+            return
+        self._record_buf_cache = {}
+        session = getattr(self.mem, "session", None)
+        try:
+            with session() if callable(session) else nullcontext():
+                yield
+        finally:
+            self._record_buf_cache = None
+
+    @contextmanager
+    def bulk_write(self) -> Iterator[None]:
+        """
+        Group several field writes, such as a form save, into one session.
+
+        The process handle is validated once, table bases are resolved once, and each
+        record's struct pointers are read once and shared by every setter inside the block.
+        Do not rewrite a record's struct pointer field inside the block.
+        """
+        if self._bulk_deref_caches is not None:
+            yield
+            return
+        self._bulk_deref_caches = {}
+        try:
+            with self._hold_resolved_bases():
+                yield
+        finally:
+            self._bulk_deref_caches = None
+
+    def _entity_record_size(self, entity_key: str) -> int:
+        if entity_key == "player":
+            return PLAYER_STRIDE
+        if entity_key == "team":
+            return TEAM_RECORD_SIZE or TEAM_STRIDE
+        if entity_key == "staff":
+            return STAFF_RECORD_SIZE or STAFF_STRIDE
+        if entity_key == "stadium":
+            return STADIUM_RECORD_SIZE or STADIUM_STRIDE
+        return 0
+
+    def _scoped_record_buffer(
+        self,
+        entity_type: str,
+        entity_index: int,
+        record_ptr: int | None,
+    ) -> tuple[int, memoryview] | None:
+        """Return ``(record_addr, buffer)`` from the active record buffer scope, reading it on first use."""
+        cache = self._record_buf_cache
+        if cache is None:
+            return None
+        entity_key = _normalize_key(entity_type)
+        cache_key = (entity_key, entity_index, record_ptr)
+        if cache_key in cache:
+            return cache[cache_key]
+        entry = None
+        size = self._entity_record_size(entity_key)
+        try:
+            if size > 0 and self.mem.open_process():
+                record_addr = self._resolve_entity_address(entity_type, entity_index, record_ptr=record_ptr)
+                if record_addr is not None:
+                    entry = (record_addr, memoryview(self.mem.read_bytes(record_addr, size)))
+        except Exception:
+            entry = None
+        cache[cache_key] = entry
+        return entry
+
+    def _held_base(self, kind: str) -> object:
+        held = self._held_bases
+        if held is None:
+            return _NOT_HELD
+        return held.get(kind, _NOT_HELD)
+
     def _resolve_player_base_ptr(self) -> int | None:
         if self._resolved_player_base is not None:
             return self._resolved_player_base
+        held = self._held_base("player")
+        if held is not _NOT_HELD:
+            return held  # type: ignore[return-value]
         try:
             if not self.mem.open_process():
                 return None
@@ -1180,13 +1874,11 @@ class PlayerDataModel:
             return False
 
         if PLAYER_PTR_CHAINS:
+            self._begin_chain_resolution(PLAYER_PTR_CHAINS)
             for chain in PLAYER_PTR_CHAINS:
                 candidate = self._resolve_pointer_from_chain(chain)
                 if _validate_player_table(candidate):
-                    try:
-                        print(f"[data_model] player_base resolved to 0x{candidate:X}")
-                    except Exception:
-                        pass
+                    _LOGGER.debug("[data_model] player_base resolved to 0x%X", candidate)
                     return self._resolved_player_base
         return None
 
@@ -1197,6 +1889,9 @@ class PlayerDataModel:
     def _resolve_team_base_ptr(self) -> int | None:
         if self._resolved_team_base is not None:
             return self._resolved_team_base
+        held = self._held_base("team")
+        if held is not _NOT_HELD:
+            return held  # type: ignore[return-value]
         try:
             if not self.mem.open_process():
                 return None
@@ -1214,17 +1909,15 @@ class PlayerDataModel:
                 return False
             if not name:
                 return False
-            return not any(ord(ch) < 32 or ord(ch) > 126 for ch in name)
+            return name.isascii() and name.isprintable()
 
         if TEAM_PTR_CHAINS:
+            self._begin_chain_resolution(TEAM_PTR_CHAINS)
             for chain in TEAM_PTR_CHAINS:
                 base = self._resolve_pointer_from_chain(chain)
                 if _is_valid_team_base(base):
                     self._resolved_team_base = base
-                    try:
-                        print(f"[data_model] team_base resolved to 0x{base:X}")
-                    except Exception:
-                        pass
+                    _LOGGER.debug("[data_model] team_base resolved to 0x%X", base)
                     return base
         self._resolved_team_base = None
         return None
@@ -1232,11 +1925,7 @@ class PlayerDataModel:
     def _resolve_staff_base_ptr(self) -> int | None:
         if self._resolved_staff_base is not None:
             return self._resolved_staff_base
-        def _log(msg: str) -> None:
-            try:
-                print(msg)
-            except Exception:
-                pass
+        _log = _LOGGER.debug
         try:
             if not self.mem.open_process():
                 _log("[data_model] staff_base skipped; process not open")
@@ -1257,35 +1946,40 @@ class PlayerDataModel:
             length = int(name_field.get("length") or 0)
             encoding = str(name_field.get("encoding") or STAFF_NAME_ENCODING)
             if length <= 0:
-                _log(f"[data_model] staff_base validation: no explicit name length (offset=0x{offset:X}); accepting")
+                _log("[data_model] staff_base validation: no explicit name length (offset=0x%X); accepting", offset)
                 return True
             try:
                 name = self._read_string(base_addr + offset, length, encoding).strip()
             except Exception:
-                _log(f"[data_model] staff_base validation: read failed at 0x{base_addr + offset:X}")
+                _log("[data_model] staff_base validation: read failed at 0x%X", base_addr + offset)
                 return False
             if not name:
                 _log("[data_model] staff_base validation: empty name")
                 return False
-            if any(ord(ch) < 32 for ch in name):
+            if _HAS_CTRL(name):
                 _log("[data_model] staff_base validation: control characters in name")
                 return False
             return True
 
         if STAFF_PTR_CHAINS:
+            self._begin_chain_resolution(STAFF_PTR_CHAINS)
             for idx, chain in enumerate(STAFF_PTR_CHAINS):
                 base = self._resolve_pointer_from_chain(chain)
-                _log(f"[data_model] staff_base candidate[{idx}] = 0x{base:X}" if base is not None else f"[data_model] staff_base candidate[{idx}] = None")
+                _log("[data_model] staff_base candidate[%d] = " + ("0x%X" if base is not None else "%s"), idx, base)
                 if _is_valid_staff_base(base):
                     self._resolved_staff_base = base
-                    _log(f"[data_model] staff_base resolved to 0x{base:X}")
+                    _log("[data_model] staff_base resolved to 0x%X", base)
                     return base
                 # Try direct-table interpretation when deref path fails
                 direct_base = self._direct_base_from_chain(chain)
-                _log(f"[data_model] staff_base direct candidate[{idx}] = 0x{direct_base:X}" if direct_base is not None else f"[data_model] staff_base direct candidate[{idx}] = None")
+                _log(
+                    "[data_model] staff_base direct candidate[%d] = " + ("0x%X" if direct_base is not None else "%s"),
+                    idx,
+                    direct_base,
+                )
                 if _is_valid_staff_base(direct_base):
                     self._resolved_staff_base = direct_base
-                    _log(f"[data_model] staff_base resolved (direct) to 0x{direct_base:X}")
+                    _log("[data_model] staff_base resolved (direct) to 0x%X", direct_base)
                     return direct_base
         if STAFF_PTR_CHAINS:
             _log("[data_model] staff_base not resolved; pointer chains present but validation failed")
@@ -1321,15 +2015,6 @@ class PlayerDataModel:
         except Exception:
             return None
 
-        def _is_valid_stadium_base(base_addr: int | None) -> bool:
-            if base_addr is None or STADIUM_NAME_OFFSET <= 0 or STADIUM_NAME_LENGTH <= 0:
-                return False
-            try:
-                name = self._read_string(base_addr + STADIUM_NAME_OFFSET, STADIUM_NAME_LENGTH, STADIUM_NAME_ENCODING).strip()
-            except Exception:
-                return False
-            return bool(name)
-
         name_field = self._stadium_name_field
 
         def _is_valid_stadium_base(base_addr: int | None) -> bool:
@@ -1348,41 +2033,30 @@ class PlayerDataModel:
                 return False
             if not name:
                 return False
-            return not any(ord(ch) < 32 for ch in name)
+            return not _HAS_CTRL(name)
 
         if STADIUM_PTR_CHAINS:
+            self._begin_chain_resolution(STADIUM_PTR_CHAINS)
             for chain in STADIUM_PTR_CHAINS:
                 base = self._resolve_pointer_from_chain(chain)
                 if _is_valid_stadium_base(base):
                     self._resolved_stadium_base = base
-                    try:
-                        print(f"[data_model] stadium_base resolved to 0x{base:X}")
-                    except Exception:
-                        pass
+                    _LOGGER.debug("[data_model] stadium_base resolved to 0x%X", base)
                     return base
                 # Try direct-table interpretation if deref path failed
                 direct_base = self._direct_base_from_chain(chain)
-                try:
-                    print(f"[data_model] stadium_base direct candidate = 0x{direct_base:X}" if direct_base is not None else "[data_model] stadium_base direct candidate = None")
-                except Exception:
-                    pass
+                _LOGGER.debug(
+                    "[data_model] stadium_base direct candidate = " + ("0x%X" if direct_base is not None else "%s"),
+                    direct_base,
+                )
                 if _is_valid_stadium_base(direct_base):
                     self._resolved_stadium_base = direct_base
-                    try:
-                        print(f"[data_model] stadium_base resolved (direct) to 0x{direct_base:X}")
-                    except Exception:
-                        pass
+                    _LOGGER.debug("[data_model] stadium_base resolved (direct) to 0x%X", direct_base)
                     return direct_base
         if STADIUM_PTR_CHAINS:
-            try:
-                print("[data_model] stadium_base not resolved; pointer chains present but validation failed")
-            except Exception:
-                pass
+            _LOGGER.debug("[data_model] stadium_base not resolved; pointer chains present but validation failed")
         else:
-            try:
-                print("[data_model] stadium_base skipped; no pointer chains configured")
-            except Exception:
-                pass
+            _LOGGER.debug("[data_model] stadium_base skipped; no pointer chains configured")
         self._resolved_stadium_base = None
         return None
 
@@ -1393,20 +2067,59 @@ class PlayerDataModel:
         team_base_ptr = self._resolve_team_base_ptr()
         if team_base_ptr is None:
             return []
+        # Decode names straight out of one block read of the table; records past the readable
+        # prefix (or whose name runs past it) fall back to a per-record string read.
+        block_names: list[str] = []
+        if TEAM_STRIDE > 0 and TEAM_NAME_OFFSET >= 0 and TEAM_NAME_LENGTH > 0:
+            enc = self._normalize_encoding_tag(TEAM_NAME_ENCODING)
+            byte_len = TEAM_NAME_LENGTH if enc == "ascii" else TEAM_NAME_LENGTH * 2
+            block = self._read_whole_records(team_base_ptr, MAX_TEAMS_SCAN, TEAM_STRIDE)
+            if len(block) >= TEAM_NAME_OFFSET + byte_len:
+                covered = min(MAX_TEAMS_SCAN, (len(block) - TEAM_NAME_OFFSET - byte_len) // TEAM_STRIDE + 1)
+                block_names = _decode_string_column(
+                    block, covered, TEAM_STRIDE, TEAM_NAME_OFFSET, TEAM_NAME_LENGTH, enc
+                )
         teams: list[tuple[int, str]] = []
         for i in range(MAX_TEAMS_SCAN):
-            try:
-                rec_addr = team_base_ptr + i * TEAM_STRIDE
-                name = self._read_string(rec_addr + TEAM_NAME_OFFSET, TEAM_NAME_LENGTH, TEAM_NAME_ENCODING).strip()
-            except Exception:
-                continue
+            if i < len(block_names):
+                name = block_names[i]
+            else:
+                try:
+                    rec_addr = team_base_ptr + i * TEAM_STRIDE
+                    name = self._read_string(
+                        rec_addr + TEAM_NAME_OFFSET, TEAM_NAME_LENGTH, TEAM_NAME_ENCODING
+                    ).strip()
+                except Exception:
+                    continue
             if not name:
                 continue
-            if any(ord(ch) < 32 or ord(ch) > 126 for ch in name):
+            if not _is_ascii_printable(name):
                 continue
             teams.append((i, name))
         return teams
 
+    def _team_field_specs(self) -> tuple[tuple[tuple[str, int, int, str], ...], int]:
+        """
+        Return ``((label, offset, max_chars, encoding), ...)`` for TEAM_FIELD_DEFS and the
+        byte span needed to read every field from one record.
+
+        TEAM_FIELD_DEFS is refilled in place when offsets reload, so the cache is dropped by
+        ``_sync_offset_constants``.
+        """
+        cached = self._team_field_spec_cache
+        if cached is not None:
+            return cached
+        specs: list[tuple[str, int, int, str]] = []
+        span = max(TEAM_RECORD_SIZE, 0)
+        for label, (offset, max_chars, encoding) in TEAM_FIELD_DEFS.items():
+            enc = self._normalize_encoding_tag(encoding)
+            specs.append((label, int(offset), int(max_chars), enc))
+            if max_chars > 0:
+                span = max(span, offset + max_chars * (1 if enc == "ascii" else 2))
+        cached = (tuple(specs), span)
+        self._team_field_spec_cache = cached
+        return cached
+
     def get_team_fields(self, team_idx: int) -> Dict[str, str] | None:
         """Return editable team fields for the given team index."""
         if not self.mem.hproc or self.mem.base_addr is None:
@@ -1417,10 +2130,20 @@ class PlayerDataModel:
         if team_base_ptr is None:
             return None
         rec_addr = team_base_ptr + team_idx * TEAM_RECORD_SIZE
+        specs, span = self._team_field_specs()
         fields: Dict[str, str] = {}
-        for label, (offset, max_chars, encoding) in TEAM_FIELD_DEFS.items():
+        try:
+            record = memoryview(self.mem.read_bytes(rec_addr, span))
+        except Exception:
+            record = None
+        if record is not None:
+            for label, offset, max_chars, encoding in specs:
+                fields[label] = _decode_fixed_string(record, offset, max_chars, encoding)
+            return fields
+        read_string = self._read_string
+        for label, offset, max_chars, encoding in specs:
             try:
-                val = self._read_string(rec_addr + offset, max_chars, encoding).rstrip("\x00")
+                val = read_string(rec_addr + offset, max_chars, encoding).rstrip("\x00")
             except Exception:
                 val = ""
             fields[label] = val
@@ -1437,16 +2160,93 @@ class PlayerDataModel:
             return False
         rec_addr = team_base_ptr + team_idx * TEAM_RECORD_SIZE
         success = True
-        for label, (offset, max_chars, encoding) in TEAM_FIELD_DEFS.items():
+        write_string = self._write_string
+        for label, offset, max_chars, encoding in self._team_field_specs()[0]:
             if label not in values:
                 continue
-            val = values[label]
             try:
-                self._write_string(rec_addr + offset, val, max_chars, encoding)
+                write_string(rec_addr + offset, values[label], max_chars, encoding)
             except Exception:
                 success = False
         return success
 
+    def _read_whole_records(self, addr: int, count: int, stride: int) -> bytes:
+        """
+        Read up to ``count`` records of ``stride`` bytes, returning the longest readable prefix.
+
+        When the full block fails (typically the table runs into unmapped memory), the number of
+        readable records is found by bisection so the records before the gap are still returned.
+        """
+        read_bytes = self.mem.read_bytes
+        try:
+            return read_bytes(addr, count * stride)
+        except Exception:
+            pass
+        best = b""
+        low, high = 0, count - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            try:
+                best = read_bytes(addr, mid * stride)
+                low = mid
+            except Exception:
+                high = mid - 1
+        return best
+
+    def _read_record_batches(
+        self, table_base: int, batches: list[tuple[int, int]], stride: int
+    ) -> Iterator[tuple[int, int, bytes]]:
+        """
+        Yield ``(start, count, data)`` for each ``(start, count)`` record batch, in order.
+
+        With several batches, up to ``_SCAN_READ_LOOKAHEAD`` block reads run on the model's scan
+        worker threads (ReadProcessMemory releases the GIL) while earlier batches are decoded.
+        Once a block read fails, nothing more is submitted: that batch and any later ones are
+        read on the caller's thread through ``_read_whole_records``, so a caller that stops at
+        the end of the table leaves no reads running past it.
+        """
+        if len(batches) <= 1:
+            for start, count in batches:
+                yield start, count, self._read_whole_records(table_base + start * stride, count, stride)
+            return
+        read_bytes = self.mem.read_bytes
+
+        def _read_batch(start: int, count: int) -> bytes | None:
+            try:
+                return read_bytes(table_base + start * stride, count * stride)
+            except Exception:
+                return None
+
+        executor = self._scan_read_executor
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=_SCAN_READ_LOOKAHEAD, thread_name_prefix="ScanReader")
+            self._scan_read_executor = executor
+        remaining = iter(batches)
+        pending: deque[tuple[int, int, Future]] = deque()
+        for start, count in itertools.islice(remaining, _SCAN_READ_LOOKAHEAD):
+            pending.append((start, count, executor.submit(_read_batch, start, count)))
+        try:
+            while pending:
+                start, count, future = pending.popleft()
+                data = future.result()
+                if data is None:
+                    break
+                for next_start, next_count in itertools.islice(remaining, 1):
+                    pending.append((next_start, next_count, executor.submit(_read_batch, next_start, next_count)))
+                yield start, count, data
+            else:
+                return
+            # The failed batch and everything after it go through the caller's thread.
+            for queued in pending:
+                queued[2].cancel()
+            pending.clear()
+            yield start, count, self._read_whole_records(table_base + start * stride, count, stride)
+            for start, count in remaining:
+                yield start, count, self._read_whole_records(table_base + start * stride, count, stride)
+        finally:
+            for queued in pending:
+                queued[2].cancel()
+
     def _scan_all_players(self, limit: int) -> list[Player]:
         """Enumerate player records from the live player table with team resolution."""
         players: list[Player] = []
@@ -1482,82 +2282,58 @@ class PlayerDataModel:
         read_uint32_mem = mem.read_uint32
         read_string = self._read_string
         get_team_display_name = self._get_team_display_name
-        append_player = players.append
+        # Row data is collected column-wise and turned into Player objects in one pass at the end.
+        row_indexes: list[int] = []
+        row_firsts: list[str] = []
+        row_lasts: list[str] = []
+        row_team_names: list[str] = []
+        row_team_ids: list[int | None] = []
+        row_ptrs: list[int] = []
         team_ptr_cache: dict[int, tuple[str, int | None]] = {}
 
-        def _decode_string(buffer: memoryview, offset: int, max_chars: int, enc: str) -> str:
-            if offset < 0 or max_chars <= 0:
-                return ""
-            if enc == "ascii":
-                end = offset + max_chars
-                if end > len(buffer):
-                    return ""
-                raw = buffer[offset:end].tobytes()
-                try:
-                    text = raw.decode("ascii", errors="ignore")
-                except Exception:
-                    return ""
-            else:
-                byte_len = max_chars * 2
-                end = offset + byte_len
-                if end > len(buffer):
-                    return ""
-                raw = buffer[offset:end].tobytes()
-                try:
-                    text = raw.decode("utf-16le", errors="ignore")
-                except Exception:
-                    return ""
-            zero = text.find("\x00")
-            if zero != -1:
-                text = text[:zero]
-            return text
-
-        def _read_uint64(buffer: memoryview, offset: int) -> int | None:
-            if offset < 0 or offset + 8 > len(buffer):
-                return None
-            try:
-                return struct.unpack_from("<Q", buffer, offset)[0]
-            except Exception:
-                return None
-
-        def _read_uint32(buffer: memoryview, offset: int) -> int | None:
-            if offset < 0 or offset + 4 > len(buffer):
-                return None
-            try:
-                return struct.unpack_from("<I", buffer, offset)[0]
-            except Exception:
-                return None
-
-        def _is_ascii_printable(value: str) -> bool:
-            return all(32 <= ord(ch) <= 126 for ch in value)
+        # Names of the contiguous team table, indexed by team id, so rows pointing at a team
+        # record resolve with an index lookup instead of a per-pointer read.
+        team_names_by_idx: list[str] = []
+        team_table_bytes = 0
+        if team_base_ptr and team_stride > 0 and MAX_TEAMS_SCAN > 0 and off_team_ptr > 0:
+            team_table = self._read_table_block(team_base_ptr, MAX_TEAMS_SCAN, team_stride)
+            if team_table is not None:
+                team_enc = self._normalize_encoding_tag(team_name_encoding)
+                team_names_by_idx = [
+                    tn or "Unknown"
+                    for tn in _decode_string_column(
+                        team_table, MAX_TEAMS_SCAN, team_stride, off_team_name, team_name_length, team_enc
+                    )
+                ]
+                team_table_bytes = MAX_TEAMS_SCAN * team_stride
 
-        batch_size = min(6000, max_count)
-        for start in range(0, max_count, batch_size):
-            batch_count = min(batch_size, max_count - start)
+        # Read the table in windows of at most _SCAN_WINDOW_BYTES so a failing read only costs one window.
+        batch_size = max(1, min(max_count, _SCAN_WINDOW_BYTES // player_stride))
+        batches = [(start, min(batch_size, max_count - start)) for start in range(0, max_count, batch_size)]
+        for start, batch_count, chunk in self._read_record_batches(table_base, batches, player_stride):
             batch_addr = table_base + start * player_stride
-            batch_len = batch_count * player_stride
-            try:
-                chunk = read_bytes(batch_addr, batch_len)
-            except Exception:
-                return players
-
-            view = memoryview(chunk)
-            for offset_idx in range(batch_count):
+            rows_read = len(chunk) // player_stride
+            if rows_read <= 0:
+                break
+            # A short read means the table ends inside this batch: decode what was read, then stop.
+            table_ends = rows_read < batch_count
+            batch_count = rows_read
+
+            team_ptrs = _unpack_int_column(chunk, batch_count, player_stride, off_team_ptr, _U64) if off_team_ptr > 0 else None
+            team_ids = _unpack_int_column(chunk, batch_count, player_stride, off_team_id, _U32) if off_team_id > 0 else None
+            last_names = _decode_string_column(chunk, batch_count, player_stride, off_last_name, name_max_chars, last_enc)
+            first_names = _decode_string_column(chunk, batch_count, player_stride, off_first_name, name_max_chars, first_enc)
+            for offset_idx in _named_record_rows(first_names, last_names):
                 idx = start + offset_idx
                 base_offset = offset_idx * player_stride
                 p_addr = batch_addr + base_offset
-                last_name = _decode_string(view, base_offset + off_last_name, name_max_chars, last_enc).strip()
-                first_name = _decode_string(view, base_offset + off_first_name, name_max_chars, first_enc).strip()
-                if not first_name and not last_name:
-                    continue
-                # Skip entries with non-ASCII names (common for uninitialized slots).
-                if not _is_ascii_printable(first_name + last_name):
-                    continue
+                last_name = last_names[offset_idx]
+                first_name = first_names[offset_idx]
                 team_name = "Unknown"
                 team_id_val: int | None = None
                 try:
-                    if off_team_ptr > 0:
-                        team_ptr = _read_uint64(view, base_offset + off_team_ptr)
+                    if team_ptrs is not None:
+                        team_ptr = team_ptrs[offset_idx]
                         if team_ptr is None:
                             try:
                                 team_ptr = read_uint64_mem(p_addr + off_team_ptr)
@@ -1567,9 +2343,12 @@ class PlayerDataModel:
                             team_name = "Free Agents"
                             team_id_val = FREE_AGENT_TEAM_ID
                         elif team_ptr:
-                            cached = team_ptr_cache.get(team_ptr)
-                            if cached:
-                                team_name, team_id_val = cached
+                            rel = team_ptr - team_base_ptr if team_table_bytes else -1
+                            if 0 <= rel < team_table_bytes and rel % team_stride == 0:
+                                team_id_val = rel // team_stride
+                                team_name = team_names_by_idx[team_id_val]
+                            elif team_ptr in team_ptr_cache:
+                                team_name, team_id_val = team_ptr_cache[team_ptr]
                             else:
                                 tn = read_string(team_ptr + off_team_name, team_name_length, team_name_encoding).strip()
                                 team_name = tn or "Unknown"
@@ -1578,25 +2357,28 @@ class PlayerDataModel:
                                     if rel >= 0 and rel % team_stride == 0:
                                         team_id_val = int(rel // team_stride)
                                 team_ptr_cache[team_ptr] = (team_name, team_id_val)
-                    elif off_team_id > 0:
-                        tid_val = _read_uint32(view, base_offset + off_team_id)
+                    elif team_ids is not None:
+                        tid_val = team_ids[offset_idx]
                         if tid_val is None:
                             tid_val = read_uint32_mem(p_addr + off_team_id)
                         team_id_val = int(tid_val)
                         team_name = get_team_display_name(team_id_val)
                 except Exception:
                     pass
-                append_player(
-                    Player(
-                        idx,
-                        first_name,
-                        last_name,
-                        team_name,
-                        team_id_val,
-                        record_ptr=p_addr,
-                    )
-                )
-        return players
+                row_indexes.append(idx)
+                row_firsts.append(first_name)
+                row_lasts.append(last_name)
+                row_team_names.append(team_name)
+                row_team_ids.append(team_id_val)
+                row_ptrs.append(p_addr)
+            if table_ends:
+                break
+        return [
+            Player(idx, first, last, team, team_id, record_ptr=ptr)
+            for idx, first, last, team, team_id, ptr in zip(
+                row_indexes, row_firsts, row_lasts, row_team_names, row_team_ids, row_ptrs
+            )
+        ]
 
     # ------------------------------------------------------------------
     # Team scanning
@@ -1614,12 +2396,17 @@ class PlayerDataModel:
         record_addr = self._team_record_address(team_index)
         if record_addr is None:
             return players
+        first_enc = self._normalize_encoding_tag(FIRST_NAME_ENCODING)
+        last_enc = self._normalize_encoding_tag(LAST_NAME_ENCODING)
+        # Both names are read with one call covering the span between the two fields.
+        name_start = min(OFF_FIRST_NAME, OFF_LAST_NAME)
+        name_span = max(
+            OFF_FIRST_NAME + NAME_MAX_CHARS * (1 if first_enc == "ascii" else 2),
+            OFF_LAST_NAME + NAME_MAX_CHARS * (1 if last_enc == "ascii" else 2),
+        ) - name_start
         try:
-            for slot in range(TEAM_PLAYER_SLOT_COUNT):
-                try:
-                    ptr = self.mem.read_uint64(record_addr + slot * 8)
-                except Exception:
-                    ptr = 0
+            team_name = self._get_team_display_name(team_index)
+            for ptr in self._read_team_roster_pointers(record_addr):
                 if not ptr:
                     continue
                 try:
@@ -1627,10 +2414,11 @@ class PlayerDataModel:
                 except Exception:
                     idx = -1
                 try:
-                    last = self._read_string(ptr + OFF_LAST_NAME, NAME_MAX_CHARS, LAST_NAME_ENCODING).strip()
-                    first = self._read_string(ptr + OFF_FIRST_NAME, NAME_MAX_CHARS, FIRST_NAME_ENCODING).strip()
+                    names = memoryview(self.mem.read_bytes(ptr + name_start, name_span))
                 except Exception:
                     continue
+                last = _decode_fixed_string(names, OFF_LAST_NAME - name_start, NAME_MAX_CHARS, last_enc).strip()
+                first = _decode_fixed_string(names, OFF_FIRST_NAME - name_start, NAME_MAX_CHARS, first_enc).strip()
                 if not first and not last:
                     continue
                 players.append(
@@ -1638,7 +2426,7 @@ class PlayerDataModel:
                         idx if idx >= 0 else len(players),
                         first,
                         last,
-                        self._get_team_display_name(team_index),
+                        team_name,
                         team_index,
                         record_ptr=ptr,
                     )
@@ -1655,13 +2443,27 @@ class PlayerDataModel:
     def _invalidate_team_caches(self) -> None:
         self._team_display_map_cache = None
         self._team_name_index_cache = None
+        self._team_name_index_lower_cache = None
+        self._team_filter_index_cache = None
         self._ordered_team_names_cache = None
+        self._team_pointer_name_cache = None
+        self._assigned_indexes_cache = None
 
     def _team_index_for_display_name(self, display_name: str) -> int | None:
-        """Resolve a display name back to its team index."""
-        if self._team_name_index_cache is None:
-            self._team_name_index_cache = {name: idx for idx, name in self.team_list}
-        return self._team_name_index_cache.get(display_name)
+        """Resolve a display name back to its team index (first entry wins on duplicates)."""
+        lookup = self._team_name_index_cache
+        if lookup is None:
+            lookup = {name: idx for idx, name in reversed(self.team_list)}
+            self._team_name_index_cache = lookup
+        return lookup.get(display_name)
+
+    def _team_index_for_display_name_lower(self, name_lower: str) -> int | None:
+        """Resolve a stripped, lower-cased display name to its team index."""
+        lookup = self._team_name_index_lower_cache
+        if lookup is None:
+            lookup = {str(name).strip().lower(): int(idx) for idx, name in reversed(self.team_list)}
+            self._team_name_index_lower_cache = lookup
+        return lookup.get(name_lower)
 
     def _get_team_display_name(self, team_idx: int) -> str:
         return self._team_display_map().get(team_idx, f"Team {team_idx}")
@@ -1673,59 +2475,64 @@ class PlayerDataModel:
         if self._ordered_team_names_cache is not None:
             return list(self._ordered_team_names_cache)
 
-        def _classify(entry: tuple[int, str]) -> str:
+        def _order_key(entry: tuple[int, str]) -> tuple[int, int]:
+            # Free agents lead in their original order (sorted() is stable); other teams follow by id.
             tid, name = entry
-            lname = name.lower()
-            if tid == FREE_AGENT_TEAM_ID or "free" in lname:
-                return "free_agents"
-            return "normal"
-
-        free_agents: list[str] = []
-        remaining: list[tuple[int, str]] = []
-        for entry in self.team_list:
-            category = _classify(entry)
-            if category == "free_agents":
-                free_agents.append(entry[1])
-            else:
-                remaining.append(entry)
-        remaining_sorted = [name for _, name in sorted(remaining, key=lambda item: item[0])]
-        ordered: list[str] = []
-        ordered.extend(free_agents)
-        ordered.extend(remaining_sorted)
+            if tid == FREE_AGENT_TEAM_ID or "free" in name.lower():
+                return (0, 0)
+            return (1, tid)
+
+        ordered = [name for _, name in sorted(self.team_list, key=_order_key)]
         self._ordered_team_names_cache = ordered
         return list(ordered)
 
+    def _read_table_block(self, base_ptr: int, count: int, record_size: int) -> bytes | None:
+        """Read ``count`` contiguous records in one call; None when the block is not readable."""
+        if count <= 0 or record_size <= 0:
+            return None
+        try:
+            return self.mem.read_bytes(base_ptr, count * record_size)
+        except Exception:
+            return None
+
+    def _decode_table_string_field(
+        self,
+        table: bytes,
+        count: int,
+        record_size: int,
+        field: dict[str, object] | None,
+        default_encoding: str,
+    ) -> list[str]:
+        """Decode a string field from every record of a table block read by ``_read_table_block``."""
+        if not field:
+            return [""] * count
+        offset = int(field.get("offset") or 0)
+        length = int(field.get("length") or 0)
+        if offset < 0 or length <= 0:
+            return [""] * count
+        enc = self._normalize_encoding_tag(str(field.get("encoding") or default_encoding))
+        return _decode_string_column(table, count, record_size, offset, length, enc)
+
     def refresh_staff(self) -> list[tuple[int, str]]:
         """Populate staff_list from live memory if pointers are available."""
         with timed("data_model.refresh_staff"):
+            self._clear_record_addr_cache()
             self.staff_list = []
             name_first = self._staff_name_fields.get("first")
             name_last = self._staff_name_fields.get("last")
             active_field = name_first or name_last
             if STAFF_RECORD_SIZE <= 0:
-                try:
-                    print("[data_model] refresh_staff skipped; STAFF_RECORD_SIZE <= 0")
-                except Exception:
-                    pass
+                _LOGGER.debug("[data_model] refresh_staff skipped; STAFF_RECORD_SIZE <= 0")
                 return self.staff_list
             if not active_field:
-                try:
-                    print("[data_model] refresh_staff skipped; no staff name field resolved")
-                except Exception:
-                    pass
+                _LOGGER.debug("[data_model] refresh_staff skipped; no staff name field resolved")
                 return self.staff_list
             if int(active_field.get("offset", 0)) < 0:
-                try:
-                    print("[data_model] refresh_staff skipped; staff name offset < 0")
-                except Exception:
-                    pass
+                _LOGGER.debug("[data_model] refresh_staff skipped; staff name offset < 0")
                 return self.staff_list
             try:
                 if not self.mem.open_process():
-                    try:
-                        print("[data_model] refresh_staff skipped; process not open")
-                    except Exception:
-                        pass
+                    _LOGGER.debug("[data_model] refresh_staff skipped; process not open")
                     return self.staff_list
             except Exception:
                 return self.staff_list
@@ -1746,15 +2553,23 @@ class PlayerDataModel:
                 except Exception:
                     return ""
 
+            table = self._read_table_block(base_ptr, MAX_STAFF_SCAN, STAFF_RECORD_SIZE)
+            if table is not None:
+                firsts = self._decode_table_string_field(table, MAX_STAFF_SCAN, STAFF_RECORD_SIZE, name_first, STAFF_NAME_ENCODING)
+                lasts = self._decode_table_string_field(table, MAX_STAFF_SCAN, STAFF_RECORD_SIZE, name_last, STAFF_NAME_ENCODING)
             for idx in range(MAX_STAFF_SCAN):
-                rec_addr = base_ptr + idx * STAFF_RECORD_SIZE
-                first = _read_field(name_first, rec_addr)
-                last = _read_field(name_last, rec_addr)
+                if table is not None:
+                    first = firsts[idx]
+                    last = lasts[idx]
+                else:
+                    rec_addr = base_ptr + idx * STAFF_RECORD_SIZE
+                    first = _read_field(name_first, rec_addr)
+                    last = _read_field(name_last, rec_addr)
                 name_parts = [part for part in (first, last) if part]
                 if not name_parts:
                     continue
                 display = " ".join(name_parts).strip()
-                if not display or any(ord(ch) < 32 for ch in display):
+                if not display or _HAS_CTRL(display):
                     continue
                 self.staff_list.append((idx, display))
             self.clear_dirty("staff")
@@ -1767,32 +2582,21 @@ class PlayerDataModel:
     def refresh_stadiums(self) -> list[tuple[int, str]]:
         """Populate stadium_list from live memory if pointers are available."""
         with timed("data_model.refresh_stadiums"):
+            self._clear_record_addr_cache()
             self.stadium_list = []
             name_field = self._stadium_name_field
             if STADIUM_RECORD_SIZE <= 0:
-                try:
-                    print("[data_model] refresh_stadiums skipped; STADIUM_RECORD_SIZE <= 0")
-                except Exception:
-                    pass
+                _LOGGER.debug("[data_model] refresh_stadiums skipped; STADIUM_RECORD_SIZE <= 0")
                 return self.stadium_list
             if not name_field:
-                try:
-                    print("[data_model] refresh_stadiums skipped; no stadium name field resolved")
-                except Exception:
-                    pass
+                _LOGGER.debug("[data_model] refresh_stadiums skipped; no stadium name field resolved")
                 return self.stadium_list
             if int(name_field.get("offset", 0)) < 0:
-                try:
-                    print("[data_model] refresh_stadiums skipped; stadium name offset < 0")
-                except Exception:
-                    pass
+                _LOGGER.debug("[data_model] refresh_stadiums skipped; stadium name offset < 0")
                 return self.stadium_list
             try:
                 if not self.mem.open_process():
-                    try:
-                        print("[data_model] refresh_stadiums skipped; process not open")
-                    except Exception:
-                        pass
+                    _LOGGER.debug("[data_model] refresh_stadiums skipped; process not open")
                     return self.stadium_list
             except Exception:
                 return self.stadium_list
@@ -1813,10 +2617,17 @@ class PlayerDataModel:
                 except Exception:
                     return ""
 
+            table = self._read_table_block(base_ptr, MAX_STADIUM_SCAN, STADIUM_RECORD_SIZE)
+            if table is not None:
+                names = self._decode_table_string_field(
+                    table, MAX_STADIUM_SCAN, STADIUM_RECORD_SIZE, name_field, STADIUM_NAME_ENCODING
+                )
             for idx in range(MAX_STADIUM_SCAN):
-                rec_addr = base_ptr + idx * STADIUM_RECORD_SIZE
-                name = _read_field(name_field, rec_addr)
-                if not name or any(ord(ch) < 32 for ch in name):
+                if table is not None:
+                    name = names[idx]
+                else:
+                    name = _read_field(name_field, base_ptr + idx * STADIUM_RECORD_SIZE)
+                if not name or _HAS_CTRL(name):
                     continue
                 self.stadium_list.append((idx, name))
             self.clear_dirty("stadiums")
@@ -1830,16 +2641,15 @@ class PlayerDataModel:
         """Normalize and disambiguate team display names."""
         if not teams:
             return []
-        normalized: list[tuple[int, str]] = []
+        normalized: list[tuple[int, str, str]] = []
         for idx, name in teams:
             base = (name or f"Team {idx}").strip() or f"Team {idx}"
-            normalized.append((idx, base))
-        counts = Counter(base.lower() for _, base in normalized)
-        display_list: list[tuple[int, str]] = []
-        for idx, base in normalized:
-            display = base if counts[base.lower()] <= 1 else f"{base} (ID {idx})"
-            display_list.append((idx, display))
-        return display_list
+            normalized.append((idx, base, base.lower()))
+        counts = Counter(lowered for _, _, lowered in normalized)
+        return [
+            (idx, base if counts[lowered] <= 1 else f"{base} (ID {idx})")
+            for idx, base, lowered in normalized
+        ]
 
     def _ensure_team_entry(self, team_id: int, name: str, front: bool = False) -> None:
         if any(tid == team_id for tid, _ in self.team_list):
@@ -1877,12 +2687,65 @@ class PlayerDataModel:
                     seen_ids.add(temp_id)
         return entries
 
+    def _player_columns(self) -> tuple[array, array]:
+        """
+        Return ``(team_ids, indexes)`` for the loaded players as packed columns parallel to
+        ``self.players``.
+
+        Both columns are filled in one pass; players without a team id are stored as
+        ``_NO_TEAM_ID``. The columns are rebuilt whenever the player list is replaced or the
+        name index is rebuilt (roster edits such as the team shuffle go through that path).
+        """
+        players = self.players
+        columns = self._player_team_ids
+        if (
+            columns is None
+            or self._player_team_ids_source is not players
+            or len(columns[0]) != len(players)
+        ):
+            team_ids = array("q")
+            indexes = array("q")
+            for p in players:
+                team_ids.append(_NO_TEAM_ID if p.team_id is None else p.team_id)
+                indexes.append(p.index)
+            columns = (team_ids, indexes)
+            self._player_team_ids = columns
+            self._player_team_ids_source = players
+        return columns
+
+    def _player_team_id_column(self) -> array:
+        """Team id of every loaded player (``_NO_TEAM_ID`` when unknown), parallel to ``self.players``."""
+        return self._player_columns()[0]
+
+    def _player_index_column(self) -> array:
+        """Roster index of every loaded player, parallel to ``self.players``."""
+        return self._player_columns()[1]
+
     def _apply_team_display_to_players(self, players: list[Player]) -> None:
         """Set player.team names based on team_id mapping when available."""
         display_map = self._team_display_map()
-        for p in players:
-            if p.team_id is not None and p.team_id in display_map:
-                p.team = display_map[p.team_id]
+        if not display_map or not players:
+            return
+        # Dense id -> name table for the regular (non-negative) team slots; special ids such as
+        # free agents go through the dict.
+        top = max((tid for tid in display_map if tid >= 0), default=-1)
+        names_by_id: list[str | None] = [None] * (top + 1)
+        for tid, name in display_map.items():
+            if tid >= 0:
+                names_by_id[tid] = name
+        if players is self.players:
+            team_ids: Iterable[int] = self._player_team_id_column()
+        else:
+            team_ids = [_NO_TEAM_ID if p.team_id is None else p.team_id for p in players]
+        for p, tid in zip(players, team_ids):
+            if 0 <= tid <= top:
+                name = names_by_id[tid]
+            elif tid != _NO_TEAM_ID:
+                name = display_map.get(tid)
+            else:
+                continue
+            if name is not None:
+                p.team = name
 
     def _read_panel_entry(self, record_addr: int, entry: dict) -> object | None:
         """Read a raw field value for the player detail panel based on a schema entry."""
@@ -1902,25 +2765,9 @@ class PlayerDataModel:
             start_bit = to_int(entry.get("startBit") or entry.get("start_bit") or 0)
             size_val = to_int(entry.get("size"))
             length_val = to_int(entry.get("length"))
-            if entry_type in {"string_utf16", "wstring"}:
-                if size_val <= 0:
-                    return None
-                max_chars = size_val // 2
-                return self.mem.read_wstring(target_addr, max_chars).strip("\x00")
-            if entry_type in {"string", "text", "cstring", "ascii"}:
-                if size_val <= 0:
-                    return None
-                return self.mem.read_ascii(target_addr, size_val).strip("\x00")
-            if entry_type == "float":
-                byte_len = size_val if size_val > 0 else ((length_val + 7) // 8 if length_val > 0 else 0)
-                if byte_len <= 0:
-                    return None
-                raw = self.mem.read_bytes(target_addr, byte_len)
-                if byte_len == 4:
-                    return struct.unpack("<f", raw)[0]
-                if byte_len == 8:
-                    return struct.unpack("<d", raw)[0]
-                return None
+            reader = _PANEL_READERS.get(entry_type)
+            if reader is not None:
+                return reader(self.mem, target_addr, size_val, length_val)
             # Some schemas label packed fields as Integer but still set startBit/length.
             # Treat those the same as explicit bitfield entries so we mask correctly.
             is_bitfield = entry_type == "bitfield"
@@ -1949,6 +2796,21 @@ class PlayerDataModel:
         except Exception:
             return None
 
+    def _panel_entries(self) -> tuple[list[tuple[str, str, str, dict]], dict | None]:
+        """Return resolved schema entries for PLAYER_PANEL_FIELDS and the overall rating field."""
+        cached = self._panel_entries_cache
+        if cached is not None:
+            return cached
+        entries: list[tuple[str, str, str, dict]] = []
+        for label, category, entry_name in PLAYER_PANEL_FIELDS:
+            entry = _find_offset_entry(entry_name, category)
+            if entry:
+                entries.append((label, category, entry_name, entry))
+        ovr_entry = _find_offset_entry(PLAYER_PANEL_OVR_FIELD[1], PLAYER_PANEL_OVR_FIELD[0]) or None
+        cached = (entries, ovr_entry)
+        self._panel_entries_cache = cached
+        return cached
+
     def get_player_panel_snapshot(self, player: Player) -> dict[str, object]:
         """Return field values required for the player detail panel."""
         snapshot: dict[str, object] = {}
@@ -1959,50 +2821,54 @@ class PlayerDataModel:
         record_addr = self._player_record_address(player.index, record_ptr=getattr(player, "record_ptr", None))
         if record_addr is None:
             return snapshot
-        # Local import to avoid widening the public surface of core.offsets
-        from ..core.offsets import _find_offset_entry  # type: ignore
-
-        for label, category, entry_name in PLAYER_PANEL_FIELDS:
-            entry = _find_offset_entry(entry_name, category)
-            if not entry:
-                continue
-            value = self.decode_field_value(
-                entity_type="player",
-                entity_index=player.index,
-                category=category,
-                field_name=entry_name,
-                meta=entry,
-                record_ptr=record_addr,
-                enum_as_label=True,
-            )
-            if value is None:
-                continue
-            snapshot[label] = value
-        ovr_entry = _find_offset_entry(PLAYER_PANEL_OVR_FIELD[1], PLAYER_PANEL_OVR_FIELD[0])
-        if ovr_entry:
-            overall_val = self.decode_field_value(
-                entity_type="player",
-                entity_index=player.index,
-                category=PLAYER_PANEL_OVR_FIELD[0],
-                field_name=PLAYER_PANEL_OVR_FIELD[1],
-                meta=ovr_entry,
-                record_ptr=record_addr,
-            )
-            if overall_val is not None:
-                snapshot["Overall"] = overall_val
+        panel_entries, ovr_entry = self._panel_entries()
+        with self.record_buffer_scope():
+            for label, category, entry_name, entry in panel_entries:
+                value = self.decode_field_value(
+                    entity_type="player",
+                    entity_index=player.index,
+                    category=category,
+                    field_name=entry_name,
+                    meta=entry,
+                    record_ptr=record_addr,
+                    enum_as_label=True,
+                )
+                if value is None:
+                    continue
+                snapshot[label] = value
+            if ovr_entry:
+                overall_val = self.decode_field_value(
+                    entity_type="player",
+                    entity_index=player.index,
+                    category=PLAYER_PANEL_OVR_FIELD[0],
+                    field_name=PLAYER_PANEL_OVR_FIELD[1],
+                    meta=ovr_entry,
+                    record_ptr=record_addr,
+                )
+                if overall_val is not None:
+                    snapshot["Overall"] = overall_val
         return snapshot
 
-    def _collect_assigned_player_indexes(self) -> set[int]:
-        """Return the set of player indices currently assigned to team rosters."""
-        assigned: set[int] = set()
+    def _collect_assigned_player_indexes(self) -> frozenset[int]:
+        """
+        Return the player indices currently assigned to team rosters.
+
+        The result is cached until the roster version moves (``mark_dirty("teams")``) or the
+        team caches are invalidated on refresh.
+        """
         if not self.team_list:
-            return assigned
+            return frozenset()
         if not self.mem.hproc or self.mem.base_addr is None:
-            return assigned
+            return frozenset()
+        version = self._roster_version
+        cached = self._assigned_indexes_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
         player_base = self._resolve_player_base_ptr()
         team_base_ptr = self._resolve_team_base_ptr()
         if player_base is None or team_base_ptr is None or TEAM_STRIDE <= 0:
-            return assigned
+            return frozenset()
+        assigned: set[int] = set()
         stride = PLAYER_STRIDE or 1
         for team_idx, _ in self.team_list:
             if team_idx is None or team_idx < 0:
@@ -2011,20 +2877,30 @@ class PlayerDataModel:
                 rec_addr = team_base_ptr + team_idx * TEAM_STRIDE
             except Exception:
                 continue
-            for slot in range(TEAM_PLAYER_SLOT_COUNT):
-                try:
-                    ptr = self.mem.read_uint64(rec_addr + slot * 8)
-                except Exception:
-                    ptr = 0
+            for ptr in self._read_team_roster_pointers(rec_addr):
                 if not ptr:
                     continue
-                try:
-                    idx = int((ptr - player_base) // stride)
-                except Exception:
-                    continue
+                idx = (ptr - player_base) // stride
                 if 0 <= idx < self.max_players:
                     assigned.add(idx)
-        return assigned
+        result = frozenset(assigned)
+        self._assigned_indexes_cache = (version, result)
+        return result
+
+    def _read_team_roster_pointers(self, rec_addr: int) -> tuple[int, ...]:
+        """Read every roster slot pointer of a team record with one block read."""
+        try:
+            return _TEAM_SLOT_POINTERS.unpack(self.mem.read_bytes(rec_addr, _TEAM_SLOT_POINTERS.size))
+        except Exception:
+            pass
+        # Fall back to per-slot reads so a partially readable record still yields its live slots.
+        ptrs: list[int] = []
+        for slot in range(TEAM_PLAYER_SLOT_COUNT):
+            try:
+                ptrs.append(self.mem.read_uint64(rec_addr + slot * 8))
+            except Exception:
+                ptrs.append(0)
+        return tuple(ptrs)
 
     # ------------------------------------------------------------------
     # Public API
@@ -2032,11 +2908,12 @@ class PlayerDataModel:
     def refresh_players(self) -> None:
         """Populate team and player information from live memory only."""
         with timed("data_model.refresh_players"):
+            self._clear_record_addr_cache()
             self.team_list = []
             self._invalidate_team_caches()
             self.players = []
             self.external_loaded = False
-            self._cached_free_agents = []
+            self._cached_free_agents = ()
             self._player_flag_entries = {}
             self._player_flag_cache = {}
             self.name_index_map = {}
@@ -2046,28 +2923,64 @@ class PlayerDataModel:
             # Reuse resolved bases for the same process; invalidate when offsets/bases change.
             self.prime_bases(force=False, open_process=False)
 
-            team_base = self._resolve_team_base_ptr()
-            teams: list[tuple[int, str]] = []
-            if team_base is not None:
-                teams = self._scan_team_names() or []
-                if teams:
-                    def _team_sort_key_pair(item: tuple[int, str]) -> tuple[int, str]:
-                        idx, name = item
-                        return (1 if name.strip().lower().startswith("team ") else 0, name)
+            with self._hold_resolved_bases():
+                team_base = self._resolve_team_base_ptr()
+                teams: list[tuple[int, str]] = []
+                if team_base is not None:
+                    teams = self._scan_team_names() or []
+                    if teams:
+                        def _team_sort_key_pair(item: tuple[int, str]) -> tuple[int, str]:
+                            idx, name = item
+                            return (1 if name.strip().lower().startswith("team ") else 0, name)
 
-                    ordered_teams = sorted(teams, key=_team_sort_key_pair)
-                    self.team_list = self._build_team_display_list(ordered_teams)
-                    self._invalidate_team_caches()
+                        ordered_teams = sorted(teams, key=_team_sort_key_pair)
+                        self.team_list = self._build_team_display_list(ordered_teams)
+                        self._invalidate_team_caches()
 
-            players_all = self._scan_all_players(self.max_players)
+                players_all = self._scan_all_players(self.max_players)
 
             self.players = players_all
-            self._cached_free_agents = [p for p in self.players if p.team_id == FREE_AGENT_TEAM_ID]
+            self._player_team_ids = None
+            self._player_columns()
+            # Free agents are materialized on first request from the team-id column.
+            self._cached_free_agents = ()
             self._apply_team_display_to_players(self.players)
             self._build_name_index_map_async()
             self.clear_dirty("players", "teams")
 
+    def _team_filter_index(self) -> dict[str, int]:
+        """
+        Map canonical team display names straight to team ids for ``get_players_by_team``.
+
+        Names that the slow path treats specially (surrounding whitespace, "all players",
+        anything starting with "free", the free-agent id) are left out so they still go
+        through it.
+        """
+        lookup = self._team_filter_index_cache
+        if lookup is None:
+            lookup = {}
+            seen: set[str] = set()
+            for idx, name in self.team_list:
+                if name in seen:
+                    continue
+                seen.add(name)
+                if not name or name != name.strip():
+                    continue
+                lowered = name.lower()
+                if lowered == "all players" or lowered.startswith("free") or idx == FREE_AGENT_TEAM_ID:
+                    continue
+                lookup[name] = int(idx)
+            self._team_filter_index_cache = lookup
+        return lookup
+
     def get_players_by_team(self, team: str) -> list[Player]:
+        # Common case: the UI passes a canonical team_list name verbatim.
+        team_idx = self._team_filter_index().get(team) if team else None
+        if team_idx is not None:
+            if not self.players:
+                return []
+            column = self._player_team_id_column()
+            return list(itertools.compress(self.players, map(team_idx.__eq__, column)))
         team_name = (team or "").strip()
         if not team_name:
             return []
@@ -2077,21 +2990,20 @@ class PlayerDataModel:
                 return []
             return list(self.players)
         if team_lower.startswith("free"):
-            return self._get_free_agents()
-        team_idx = None
-        for idx, name in self.team_list:
-            if name == team_name:
-                team_idx = idx
-                break
+            return list(self._get_free_agents())
+        team_idx = self._team_index_for_display_name(team_name)
         if team_idx == FREE_AGENT_TEAM_ID:
-            return self._get_free_agents()
+            return list(self._get_free_agents())
         if self.players:
             if team_idx is not None:
-                return [p for p in self.players if p.team_id == team_idx]
+                column = self._player_team_id_column()
+                return list(itertools.compress(self.players, map(int(team_idx).__eq__, column)))
             return [p for p in self.players if p.team == team_name]
         return []
 
     def update_player(self, player: Player) -> None:
+        # Callers rename the Player in place, so the fuzzy-match tokens are stale either way.
+        self._roster_name_tokens_cache = None
         if not self.mem.hproc or self.mem.base_addr is None or self.external_loaded:
             return
         p_addr = self._player_record_address(player.index, record_ptr=getattr(player, "record_ptr", None))
@@ -2126,55 +3038,121 @@ class PlayerDataModel:
                 return True
             except Exception:
                 return False
-        copied_any = False
+        field_specs: list[tuple[int, int, int, bool, int, str, int]] = []
         for name in lower_cats:
-            matched_key = next((cat_name for cat_name in self.categories.keys() if cat_name.lower() == name), None)
+            matched_key = self._category_key_for_lower(name)
             if not matched_key:
                 continue
-            field_defs = self.categories.get(matched_key, [])
-            for field in field_defs:
-                if not isinstance(field, dict):
-                    continue
-                raw_offset = field.get("offset")
-                if raw_offset in (None, ""):
-                    continue
-                offset_int = to_int(raw_offset)
-                start_bit = to_int(field.get("startBit", field.get("start_bit", 0)))
-                length = to_int(field.get("length", 0))
-                if length <= 0:
-                    continue
-                requires_deref = bool(field.get("requiresDereference") or field.get("requires_deref"))
-                deref_offset = to_int(field.get("dereferenceAddress") or field.get("deref_offset"))
-                field_type = str(field.get("type", "")).lower()
-                byte_length = to_int(field.get("size") or field.get("byte_length") or field.get("length"))
-                raw_val = self.get_field_value_typed(
-                    src_index,
-                    offset_int,
-                    start_bit,
-                    length,
-                    requires_deref=requires_deref,
-                    deref_offset=deref_offset,
-                    field_type=field_type,
-                    byte_length=byte_length,
-                    record_ptr=src_record_ptr,
-                )
-                if raw_val is None:
-                    continue
-                if self.set_field_value_typed(
-                    dst_index,
-                    offset_int,
-                    start_bit,
-                    length,
-                    raw_val,
-                    requires_deref=requires_deref,
-                    deref_offset=deref_offset,
-                    field_type=field_type,
-                    byte_length=byte_length,
-                    record_ptr=dst_record_ptr,
-                ):
-                    copied_any = True
+            field_specs.extend(self._category_copy_specs(matched_key))
+        # Fields stored inline in the record are spliced between two record buffers;
+        # dereferenced fields (and everything, if the bulk copy fails) go field by field.
+        inline = [spec for spec in field_specs if not (spec[3] and spec[4]) and spec[0] >= 0]
+        per_field = field_specs
+        copied_any = False
+        if inline and self._splice_record_fields(src_addr, dst_addr, inline):
+            copied_any = True
+            per_field = [spec for spec in field_specs if (spec[3] and spec[4]) or spec[0] < 0]
+        for offset_int, start_bit, length, requires_deref, deref_offset, field_type, byte_length in per_field:
+            raw_val = self.get_field_value_typed(
+                src_index,
+                offset_int,
+                start_bit,
+                length,
+                requires_deref=requires_deref,
+                deref_offset=deref_offset,
+                field_type=field_type,
+                byte_length=byte_length,
+                record_ptr=src_record_ptr,
+            )
+            if raw_val is None:
+                continue
+            if self.set_field_value_typed(
+                dst_index,
+                offset_int,
+                start_bit,
+                length,
+                raw_val,
+                requires_deref=requires_deref,
+                deref_offset=deref_offset,
+                field_type=field_type,
+                byte_length=byte_length,
+                record_ptr=dst_record_ptr,
+            ):
+                copied_any = True
         return copied_any
 
+    def _category_copy_specs(self, category_key: str) -> tuple[tuple[int, int, int, bool, int, str, int], ...]:
+        """
+        Return ``(offset, start_bit, length, requires_deref, deref_offset, type, byte_length)`` for
+        every copyable field of a category, parsed once per ``self.categories`` object.
+        """
+        cats = self.categories
+        cached = self._copy_spec_cache
+        if cached is None or cached[0] is not cats:
+            cached = (cats, {})
+            self._copy_spec_cache = cached
+        specs = cached[1].get(category_key)
+        if specs is not None:
+            return specs
+        parsed: list[tuple[int, int, int, bool, int, str, int]] = []
+        for field in cats.get(category_key, []):
+            if not isinstance(field, dict):
+                continue
+            raw_offset = field.get("offset")
+            if raw_offset in (None, ""):
+                continue
+            offset_int = to_int(raw_offset)
+            start_bit = to_int(field.get("startBit", field.get("start_bit", 0)))
+            length = to_int(field.get("length", 0))
+            if length <= 0:
+                continue
+            requires_deref = bool(field.get("requiresDereference") or field.get("requires_deref"))
+            deref_offset = to_int(field.get("dereferenceAddress") or field.get("deref_offset"))
+            field_type = str(field.get("type", "")).lower()
+            byte_length = to_int(field.get("size") or field.get("byte_length") or field.get("length"))
+            parsed.append((offset_int, start_bit, length, requires_deref, deref_offset, field_type, byte_length))
+        specs = tuple(parsed)
+        cached[1][category_key] = specs
+        return specs
+
+    def _category_key_for_lower(self, name_lower: str) -> str | None:
+        """Map a lower-cased category name to its key in ``self.categories`` (first match wins)."""
+        cats = self.categories
+        cached = self._category_key_cache
+        if cached is None or cached[0] is not cats or cached[1] != len(cats):
+            # The UI reloads categories by assigning a new dict, so identity and size detect staleness.
+            lookup = {cat_name.lower(): cat_name for cat_name in reversed(list(cats))}
+            cached = (cats, len(cats), lookup)
+            self._category_key_cache = cached
+        matched = cached[2].get(name_lower)
+        if matched is not None and matched not in cats:
+            self._category_key_cache = None
+            return self._category_key_for_lower(name_lower)
+        return matched
+
+    def _splice_record_fields(
+        self,
+        src_addr: int,
+        dst_addr: int,
+        field_specs: Sequence[tuple[int, int, int, bool, int, str, int]],
+    ) -> bool:
+        """Copy inline fields from one record to another with one read per record and one write."""
+        lo, hi, mask = _splice_mask(tuple(field_specs))
+        try:
+            src = self.mem.read_bytes(src_addr + lo, hi - lo)
+            dst = self.mem.read_bytes(dst_addr + lo, hi - lo)
+        except Exception:
+            return False
+        # Every selected bit comes from the source, so the whole span splices in one masked merge.
+        current = int.from_bytes(dst, "little")
+        incoming = int.from_bytes(src, "little")
+        merged = ((current & ~mask) | (incoming & mask)).to_bytes(hi - lo, "little")
+        try:
+            self.mem.write_bytes(dst_addr + lo, merged)
+        except Exception:
+            return False
+        return True
+
     # ------------------------------------------------------------------
     # Low-level field read/write
     # ------------------------------------------------------------------
@@ -2204,48 +3182,28 @@ class PlayerDataModel:
             self.mem.write_wstring_fixed(addr, value, max_len)
 
     def _effective_byte_length(self, byte_length_hint: int, length_bits: int, default: int = 4) -> int:
-        """
-        Heuristically derive a byte length from schema hints.
-        Offsets often store either a bit-length or a byte-length; handle both.
-        """
-        if byte_length_hint and byte_length_hint > 0:
-            if byte_length_hint > 8 and byte_length_hint % 8 == 0:
-                # Likely provided as bits (e.g., 32, 64)
-                return max(1, byte_length_hint // 8)
-            return max(1, byte_length_hint)
-        if length_bits and length_bits > 0:
-            return max(1, (int(length_bits) + 7) // 8)
-        return max(1, default)
+        return _effective_byte_length(byte_length_hint, length_bits, default)
 
     # ------------------------------------------------------------------
     # Field display helpers
     # ------------------------------------------------------------------
     def _normalize_field_type(self, field_type: str | None) -> str:
-        return str(field_type or "").strip().lower()
+        return _normalize_field_type(field_type)
 
     def _is_string_type(self, field_type: str | None) -> bool:
-        ftype = self._normalize_field_type(field_type)
-        return any(tag in ftype for tag in ("string", "text", "wstring", "wstr", "utf16", "wide", "char"))
+        return _is_string_type(field_type)
 
     def _string_encoding_for_type(self, field_type: str | None) -> str:
-        ftype = self._normalize_field_type(field_type)
-        if any(tag in ftype for tag in ("wstring", "wstr", "utf16", "wide")):
-            return "utf16"
-        if any(tag in ftype for tag in ("ascii", "string", "text", "char")):
-            return "ascii"
-        return "utf16"
+        return _string_encoding_for_type(field_type)
 
     def _is_float_type(self, field_type: str | None) -> bool:
-        ftype = self._normalize_field_type(field_type)
-        return "float" in ftype or "double" in ftype
+        return _is_float_type(field_type)
 
     def _is_pointer_type(self, field_type: str | None) -> bool:
-        ftype = self._normalize_field_type(field_type)
-        return "pointer" in ftype or "ptr" in ftype
+        return _is_pointer_type(field_type)
 
     def _is_color_type(self, field_type: str | None) -> bool:
-        ftype = self._normalize_field_type(field_type)
-        return "color" in ftype
+        return _is_color_type(field_type)
 
     def _extract_field_parts(
         self,
@@ -2317,17 +3275,15 @@ class PlayerDataModel:
         *,
         requires_deref: bool = False,
         deref_offset: int = 0,
+        deref_cache: dict[int, int] | None = None,
     ) -> int | None:
-        addr = record_addr + offset
+        """Address of a field, following the record's struct pointer (memoized in ``deref_cache``) when dereferenced."""
         if requires_deref and deref_offset:
-            try:
-                struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-            except Exception:
-                struct_ptr = None
+            struct_ptr = self._cached_struct_ptr(record_addr, deref_offset, deref_cache)
             if not struct_ptr:
                 return None
-            addr = struct_ptr + offset
-        return addr
+            return struct_ptr + offset
+        return record_addr + offset
 
     def _read_entity_field_typed(
         self,
@@ -2527,16 +3483,7 @@ class PlayerDataModel:
         return value
 
     def _format_hex_value(self, value: int, length_bits: int, byte_length: int) -> str:
-        if length_bits > 0:
-            width = max(1, (length_bits + 3) // 4)
-            mask = (1 << length_bits) - 1
-            value &= mask
-        else:
-            byte_len = self._effective_byte_length(byte_length, length_bits, default=4)
-            width = max(1, byte_len * 2)
-            if byte_len > 0:
-                value &= (1 << (byte_len * 8)) - 1
-        return f"0x{value:0{width}X}"
+        return _format_hex(value, length_bits, byte_length)
 
     def _is_team_pointer_field(
         self,
@@ -2545,7 +3492,7 @@ class PlayerDataModel:
         field_name: str,
         field_type: str | None,
     ) -> bool:
-        if not self._is_pointer_type(field_type):
+        if not field_type_flags(field_type) & TYPE_POINTER:
             return False
         if (entity_type or "").strip().lower() != "player":
             return False
@@ -2567,16 +3514,23 @@ class PlayerDataModel:
             team_base = None
         if team_base is None or TEAM_STRIDE <= 0:
             return None
+        cache = self._team_pointer_name_cache
+        if cache is None:
+            cache = self._team_pointer_name_cache = _LRUCache(_TEAM_POINTER_CACHE_SIZE)
+        key = (team_base, TEAM_STRIDE, ptr)
+        if key in cache:
+            return cache[key]
         rel = ptr - team_base
         if rel < 0 or rel % TEAM_STRIDE != 0:
-            return None
-        team_idx = int(rel // TEAM_STRIDE)
-        if team_idx < 0:
-            return None
-        try:
-            return self._get_team_display_name(team_idx)
-        except Exception:
-            return f"Team {team_idx}"
+            name = None
+        else:
+            team_idx = int(rel // TEAM_STRIDE)
+            try:
+                name = self._get_team_display_name(team_idx)
+            except Exception:
+                name = f"Team {team_idx}"
+        cache[key] = name
+        return name
 
     def _team_display_name_to_pointer(self, display_value: object) -> int | None:
         parsed = self._parse_hex_value(display_value)
@@ -2586,20 +3540,16 @@ class PlayerDataModel:
         if not text:
             return None
         # Accept mixed labels such as "Lakers (0x1234...)".
-        match = re.search(r"0x[0-9a-fA-F]+", text)
+        match = _HEX_RE.search(text)
         if match:
             try:
                 return int(match.group(0), 16)
             except Exception:
                 pass
         name_lower = text.lower()
-        team_idx: int | None = None
-        for idx, name in self.team_list:
-            if str(name).strip().lower() == name_lower:
-                team_idx = int(idx)
-                break
+        team_idx = self._team_index_for_display_name_lower(name_lower)
         if team_idx is None:
-            token = re.match(r"team\s+(\d+)$", name_lower)
+            token = _TEAM_NUM_RE.match(name_lower)
             if token:
                 try:
                     team_idx = int(token.group(1))
@@ -2628,174 +3578,387 @@ class PlayerDataModel:
         length_raw: int,
         byte_length: int,
     ) -> tuple[str, object, int, str]:
+        cache_key = (entity_type, category, field_name, field_type, bool(values))
+        route_cache = self._coerce_route_cache
+        route = route_cache.get(cache_key)
+        if route is None:
+            route = self._classify_coerce_route(entity_type, category, field_name, field_type, bool(values))
+            route_cache[cache_key] = route
+        handler = _COERCE_HANDLERS[route]
+        return handler(self, display_value, field_type, values, length_bits, length_raw, byte_length)
+
+    def _classify_coerce_route(
+        self,
+        entity_type: str,
+        category: str,
+        field_name: str,
+        field_type: str,
+        has_values: bool,
+    ) -> str:
+        """Pick the coercion handler for a field; the order mirrors the precedence of the schema rules."""
         entity_key = (entity_type or "").strip().lower()
         name_lower = str(field_name or "").strip().lower()
         category_lower = str(category or "").strip().lower()
         field_type_norm = self._normalize_field_type(field_type)
-        if self._is_string_type(field_type_norm):
-            try:
-                text_val = str(display_value)
-            except Exception:
-                text_val = ""
-            char_limit = length_raw if length_raw > 0 else byte_length
-            if char_limit <= 0:
-                char_limit = max(len(text_val), 1)
-            enc = self._string_encoding_for_type(field_type_norm)
-            return ("string", text_val, char_limit, enc)
+        type_flags = field_type_flags(field_type)
+        if type_flags & TYPE_STRING:
+            return "string"
         if entity_key == "player" and name_lower == "weight":
-            fval = self._parse_float_value(display_value)
-            if fval is None:
-                return ("skip", None, 0, "")
-            return ("weight", fval, 0, "")
-        if self._is_float_type(field_type_norm):
-            fval = self._parse_float_value(display_value)
-            if fval is None:
-                return ("skip", None, 0, "")
-            return ("float", fval, 0, "")
-        if values:
-            idx_val: int | None
-            if isinstance(display_value, str):
-                try:
-                    idx_val = values.index(display_value)
-                except ValueError:
-                    idx_val = self._parse_int_value(display_value)
-            else:
-                idx_val = self._parse_int_value(display_value)
-            if idx_val is None:
-                idx_val = 0
-            idx_val = self._clamp_enum_index(idx_val, values, length_bits)
-            return ("int", idx_val, 0, "")
-        if self._is_pointer_type(field_type_norm) or self._is_color_type(field_type_norm):
+            return "weight"
+        if type_flags & TYPE_FLOAT:
+            return "float"
+        if has_values:
+            return "enum"
+        if type_flags & (TYPE_POINTER | TYPE_COLOR):
             if self._is_team_pointer_field(entity_type, category, field_name, field_type_norm):
-                parsed = self._team_display_name_to_pointer(display_value)
-            else:
-                parsed = self._parse_hex_value(display_value)
-            if parsed is None:
-                return ("skip", None, 0, "")
-            if length_bits > 0:
-                parsed &= (1 << length_bits) - 1
-            return ("int", parsed, 0, "")
+                return "team_pointer"
+            return "hex"
         if entity_key == "player" and name_lower == "height":
-            inches_val = self._parse_int_value(display_value)
-            if inches_val is None:
-                return ("skip", None, 0, "")
-            if inches_val < HEIGHT_MIN_INCHES:
-                inches_val = HEIGHT_MIN_INCHES
-            if inches_val > HEIGHT_MAX_INCHES:
-                inches_val = HEIGHT_MAX_INCHES
-            raw_val = height_inches_to_raw(inches_val)
-            return ("int", raw_val, 0, "")
+            return "height"
         if category_lower in ("attributes", "durability"):
-            rating = self._parse_float_value(display_value)
-            if rating is None:
-                return ("skip", None, 0, "")
-            raw_val = convert_rating_to_raw(rating, length_bits or 8)
-            return ("int", raw_val, 0, "")
+            return "rating"
         if category_lower == "potential":
-            rating = self._parse_float_value(display_value)
-            if rating is None:
-                return ("skip", None, 0, "")
             if "min" in name_lower or "max" in name_lower:
-                raw_val = convert_minmax_potential_to_raw(rating, length_bits or 8)
-            else:
-                raw_val = convert_rating_to_raw(rating, length_bits or 8)
-            return ("int", raw_val, 0, "")
+                return "minmax_potential"
+            return "rating"
         if category_lower == "tendencies":
-            rating = self._parse_float_value(display_value)
-            if rating is None:
-                return ("skip", None, 0, "")
-            raw_val = convert_rating_to_tendency_raw(rating, length_bits or 8)
-            return ("int", raw_val, 0, "")
+            return "tendency"
         if is_year_offset_field(field_name):
-            year_val = self._parse_int_value(display_value)
-            if year_val is None:
-                return ("skip", None, 0, "")
-            raw_val = convert_year_to_raw(year_val)
-            return ("int", raw_val, 0, "")
+            return "year"
         if category_lower == "badges":
-            lvl = self._parse_int_value(display_value)
-            if lvl is None:
-                lvl = 0
-            if lvl < 0:
-                lvl = 0
-            max_raw = (1 << length_bits) - 1 if length_bits > 0 else lvl
-            if lvl > max_raw:
-                lvl = max_raw
-            max_lvl = max(0, len(BADGE_LEVEL_NAMES) - 1)
-            if lvl > max_lvl:
-                lvl = max_lvl
-            return ("int", lvl, 0, "")
-        raw_int = self._parse_int_value(display_value)
-        if raw_int is None:
+            return "badge"
+        return "int"
+
+    def _coerce_string(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        try:
+            text_val = str(display_value)
+        except Exception:
+            text_val = ""
+        char_limit = length_raw if length_raw > 0 else byte_length
+        if char_limit <= 0:
+            char_limit = max(len(text_val), 1)
+        enc = self._string_encoding_for_type(field_type)
+        return ("string", text_val, char_limit, enc)
+
+    def _coerce_weight(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        fval = self._parse_float_value(display_value)
+        if fval is None:
             return ("skip", None, 0, "")
-        return ("int", raw_int, 0, "")
+        return ("weight", fval, 0, "")
 
-    def coerce_field_value(
+    def _coerce_float(
         self,
-        *,
-        entity_type: str,
-        category: str,
-        field_name: str,
-        meta: FieldMetadata | dict[str, object],
         display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
     ) -> tuple[str, object, int, str]:
-        (
-            _offset,
-            _start_bit,
-            length_bits,
-            _requires_deref,
-            _deref_offset,
-            field_type,
-            byte_length,
-            values,
-        ) = self._extract_field_parts(meta)
-        length_raw = length_bits
-        if length_bits <= 0 and byte_length > 0:
-            length_bits = byte_length * 8
-        return self._coerce_field_value(
-            entity_type=entity_type,
-            category=category,
-            field_name=field_name,
-            display_value=display_value,
-            field_type=field_type or "",
-            values=values,
-            length_bits=length_bits,
-            length_raw=length_raw,
-            byte_length=byte_length,
-        )
+        fval = self._parse_float_value(display_value)
+        if fval is None:
+            return ("skip", None, 0, "")
+        return ("float", fval, 0, "")
 
-    def decode_field_value(
+    def _coerce_enum(
         self,
-        *,
-        entity_type: str,
-        entity_index: int,
-        category: str,
-        field_name: str,
-        meta: FieldMetadata | dict[str, object],
-        record_ptr: int | None = None,
-        enum_as_label: bool = False,
-    ) -> object | None:
-        (
-            offset,
-            start_bit,
-            length_bits,
-            requires_deref,
-            deref_offset,
-            field_type,
-            byte_length,
-            values,
-        ) = self._extract_field_parts(meta)
-        field_type_norm = self._normalize_field_type(field_type)
-        length_raw = length_bits
-        if length_bits <= 0 and byte_length > 0:
-            length_bits = byte_length * 8
-        name_lower = str(field_name or "").strip().lower()
-        category_lower = str(category or "").strip().lower()
-        if self._is_string_type(field_type_norm):
-            if not self.mem.open_process():
-                return None
-            record_addr = self._resolve_entity_address(entity_type, entity_index, record_ptr=record_ptr)
-            if record_addr is None:
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        idx_val: int | None
+        if isinstance(display_value, str):
+            try:
+                idx_val = values.index(display_value)
+            except ValueError:
+                idx_val = self._parse_int_value(display_value)
+        else:
+            idx_val = self._parse_int_value(display_value)
+        if idx_val is None:
+            idx_val = 0
+        idx_val = self._clamp_enum_index(idx_val, values, length_bits)
+        return ("int", idx_val, 0, "")
+
+    def _coerce_pointer(self, parsed: int | None, length_bits: int) -> tuple[str, object, int, str]:
+        if parsed is None:
+            return ("skip", None, 0, "")
+        if length_bits > 0:
+            parsed &= (1 << length_bits) - 1
+        return ("int", parsed, 0, "")
+
+    def _coerce_team_pointer(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        return self._coerce_pointer(self._team_display_name_to_pointer(display_value), length_bits)
+
+    def _coerce_hex(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        return self._coerce_pointer(self._parse_hex_value(display_value), length_bits)
+
+    def _coerce_height(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        inches_val = self._parse_int_value(display_value)
+        if inches_val is None:
+            return ("skip", None, 0, "")
+        if inches_val < HEIGHT_MIN_INCHES:
+            inches_val = HEIGHT_MIN_INCHES
+        if inches_val > HEIGHT_MAX_INCHES:
+            inches_val = HEIGHT_MAX_INCHES
+        raw_val = height_inches_to_raw(inches_val)
+        return ("int", raw_val, 0, "")
+
+    def _coerce_rating(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        rating = self._parse_float_value(display_value)
+        if rating is None:
+            return ("skip", None, 0, "")
+        raw_val = convert_rating_to_raw(rating, length_bits or 8)
+        return ("int", raw_val, 0, "")
+
+    def _coerce_minmax_potential(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        rating = self._parse_float_value(display_value)
+        if rating is None:
+            return ("skip", None, 0, "")
+        raw_val = convert_minmax_potential_to_raw(rating, length_bits or 8)
+        return ("int", raw_val, 0, "")
+
+    def _coerce_tendency(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        rating = self._parse_float_value(display_value)
+        if rating is None:
+            return ("skip", None, 0, "")
+        raw_val = convert_rating_to_tendency_raw(rating, length_bits or 8)
+        return ("int", raw_val, 0, "")
+
+    def _coerce_year(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        year_val = self._parse_int_value(display_value)
+        if year_val is None:
+            return ("skip", None, 0, "")
+        raw_val = convert_year_to_raw(year_val)
+        return ("int", raw_val, 0, "")
+
+    def _coerce_badge(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        lvl = self._parse_int_value(display_value)
+        if lvl is None:
+            lvl = 0
+        if lvl < 0:
+            lvl = 0
+        max_raw = (1 << length_bits) - 1 if length_bits > 0 else lvl
+        if lvl > max_raw:
+            lvl = max_raw
+        max_lvl = max(0, len(BADGE_LEVEL_NAMES) - 1)
+        if lvl > max_lvl:
+            lvl = max_lvl
+        return ("int", lvl, 0, "")
+
+    def _coerce_int(
+        self,
+        display_value: object,
+        field_type: str,
+        values: Sequence[str] | None,
+        length_bits: int,
+        length_raw: int,
+        byte_length: int,
+    ) -> tuple[str, object, int, str]:
+        raw_int = self._parse_int_value(display_value)
+        if raw_int is None:
+            return ("skip", None, 0, "")
+        return ("int", raw_int, 0, "")
+
+    def coerce_field_value(
+        self,
+        *,
+        entity_type: str,
+        category: str,
+        field_name: str,
+        meta: FieldMetadata | dict[str, object],
+        display_value: object,
+    ) -> tuple[str, object, int, str]:
+        (
+            _offset,
+            _start_bit,
+            length_bits,
+            _requires_deref,
+            _deref_offset,
+            field_type,
+            byte_length,
+            values,
+        ) = self._extract_field_parts(meta)
+        length_raw = length_bits
+        if length_bits <= 0 and byte_length > 0:
+            length_bits = byte_length * 8
+        return self._coerce_field_value(
+            entity_type=entity_type,
+            category=category,
+            field_name=field_name,
+            display_value=display_value,
+            field_type=field_type or "",
+            values=values,
+            length_bits=length_bits,
+            length_raw=length_raw,
+            byte_length=byte_length,
+        )
+
+    def _display_int_field(
+        self,
+        raw_int: int,
+        *,
+        entity_type: str,
+        category: str,
+        field_name: str,
+        values: tuple[str, ...] | None,
+        type_flags: int,
+        field_type_norm: str,
+        length_bits: int,
+        byte_length: int,
+        enum_as_label: bool,
+        is_player: bool,
+        name_lower: str,
+        category_lower: str,
+    ) -> object:
+        """Turn a raw integer field into its display value (enum, hex/team, height, rating, year...)."""
+        if values:
+            idx = self._clamp_enum_index(raw_int, values, length_bits)
+            if enum_as_label:
+                return values[idx]
+            return idx
+        if type_flags & (TYPE_POINTER | TYPE_COLOR):
+            if self._is_team_pointer_field(entity_type, category, field_name, field_type_norm):
+                team_name = self._team_pointer_to_display_name(raw_int)
+                if team_name:
+                    return team_name
+            return self._format_hex_value(raw_int, length_bits, byte_length)
+        return _int_postprocessor(is_player, category_lower, name_lower, field_name)(raw_int, length_bits or 8)
+
+    def decode_field_value(
+        self,
+        *,
+        entity_type: str,
+        entity_index: int,
+        category: str,
+        field_name: str,
+        meta: FieldMetadata | dict[str, object],
+        record_ptr: int | None = None,
+        enum_as_label: bool = False,
+    ) -> object | None:
+        (
+            offset,
+            start_bit,
+            length_bits,
+            requires_deref,
+            deref_offset,
+            field_type,
+            byte_length,
+            values,
+        ) = self._extract_field_parts(meta)
+        field_type_norm = _normalize_field_type(field_type)
+        type_flags = _meta_type_flags(meta, field_type)
+        # Dereferenced fields live outside the record, so they always take the live path.
+        scoped = None
+        if not (requires_deref and deref_offset):
+            scoped = self._scoped_record_buffer(entity_type, entity_index, record_ptr)
+        if scoped is not None:
+            value = self.decode_field_value_from_buffer(
+                entity_type=entity_type,
+                entity_index=entity_index,
+                category=category,
+                field_name=field_name,
+                meta=meta,
+                record_buffer=scoped[1],
+                record_addr=scoped[0],
+                record_ptr=record_ptr,
+                enum_as_label=enum_as_label,
+            )
+            if value is not None:
+                return value
+        length_raw = length_bits
+        if length_bits <= 0 and byte_length > 0:
+            length_bits = byte_length * 8
+        name_lower = _normalize_key(field_name)
+        category_lower = _normalize_key(category)
+        is_player = _normalize_key(entity_type) == "player"
+        if type_flags & TYPE_STRING:
+            if not self.mem.open_process():
+                return None
+            record_addr = self._resolve_entity_address(entity_type, entity_index, record_ptr=record_ptr)
+            if record_addr is None:
                 return None
             addr = self._resolve_field_address(
                 record_addr,
@@ -2813,7 +3976,7 @@ class PlayerDataModel:
                 return self._read_string(addr, max_chars, enc)
             except Exception:
                 return None
-        if entity_type.strip().lower() == "player" and name_lower == "weight":
+        if is_player and name_lower == "weight":
             if not self.mem.open_process():
                 return None
             record_addr = self._resolve_entity_address(entity_type, entity_index, record_ptr=record_ptr)
@@ -2845,45 +4008,24 @@ class PlayerDataModel:
         )
         if raw_val is None:
             return None
-        if self._is_float_type(field_type_norm):
+        if type_flags & TYPE_FLOAT:
             return raw_val
         raw_int = to_int(raw_val)
-        if values:
-            idx = self._clamp_enum_index(raw_int, values, length_bits)
-            if enum_as_label:
-                return values[idx]
-            return idx
-        if self._is_pointer_type(field_type_norm) or self._is_color_type(field_type_norm):
-            if self._is_team_pointer_field(entity_type, category, field_name, field_type_norm):
-                team_name = self._team_pointer_to_display_name(raw_int)
-                if team_name:
-                    return team_name
-            return self._format_hex_value(raw_int, length_bits, byte_length)
-        if entity_type.strip().lower() == "player" and name_lower == "height":
-            inches = raw_height_to_inches(raw_int)
-            if inches < HEIGHT_MIN_INCHES:
-                inches = HEIGHT_MIN_INCHES
-            if inches > HEIGHT_MAX_INCHES:
-                inches = HEIGHT_MAX_INCHES
-            return inches
-        if category_lower in ("attributes", "durability"):
-            return convert_raw_to_rating(raw_int, length_bits or 8)
-        if category_lower == "potential":
-            if "min" in name_lower or "max" in name_lower:
-                return convert_raw_to_minmax_potential(raw_int, length_bits or 8)
-            return convert_raw_to_rating(raw_int, length_bits or 8)
-        if category_lower == "tendencies":
-            return convert_tendency_raw_to_rating(raw_int, length_bits or 8)
-        if is_year_offset_field(field_name):
-            return convert_raw_to_year(raw_int)
-        if category_lower == "badges":
-            max_lvl = max(0, len(BADGE_LEVEL_NAMES) - 1)
-            if raw_int < 0:
-                return 0
-            if raw_int > max_lvl:
-                return max_lvl
-            return raw_int
-        return raw_int
+        return self._display_int_field(
+            raw_int,
+            entity_type=entity_type,
+            category=category,
+            field_name=field_name,
+            values=values,
+            type_flags=type_flags,
+            field_type_norm=field_type_norm,
+            length_bits=length_bits,
+            byte_length=byte_length,
+            enum_as_label=enum_as_label,
+            is_player=is_player,
+            name_lower=name_lower,
+            category_lower=category_lower,
+        )
 
     def decode_field_value_from_buffer(
         self,
@@ -2912,12 +4054,14 @@ class PlayerDataModel:
             byte_length,
             values,
         ) = self._extract_field_parts(meta)
-        field_type_norm = self._normalize_field_type(field_type)
+        field_type_norm = _normalize_field_type(field_type)
+        type_flags = _meta_type_flags(meta, field_type)
         length_raw = length_bits
         if length_bits <= 0 and byte_length > 0:
             length_bits = byte_length * 8
-        name_lower = str(field_name or "").strip().lower()
-        category_lower = str(category or "").strip().lower()
+        name_lower = _normalize_key(field_name)
+        category_lower = _normalize_key(category)
+        is_player = _normalize_key(entity_type) == "player"
         if requires_deref and deref_offset:
             return self.decode_field_value(
                 entity_type=entity_type,
@@ -2929,108 +4073,199 @@ class PlayerDataModel:
                 enum_as_label=enum_as_label,
             )
 
-        buf = memoryview(record_buffer)
-        if self._is_string_type(field_type_norm):
+        # Bulk callers pass one memoryview for every field of a record; only wrap other buffers.
+        buf = record_buffer if type(record_buffer) is memoryview else memoryview(record_buffer)
+        if type_flags & TYPE_STRING:
             max_chars = length_raw if length_raw > 0 else byte_length
             if max_chars <= 0:
                 max_chars = NAME_MAX_CHARS if "name" in name_lower and NAME_MAX_CHARS > 0 else 64
             enc = self._string_encoding_for_type(field_type_norm)
-            try:
-                if max_chars <= 0 or offset < 0:
-                    return None
-                if enc == "ascii":
-                    byte_len = max_chars
-                    end = offset + byte_len
-                    if end > len(buf):
-                        return None
-                    raw = buf[offset:end].tobytes()
-                    text = raw.decode("ascii", errors="ignore")
-                else:
-                    byte_len = max_chars * 2
-                    end = offset + byte_len
-                    if end > len(buf):
-                        return None
-                    raw = buf[offset:end].tobytes()
-                    text = raw.decode("utf-16le", errors="ignore")
-                zero = text.find("\x00")
-                if zero != -1:
-                    text = text[:zero]
-                return text
-            except Exception:
+            if max_chars <= 0 or offset < 0:
                 return None
-
-        if entity_type.strip().lower() == "player" and name_lower == "weight":
-            try:
-                if offset < 0 or offset + 4 > len(buf):
-                    return None
-                raw = buf[offset:offset + 4].tobytes()
-                return int(round(struct.unpack("<f", raw)[0]))
-            except Exception:
+            if offset + (max_chars if enc == "ascii" else max_chars * 2) > len(buf):
                 return None
+            return _decode_fixed_string(buf, offset, max_chars, enc)
 
-        if self._is_float_type(field_type_norm):
-            try:
-                byte_len = self._effective_byte_length(byte_length, length_bits, default=4)
-                if offset < 0 or offset + byte_len > len(buf):
-                    return None
-                fmt = "<d" if byte_len >= 8 else "<f"
-                raw = buf[offset:offset + (8 if fmt == "<d" else 4)].tobytes()
-                return struct.unpack(fmt, raw[: 8 if fmt == "<d" else 4])[0]
-            except Exception:
+        if is_player and name_lower == "weight":
+            if offset < 0 or offset + 4 > len(buf):
                 return None
+            weight = _F32.unpack_from(buf, offset)[0]
+            # NaN/inf cannot be rounded to an int; treat them like unreadable data.
+            return int(round(weight)) if math.isfinite(weight) else None
 
-        raw_int: int
-        try:
-            if length_bits <= 0:
+        bytes_needed, mask, read_len = _meta_bit_layout(meta, start_bit, length_raw, byte_length, type_flags)
+        if type_flags & TYPE_FLOAT:
+            if offset < 0 or offset + read_len > len(buf):
                 return None
-            bits_needed = start_bit + length_bits
-            bytes_needed = (bits_needed + 7) // 8
-            if offset < 0 or offset + bytes_needed > len(buf):
-                return None
-            raw = buf[offset:offset + bytes_needed].tobytes()
-            value = int.from_bytes(raw, "little")
-            value >>= start_bit
-            mask = (1 << length_bits) - 1
-            raw_int = value & mask
-        except Exception:
+            return (_F64 if read_len >= 8 else _F32).unpack_from(buf, offset)[0]
+
+        # Explicit bounds checks keep every read below from raising.
+        if length_bits <= 0 or start_bit < 0 or offset < 0 or offset + bytes_needed > len(buf):
             return None
+        raw_int: int
+        whole = _UINT_STRUCTS.get(length_bits) if start_bit == 0 else None
+        if whole is not None:
+            # Byte-aligned 8/16/32/64-bit fields need no shift or mask.
+            raw_int = whole.unpack_from(buf, offset)[0]
+        else:
+            raw_int = (int.from_bytes(buf[offset:offset + bytes_needed], "little") >> start_bit) & mask
 
-        if values:
-            idx = self._clamp_enum_index(raw_int, values, length_bits)
-            if enum_as_label:
-                return values[idx]
-            return idx
-        if self._is_pointer_type(field_type_norm) or self._is_color_type(field_type_norm):
-            if self._is_team_pointer_field(entity_type, category, field_name, field_type_norm):
-                team_name = self._team_pointer_to_display_name(raw_int)
-                if team_name:
-                    return team_name
-            return self._format_hex_value(raw_int, length_bits, byte_length)
-        if entity_type.strip().lower() == "player" and name_lower == "height":
-            inches = raw_height_to_inches(raw_int)
-            if inches < HEIGHT_MIN_INCHES:
-                inches = HEIGHT_MIN_INCHES
-            if inches > HEIGHT_MAX_INCHES:
-                inches = HEIGHT_MAX_INCHES
-            return inches
-        if category_lower in ("attributes", "durability"):
-            return convert_raw_to_rating(raw_int, length_bits or 8)
-        if category_lower == "potential":
-            if "min" in name_lower or "max" in name_lower:
-                return convert_raw_to_minmax_potential(raw_int, length_bits or 8)
-            return convert_raw_to_rating(raw_int, length_bits or 8)
-        if category_lower == "tendencies":
-            return convert_tendency_raw_to_rating(raw_int, length_bits or 8)
-        if is_year_offset_field(field_name):
-            return convert_raw_to_year(raw_int)
-        if category_lower == "badges":
-            max_lvl = max(0, len(BADGE_LEVEL_NAMES) - 1)
-            if raw_int < 0:
-                return 0
-            if raw_int > max_lvl:
-                return max_lvl
-            return raw_int
-        return raw_int
+        return self._display_int_field(
+            raw_int,
+            entity_type=entity_type,
+            category=category,
+            field_name=field_name,
+            values=values,
+            type_flags=type_flags,
+            field_type_norm=field_type_norm,
+            length_bits=length_bits,
+            byte_length=byte_length,
+            enum_as_label=enum_as_label,
+            is_player=is_player,
+            name_lower=name_lower,
+            category_lower=category_lower,
+        )
+
+    def _compile_field_plan(
+        self,
+        *,
+        entity_type: str,
+        category: str,
+        fields: Sequence[tuple[str, FieldMetadata | dict[str, object]]],
+        record_size: int,
+        enum_as_label: bool = False,
+    ) -> tuple[tuple[int, str, FieldMetadata | dict[str, object], int, int, object], ...]:
+        """
+        Classify ``fields`` once for ``decode_fields_from_buffer`` so repeated records skip the metadata work.
+
+        Each step is ``(kind, field_name, meta, shift, mask, extra)``: ``_PLAN_BUFFER`` decodes through
+        ``decode_field_value_from_buffer``, ``_PLAN_RAW`` returns the masked bits, ``_PLAN_TABLE``
+        indexes the rating table in ``extra`` and ``_PLAN_DISPLAY`` passes ``extra`` as keyword
+        arguments to ``_display_int_field``.
+        """
+        steps: list[tuple[int, str, FieldMetadata | dict[str, object], int, int, object]] = []
+        category_lower = _normalize_key(category)
+        is_player = _normalize_key(entity_type) == "player"
+        for field_name, meta in fields:
+            (
+                offset,
+                start_bit,
+                length_bits,
+                requires_deref,
+                deref_offset,
+                field_type,
+                byte_length,
+                values,
+            ) = self._extract_field_parts(meta)
+            type_flags = _meta_type_flags(meta, field_type)
+            if length_bits <= 0 and byte_length > 0:
+                length_bits = byte_length * 8
+            name_lower = _normalize_key(field_name)
+            if (
+                (requires_deref and deref_offset)
+                or type_flags & (TYPE_STRING | TYPE_FLOAT)
+                or (is_player and name_lower == "weight")
+                or length_bits <= 0
+                or offset < 0
+                or start_bit < 0
+                or offset + (start_bit + length_bits + 7) // 8 > record_size
+            ):
+                steps.append((_PLAN_BUFFER, field_name, meta, 0, 0, None))
+                continue
+            shift = offset * 8 + start_bit
+            _, mask, _ = _meta_bit_layout(meta, start_bit, length_bits, byte_length, type_flags)
+            # Mirror the branch order of _display_int_field to pick the cheapest equivalent step.
+            special = bool(values) or bool(type_flags & (TYPE_POINTER | TYPE_COLOR)) or (is_player and name_lower == "height")
+            table = None
+            if not special:
+                if category_lower in ("attributes", "durability") or (
+                    category_lower == "potential" and "min" not in name_lower and "max" not in name_lower
+                ):
+                    table = raw_to_rating_table(length_bits)
+                    special = table is None
+                elif category_lower in ("potential", "tendencies", "badges") or is_year_offset_field(field_name):
+                    special = True
+            if table is not None:
+                steps.append((_PLAN_TABLE, field_name, meta, shift, mask, table))
+            elif special:
+                display_kwargs = {
+                    "entity_type": entity_type,
+                    "category": category,
+                    "field_name": field_name,
+                    "values": values,
+                    "type_flags": type_flags,
+                    "field_type_norm": _normalize_field_type(field_type),
+                    "length_bits": length_bits,
+                    "byte_length": byte_length,
+                    "enum_as_label": enum_as_label,
+                    "is_player": is_player,
+                    "name_lower": name_lower,
+                    "category_lower": category_lower,
+                }
+                steps.append((_PLAN_DISPLAY, field_name, meta, shift, mask, display_kwargs))
+            else:
+                steps.append((_PLAN_RAW, field_name, meta, shift, mask, None))
+        return tuple(steps)
+
+    def decode_fields_from_buffer(
+        self,
+        *,
+        entity_type: str,
+        entity_index: int,
+        category: str,
+        fields: Sequence[tuple[str, FieldMetadata | dict[str, object]]],
+        record_buffer: bytes | bytearray | memoryview,
+        record_addr: int | None = None,
+        record_ptr: int | None = None,
+        enum_as_label: bool = False,
+        plan: tuple[tuple[int, str, FieldMetadata | dict[str, object], int, int, object], ...] | None = None,
+    ) -> list[object | None]:
+        """
+        Decode ``(field_name, meta)`` pairs from one record buffer, returning values in order.
+
+        Plain integer bitfields are sliced out of a single integer built from the whole record
+        instead of converting each field's bytes separately; strings, floats, weight and
+        dereferenced fields go through ``decode_field_value_from_buffer``. Callers decoding many
+        records of the same size can pass a ``plan`` from ``_compile_field_plan`` built for it.
+        """
+        if plan is None:
+            plan = self._compile_field_plan(
+                entity_type=entity_type,
+                category=category,
+                fields=fields,
+                record_size=len(record_buffer),
+                enum_as_label=enum_as_label,
+            )
+        if type(record_buffer) is not memoryview:
+            record_buffer = memoryview(record_buffer)
+        results: list[object | None] = []
+        record_bits: int | None = None
+        for kind, field_name, meta, shift, mask, extra in plan:
+            if kind == _PLAN_BUFFER:
+                results.append(
+                    self.decode_field_value_from_buffer(
+                        entity_type=entity_type,
+                        entity_index=entity_index,
+                        category=category,
+                        field_name=field_name,
+                        meta=meta,
+                        record_buffer=record_buffer,
+                        record_addr=record_addr,
+                        record_ptr=record_ptr,
+                        enum_as_label=enum_as_label,
+                    )
+                )
+                continue
+            if record_bits is None:
+                record_bits = int.from_bytes(record_buffer, "little")
+            raw_int = (record_bits >> shift) & mask
+            if kind == _PLAN_RAW:
+                results.append(raw_int)
+            elif kind == _PLAN_TABLE:
+                results.append(extra[raw_int])  # type: ignore[index]
+            else:
+                results.append(self._display_int_field(raw_int, **extra))  # type: ignore[arg-type]
+        return results
 
     def encode_field_value(
         self,
@@ -3128,6 +4363,34 @@ class PlayerDataModel:
         """Placeholder for future offline roster loading; currently disabled."""
         return None
 
+    def _read_bitfield(self, addr: int, start_bit: int, length: int) -> int:
+        """
+        Read ``length`` bits starting ``start_bit`` bits into ``addr``.
+
+        Fields spanning up to 8 bytes are read with the narrowest fixed-width integer reader that
+        covers them; wider fields, or a reader that fails (e.g. at the end of a mapping), use an
+        exact-size read. Raises on read failure like the underlying memory calls.
+        """
+        size, mask, _ = _bit_window(start_bit, length)
+        if size <= 8:
+            read_uint = getattr(self.mem, _UINT_READER_BY_SIZE[size], None)
+            if read_uint is not None:
+                try:
+                    value = read_uint(addr)
+                except Exception:
+                    value = None
+                if value is not None:
+                    return (value & mask) >> start_bit
+        read_small = getattr(self.mem, "read_small", None)
+        raw = read_small(addr, size) if read_small is not None else self.mem.read_bytes(addr, size)
+        return (int.from_bytes(raw, "little") & mask) >> start_bit
+
+    def _read_float(self, addr: int, codec: struct.Struct) -> float:
+        """Decode an IEEE-754 value at ``addr`` from the scratch view, without a ``bytes`` copy."""
+        read_small = getattr(self.mem, "read_small", None)
+        raw = read_small(addr, codec.size) if read_small is not None else self.mem.read_bytes(addr, codec.size)
+        return codec.unpack_from(raw)[0]
+
     def get_field_value(
         self,
         player_index: int,
@@ -3138,6 +4401,7 @@ class PlayerDataModel:
         deref_offset: int = 0,
         *,
         record_ptr: int | None = None,
+        deref_cache: dict[int, int] | None = None,
     ) -> int | None:
         try:
             if not self.mem.open_process():
@@ -3145,23 +4409,16 @@ class PlayerDataModel:
             record_addr = self._player_record_address(player_index, record_ptr=record_ptr)
             if record_addr is None:
                 return None
-            if requires_deref and deref_offset:
-                try:
-                    struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                except Exception:
-                    return None
-                if not struct_ptr:
-                    return None
-                addr = struct_ptr + offset
-            else:
-                addr = record_addr + offset
-            bits_needed = start_bit + length
-            bytes_needed = (bits_needed + 7) // 8
-            raw = self.mem.read_bytes(addr, bytes_needed)
-            value = int.from_bytes(raw, "little")
-            value >>= start_bit
-            mask = (1 << length) - 1
-            return value & mask
+            addr = self._resolve_field_address(
+                record_addr,
+                offset,
+                requires_deref=requires_deref,
+                deref_offset=deref_offset,
+                deref_cache=deref_cache,
+            )
+            if addr is None:
+                return None
+            return self._read_bitfield(addr, start_bit, length)
         except Exception:
             return None
 
@@ -3177,29 +4434,30 @@ class PlayerDataModel:
         field_type: str | None = None,
         byte_length: int = 0,
         record_ptr: int | None = None,
+        deref_cache: dict[int, int] | None = None,
     ) -> object | None:
         """
         Read a field value with awareness of its declared type.
         Floats are decoded as IEEE-754; all other types fall back to bitfield reads.
         """
-        ftype = (field_type or "").lower()
-        if "float" in ftype:
+        codec = _float_codec(field_type, byte_length, length)
+        if codec is not None:
             try:
                 if not self.mem.open_process():
                     return None
                 record_addr = self._player_record_address(player_index, record_ptr=record_ptr)
                 if record_addr is None:
                     return None
-                addr = record_addr + offset
-                if requires_deref and deref_offset:
-                    struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                    if not struct_ptr:
-                        return None
-                    addr = struct_ptr + offset
-                byte_len = self._effective_byte_length(byte_length, length, default=4)
-                fmt = "<d" if byte_len >= 8 else "<f"
-                raw = self.mem.read_bytes(addr, 8 if fmt == "<d" else 4)
-                return struct.unpack(fmt, raw[: 8 if fmt == "<d" else 4])[0]
+                addr = self._resolve_field_address(
+                    record_addr,
+                    offset,
+                    requires_deref=requires_deref,
+                    deref_offset=deref_offset,
+                    deref_cache=deref_cache,
+                )
+                if addr is None:
+                    return None
+                return self._read_float(addr, codec)
             except Exception:
                 return None
         return self.get_field_value(
@@ -3210,6 +4468,7 @@ class PlayerDataModel:
             requires_deref=requires_deref,
             deref_offset=deref_offset,
             record_ptr=record_ptr,
+            deref_cache=deref_cache,
         )
 
     def get_team_field_value(
@@ -3220,6 +4479,8 @@ class PlayerDataModel:
         length: int,
         requires_deref: bool = False,
         deref_offset: int = 0,
+        *,
+        deref_cache: dict[int, int] | None = None,
     ) -> int | None:
         """Read a bitfield from the specified team record."""
         try:
@@ -3228,23 +4489,16 @@ class PlayerDataModel:
             record_addr = self._team_record_address(team_index)
             if record_addr is None:
                 return None
-            if requires_deref and deref_offset:
-                try:
-                    struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                except Exception:
-                    return None
-                if not struct_ptr:
-                    return None
-                addr = struct_ptr + offset
-            else:
-                addr = record_addr + offset
-            bits_needed = start_bit + length
-            bytes_needed = (bits_needed + 7) // 8
-            raw = self.mem.read_bytes(addr, bytes_needed)
-            value = int.from_bytes(raw, "little")
-            value >>= start_bit
-            mask = (1 << length) - 1
-            return value & mask
+            addr = self._resolve_field_address(
+                record_addr,
+                offset,
+                requires_deref=requires_deref,
+                deref_offset=deref_offset,
+                deref_cache=deref_cache,
+            )
+            if addr is None:
+                return None
+            return self._read_bitfield(addr, start_bit, length)
         except Exception:
             return None
 
@@ -3262,29 +4516,19 @@ class PlayerDataModel:
     ) -> bool:
         try:
             target_addr = record_addr + offset
-            cache = deref_cache
             if requires_deref and deref_offset:
-                struct_ptr: int | None
-                cached = cache.get(deref_offset) if cache is not None else None
-                if cached is None:
-                    try:
-                        struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                    except Exception:
-                        struct_ptr = None
-                    if cache is not None:
-                        cache[deref_offset] = struct_ptr or 0
-                else:
-                    struct_ptr = cached or None
+                struct_ptr = self._cached_struct_ptr(record_addr, deref_offset, deref_cache)
                 if not struct_ptr:
                     return False
                 target_addr = struct_ptr + offset
             value = int(value)
-            bits_needed = start_bit + length
-            bytes_needed = (bits_needed + 7) // 8
-            data = bytearray(self.mem.read_bytes(target_addr, bytes_needed))
-            current = int.from_bytes(data, "little")
-            mask = ((1 << length) - 1) << start_bit
-            new_val = (current & ~mask) | ((value << start_bit) & mask)
+            bytes_needed, mask, clear_mask = _bit_window(start_bit, length)
+            if start_bit == 0 and length > 0 and length % 8 == 0:
+                # Whole bytes are overwritten, so there is nothing to preserve and no need to read.
+                self.mem.write_bytes(target_addr, (value & mask).to_bytes(bytes_needed, "little"))
+                return True
+            current = self._read_bitfield(target_addr, 0, bytes_needed * 8)
+            new_val = (current & clear_mask) | ((value << start_bit) & mask)
             if new_val == current:
                 return True
             new_bytes = new_val.to_bytes(bytes_needed, "little")
@@ -3302,20 +4546,106 @@ class PlayerDataModel:
             return 0
         applied = 0
         deref_cache: dict[int, int] = {}
-        for offset, start_bit, length, value, requires_deref, deref_offset in assignments:
-            if self._write_field_bits(
-                record_addr,
-                offset,
-                start_bit,
-                length,
-                value,
-                requires_deref=requires_deref,
-                deref_offset=deref_offset,
-                deref_cache=deref_cache,
-            ):
-                applied += 1
+        self._prefetch_struct_ptrs(
+            record_addr,
+            {deref_offset for _, _, _, _, requires_deref, deref_offset in assignments if requires_deref and deref_offset},
+            deref_cache,
+        )
+        for group in _coalesce_assignments(assignments):
+            if len(group) > 1:
+                written = self._write_field_group(record_addr, group, deref_cache)
+                if written is not None:
+                    applied += written
+                    continue
+            for offset, start_bit, length, value, requires_deref, deref_offset in group:
+                if self._write_field_bits(
+                    record_addr,
+                    offset,
+                    start_bit,
+                    length,
+                    value,
+                    requires_deref=requires_deref,
+                    deref_offset=deref_offset,
+                    deref_cache=deref_cache,
+                ):
+                    applied += 1
         return applied
 
+    def _prefetch_struct_ptrs(self, record_addr: int, deref_offsets: Iterable[int], cache: dict[int, int]) -> None:
+        """Fill ``cache`` with the struct pointers at ``deref_offsets`` using one span read where possible."""
+        missing = [off for off in deref_offsets if off not in cache]
+        if len(missing) < 2:
+            return
+        read_offsets = getattr(self.mem, "read_uint64_offsets", None)
+        if read_offsets is None:
+            return
+        try:
+            values = read_offsets(record_addr, missing)
+        except Exception:
+            return
+        for off, ptr in values.items():
+            cache[off] = ptr or 0
+
+    def _cached_struct_ptr(self, record_addr: int, deref_offset: int, cache: dict[int, int] | None) -> int | None:
+        """Read the struct pointer at ``record_addr + deref_offset``, memoized per record in ``cache``."""
+        if cache is None:
+            bulk = self._bulk_deref_caches
+            if bulk is not None:
+                cache = bulk.setdefault(record_addr, {})
+        cached = cache.get(deref_offset) if cache is not None else None
+        if cached is not None:
+            return cached or None
+        try:
+            struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
+        except Exception:
+            struct_ptr = None
+        if cache is not None:
+            cache[deref_offset] = struct_ptr or 0
+        return struct_ptr or None
+
+    def _write_field_group(
+        self,
+        record_addr: int,
+        group: Sequence[FieldWriteSpec],
+        deref_cache: dict[int, int],
+    ) -> int | None:
+        """
+        Patch a group from ``_coalesce_assignments`` with one read and at most one write.
+
+        Returns the number of fields applied, or None when the covering window could not be
+        read or written so the caller can retry the fields one at a time.
+        """
+        _, _, _, _, requires_deref, deref_offset = group[0]
+        base = record_addr
+        if requires_deref and deref_offset:
+            struct_ptr = self._cached_struct_ptr(record_addr, deref_offset, deref_cache)
+            if not struct_ptr:
+                return 0
+            base = struct_ptr
+        lo = min(spec[0] for spec in group)
+        hi = max(offset + (start_bit + length + 7) // 8 for offset, start_bit, length, _, _, _ in group)
+        try:
+            current = int.from_bytes(self.mem.read_bytes(base + lo, hi - lo), "little")
+        except Exception:
+            return None
+        merged = current
+        written = 0
+        for offset, start_bit, length, value, _, _ in group:
+            try:
+                value = int(value)
+            except Exception:
+                continue
+            shift = (offset - lo) * 8 + start_bit
+            mask = _bit_window(shift, length)[1]
+            merged = (merged & ~mask) | ((value << shift) & mask)
+            written += 1
+        if merged != current:
+            try:
+                self.mem.write_bytes(base + lo, merged.to_bytes(hi - lo, "little"))
+            except Exception:
+                return None
+        return written
+
     def set_field_value(
         self,
         player_index: int,
@@ -3327,6 +4657,7 @@ class PlayerDataModel:
         deref_offset: int = 0,
         *,
         record_ptr: int | None = None,
+        deref_cache: dict[int, int] | None = None,
     ) -> bool:
         try:
             if not self.mem.open_process():
@@ -3342,6 +4673,7 @@ class PlayerDataModel:
                 value,
                 requires_deref=requires_deref,
                 deref_offset=deref_offset,
+                deref_cache=deref_cache,
             )
         except Exception:
             return False
@@ -3359,46 +4691,39 @@ class PlayerDataModel:
         field_type: str | None = None,
         byte_length: int = 0,
         record_ptr: int | None = None,
+        deref_cache: dict[int, int] | None = None,
     ) -> bool:
         """
         Write a field value with awareness of its declared type.
         Floats are encoded as IEEE-754; all other types fall back to bitfield writes.
         """
-        ftype = (field_type or "").lower()
-        if "float" in ftype:
+        codec = _float_codec(field_type, byte_length, length)
+        if codec is not None:
             try:
                 if not self.mem.open_process():
                     return False
                 record_addr = self._player_record_address(player_index, record_ptr=record_ptr)
                 if record_addr is None:
                     return False
-                addr = record_addr + offset
-                if requires_deref and deref_offset:
-                    struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                    if not struct_ptr:
-                        return False
-                    addr = struct_ptr + offset
-                byte_len = self._effective_byte_length(byte_length, length, default=4)
-                fmt = "<d" if byte_len >= 8 else "<f"
+                addr = self._resolve_field_address(
+                    record_addr,
+                    offset,
+                    requires_deref=requires_deref,
+                    deref_offset=deref_offset,
+                    deref_cache=deref_cache,
+                )
+                if addr is None:
+                    return False
                 if isinstance(value, (int, float)):
                     fval = float(value)
                 else:
                     fval = float(str(value).strip())
-                data = struct.pack(fmt, fval)
-                data = data[: 8 if fmt == "<d" else 4]
-                self.mem.write_bytes(addr, data)
+                self.mem.write_bytes(addr, codec.pack(fval))
                 return True
             except Exception:
                 return False
-        try:
-            if isinstance(value, (int, float, bool)):
-                int_val = int(value)
-            else:
-                text = str(value).strip()
-                if not text:
-                    return False
-                int_val = int(text)
-        except Exception:
+        int_val = _setter_int(value)
+        if int_val is None:
             return False
         return self.set_field_value(
             player_index,
@@ -3409,6 +4734,7 @@ class PlayerDataModel:
             requires_deref=requires_deref,
             deref_offset=deref_offset,
             record_ptr=record_ptr,
+            deref_cache=deref_cache,
         )
 
     def set_team_field_value(
@@ -3454,25 +4780,26 @@ class PlayerDataModel:
         deref_offset: int = 0,
         field_type: str | None = None,
         byte_length: int = 0,
+        deref_cache: dict[int, int] | None = None,
     ) -> object | None:
-        ftype = (field_type or "").lower()
-        if "float" in ftype:
+        codec = _float_codec(field_type, byte_length, length)
+        if codec is not None:
             try:
                 if not self.mem.open_process():
                     return None
                 record_addr = self._team_record_address(team_index)
                 if record_addr is None:
                     return None
-                addr = record_addr + offset
-                if requires_deref and deref_offset:
-                    struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                    if not struct_ptr:
-                        return None
-                    addr = struct_ptr + offset
-                byte_len = self._effective_byte_length(byte_length, length, default=4)
-                fmt = "<d" if byte_len >= 8 else "<f"
-                raw = self.mem.read_bytes(addr, 8 if fmt == "<d" else 4)
-                return struct.unpack(fmt, raw[: 8 if fmt == "<d" else 4])[0]
+                addr = self._resolve_field_address(
+                    record_addr,
+                    offset,
+                    requires_deref=requires_deref,
+                    deref_offset=deref_offset,
+                    deref_cache=deref_cache,
+                )
+                if addr is None:
+                    return None
+                return self._read_float(addr, codec)
             except Exception:
                 return None
         return self.get_team_field_value(
@@ -3482,11 +4809,178 @@ class PlayerDataModel:
             length,
             requires_deref=requires_deref,
             deref_offset=deref_offset,
+            deref_cache=deref_cache,
+        )
+
+    def set_team_field_value_typed(
+        self,
+        team_index: int,
+        offset: int,
+        start_bit: int,
+        length: int,
+        value: object,
+        *,
+        requires_deref: bool = False,
+        deref_offset: int = 0,
+        field_type: str | None = None,
+        byte_length: int = 0,
+        deref_cache: dict[int, int] | None = None,
+    ) -> bool:
+        codec = _float_codec(field_type, byte_length, length)
+        if codec is not None:
+            try:
+                if not self.mem.open_process():
+                    return False
+                record_addr = self._team_record_address(team_index)
+                if record_addr is None:
+                    return False
+                addr = self._resolve_field_address(
+                    record_addr,
+                    offset,
+                    requires_deref=requires_deref,
+                    deref_offset=deref_offset,
+                    deref_cache=deref_cache,
+                )
+                if addr is None:
+                    return False
+                if isinstance(value, (int, float)):
+                    fval = float(value)
+                else:
+                    fval = float(str(value).strip())
+                self.mem.write_bytes(addr, codec.pack(fval))
+                return True
+            except Exception:
+                return False
+        int_val = _setter_int(value)
+        if int_val is None:
+            return False
+        return self.set_team_field_value(
+            team_index,
+            offset,
+            start_bit,
+            length,
+            int_val,
+            requires_deref=requires_deref,
+            deref_offset=deref_offset,
+            deref_cache=deref_cache,
         )
 
-    def set_team_field_value_typed(
+    # ------------------------------------------------------------------
+    # Staff/Stadium field access
+    # ------------------------------------------------------------------
+    def _record_field_value(
+        self,
+        kind: str,
+        index: int,
+        offset: int,
+        start_bit: int,
+        length: int,
+        *,
+        requires_deref: bool = False,
+        deref_offset: int = 0,
+        deref_cache: dict[int, int] | None = None,
+    ) -> int | None:
+        """Raw bitfield of a staff or stadium record (``kind`` as in ``_cached_record_address``)."""
+        try:
+            if not self.mem.open_process():
+                return None
+            record_addr = self._cached_record_address(kind, index)
+            if record_addr is None:
+                return None
+            addr = self._resolve_field_address(
+                record_addr,
+                offset,
+                requires_deref=requires_deref,
+                deref_offset=deref_offset,
+                deref_cache=deref_cache,
+            )
+            if addr is None:
+                return None
+            return self._read_bitfield(addr, start_bit, length)
+        except Exception:
+            return None
+
+    def _record_field_value_typed(
+        self,
+        kind: str,
+        index: int,
+        offset: int,
+        start_bit: int,
+        length: int,
+        *,
+        requires_deref: bool = False,
+        deref_offset: int = 0,
+        field_type: str | None = None,
+        byte_length: int = 0,
+        deref_cache: dict[int, int] | None = None,
+    ) -> object | None:
+        codec = _float_codec(field_type, byte_length, length)
+        if codec is None:
+            return self._record_field_value(
+                kind,
+                index,
+                offset,
+                start_bit,
+                length,
+                requires_deref=requires_deref,
+                deref_offset=deref_offset,
+                deref_cache=deref_cache,
+            )
+        try:
+            if not self.mem.open_process():
+                return None
+            record_addr = self._cached_record_address(kind, index)
+            if record_addr is None:
+                return None
+            addr = self._resolve_field_address(
+                record_addr,
+                offset,
+                requires_deref=requires_deref,
+                deref_offset=deref_offset,
+                deref_cache=deref_cache,
+            )
+            if addr is None:
+                return None
+            return self._read_float(addr, codec)
+        except Exception:
+            return None
+
+    def _set_record_field_value(
+        self,
+        kind: str,
+        index: int,
+        offset: int,
+        start_bit: int,
+        length: int,
+        value: int,
+        *,
+        requires_deref: bool = False,
+        deref_offset: int = 0,
+        deref_cache: dict[int, int] | None = None,
+    ) -> bool:
+        try:
+            if not self.mem.open_process():
+                return False
+            record_addr = self._cached_record_address(kind, index)
+            if record_addr is None:
+                return False
+            return self._write_field_bits(
+                record_addr,
+                offset,
+                start_bit,
+                length,
+                value,
+                requires_deref=requires_deref,
+                deref_offset=deref_offset,
+                deref_cache=deref_cache,
+            )
+        except Exception:
+            return False
+
+    def _set_record_field_value_typed(
         self,
-        team_index: int,
+        kind: str,
+        index: int,
         offset: int,
         start_bit: int,
         length: int,
@@ -3498,55 +4992,46 @@ class PlayerDataModel:
         byte_length: int = 0,
         deref_cache: dict[int, int] | None = None,
     ) -> bool:
-        ftype = (field_type or "").lower()
-        if "float" in ftype:
-            try:
-                if not self.mem.open_process():
-                    return False
-                record_addr = self._team_record_address(team_index)
-                if record_addr is None:
-                    return False
-                addr = record_addr + offset
-                if requires_deref and deref_offset:
-                    struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                    if not struct_ptr:
-                        return False
-                    addr = struct_ptr + offset
-                byte_len = self._effective_byte_length(byte_length, length, default=4)
-                fmt = "<d" if byte_len >= 8 else "<f"
-                if isinstance(value, (int, float)):
-                    fval = float(value)
-                else:
-                    fval = float(str(value).strip())
-                data = struct.pack(fmt, fval)
-                self.mem.write_bytes(addr, data[: 8 if fmt == "<d" else 4])
-                return True
-            except Exception:
+        codec = _float_codec(field_type, byte_length, length)
+        if codec is None:
+            int_val = _setter_int(value)
+            if int_val is None:
                 return False
+            return self._set_record_field_value(
+                kind,
+                index,
+                offset,
+                start_bit,
+                length,
+                int_val,
+                requires_deref=requires_deref,
+                deref_offset=deref_offset,
+                deref_cache=deref_cache,
+            )
         try:
-            if isinstance(value, (int, float, bool)):
-                int_val = int(value)
+            if not self.mem.open_process():
+                return False
+            record_addr = self._cached_record_address(kind, index)
+            if record_addr is None:
+                return False
+            addr = self._resolve_field_address(
+                record_addr,
+                offset,
+                requires_deref=requires_deref,
+                deref_offset=deref_offset,
+                deref_cache=deref_cache,
+            )
+            if addr is None:
+                return False
+            if isinstance(value, (int, float)):
+                fval = float(value)
             else:
-                text = str(value).strip()
-                if not text:
-                    return False
-                int_val = int(text)
+                fval = float(str(value).strip())
+            self.mem.write_bytes(addr, codec.pack(fval))
+            return True
         except Exception:
             return False
-        return self.set_team_field_value(
-            team_index,
-            offset,
-            start_bit,
-            length,
-            int_val,
-            requires_deref=requires_deref,
-            deref_offset=deref_offset,
-            deref_cache=deref_cache,
-        )
 
-    # ------------------------------------------------------------------
-    # Staff/Stadium field access
-    # ------------------------------------------------------------------
     def get_staff_field_value(
         self,
         staff_index: int,
@@ -3555,29 +5040,19 @@ class PlayerDataModel:
         length: int,
         requires_deref: bool = False,
         deref_offset: int = 0,
+        *,
+        deref_cache: dict[int, int] | None = None,
     ) -> int | None:
-        try:
-            if not self.mem.open_process():
-                return None
-            record_addr = self._staff_record_address(staff_index)
-            if record_addr is None:
-                return None
-            if requires_deref and deref_offset:
-                struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                if not struct_ptr:
-                    return None
-                addr = struct_ptr + offset
-            else:
-                addr = record_addr + offset
-            bits_needed = start_bit + length
-            bytes_needed = (bits_needed + 7) // 8
-            raw = self.mem.read_bytes(addr, bytes_needed)
-            value = int.from_bytes(raw, "little")
-            value >>= start_bit
-            mask = (1 << length) - 1
-            return value & mask
-        except Exception:
-            return None
+        return self._record_field_value(
+            "staff",
+            staff_index,
+            offset,
+            start_bit,
+            length,
+            requires_deref=requires_deref,
+            deref_offset=deref_offset,
+            deref_cache=deref_cache,
+        )
 
     def get_staff_field_value_typed(
         self,
@@ -3590,34 +5065,19 @@ class PlayerDataModel:
         deref_offset: int = 0,
         field_type: str | None = None,
         byte_length: int = 0,
+        deref_cache: dict[int, int] | None = None,
     ) -> object | None:
-        ftype = (field_type or "").lower()
-        if "float" in ftype:
-            try:
-                if not self.mem.open_process():
-                    return None
-                record_addr = self._staff_record_address(staff_index)
-                if record_addr is None:
-                    return None
-                addr = record_addr + offset
-                if requires_deref and deref_offset:
-                    struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                    if not struct_ptr:
-                        return None
-                    addr = struct_ptr + offset
-                byte_len = self._effective_byte_length(byte_length, length, default=4)
-                fmt = "<d" if byte_len >= 8 else "<f"
-                raw = self.mem.read_bytes(addr, 8 if fmt == "<d" else 4)
-                return struct.unpack(fmt, raw[: 8 if fmt == "<d" else 4])[0]
-            except Exception:
-                return None
-        return self.get_staff_field_value(
+        return self._record_field_value_typed(
+            "staff",
             staff_index,
             offset,
             start_bit,
             length,
             requires_deref=requires_deref,
             deref_offset=deref_offset,
+            field_type=field_type,
+            byte_length=byte_length,
+            deref_cache=deref_cache,
         )
 
     def set_staff_field_value(
@@ -3632,24 +5092,17 @@ class PlayerDataModel:
         deref_offset: int = 0,
         deref_cache: dict[int, int] | None = None,
     ) -> bool:
-        try:
-            if not self.mem.open_process():
-                return False
-            record_addr = self._staff_record_address(staff_index)
-            if record_addr is None:
-                return False
-            return self._write_field_bits(
-                record_addr,
-                offset,
-                start_bit,
-                length,
-                value,
-                requires_deref=requires_deref,
-                deref_offset=deref_offset,
-                deref_cache=deref_cache,
-            )
-        except Exception:
-            return False
+        return self._set_record_field_value(
+            "staff",
+            staff_index,
+            offset,
+            start_bit,
+            length,
+            value,
+            requires_deref=requires_deref,
+            deref_offset=deref_offset,
+            deref_cache=deref_cache,
+        )
 
     def set_staff_field_value_typed(
         self,
@@ -3665,49 +5118,17 @@ class PlayerDataModel:
         byte_length: int = 0,
         deref_cache: dict[int, int] | None = None,
     ) -> bool:
-        ftype = (field_type or "").lower()
-        if "float" in ftype:
-            try:
-                if not self.mem.open_process():
-                    return False
-                record_addr = self._staff_record_address(staff_index)
-                if record_addr is None:
-                    return False
-                addr = record_addr + offset
-                if requires_deref and deref_offset:
-                    struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                    if not struct_ptr:
-                        return False
-                    addr = struct_ptr + offset
-                byte_len = self._effective_byte_length(byte_length, length, default=4)
-                fmt = "<d" if byte_len >= 8 else "<f"
-                if isinstance(value, (int, float)):
-                    fval = float(value)
-                else:
-                    fval = float(str(value).strip())
-                data = struct.pack(fmt, fval)
-                self.mem.write_bytes(addr, data[: 8 if fmt == "<d" else 4])
-                return True
-            except Exception:
-                return False
-        try:
-            if isinstance(value, (int, float, bool)):
-                int_val = int(value)
-            else:
-                text = str(value).strip()
-                if not text:
-                    return False
-                int_val = int(text)
-        except Exception:
-            return False
-        return self.set_staff_field_value(
+        return self._set_record_field_value_typed(
+            "staff",
             staff_index,
             offset,
             start_bit,
             length,
-            int_val,
+            value,
             requires_deref=requires_deref,
             deref_offset=deref_offset,
+            field_type=field_type,
+            byte_length=byte_length,
             deref_cache=deref_cache,
         )
 
@@ -3719,29 +5140,19 @@ class PlayerDataModel:
         length: int,
         requires_deref: bool = False,
         deref_offset: int = 0,
+        *,
+        deref_cache: dict[int, int] | None = None,
     ) -> int | None:
-        try:
-            if not self.mem.open_process():
-                return None
-            record_addr = self._stadium_record_address(stadium_index)
-            if record_addr is None:
-                return None
-            if requires_deref and deref_offset:
-                struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                if not struct_ptr:
-                    return None
-                addr = struct_ptr + offset
-            else:
-                addr = record_addr + offset
-            bits_needed = start_bit + length
-            bytes_needed = (bits_needed + 7) // 8
-            raw = self.mem.read_bytes(addr, bytes_needed)
-            value = int.from_bytes(raw, "little")
-            value >>= start_bit
-            mask = (1 << length) - 1
-            return value & mask
-        except Exception:
-            return None
+        return self._record_field_value(
+            "stadium",
+            stadium_index,
+            offset,
+            start_bit,
+            length,
+            requires_deref=requires_deref,
+            deref_offset=deref_offset,
+            deref_cache=deref_cache,
+        )
 
     def get_stadium_field_value_typed(
         self,
@@ -3754,34 +5165,19 @@ class PlayerDataModel:
         deref_offset: int = 0,
         field_type: str | None = None,
         byte_length: int = 0,
+        deref_cache: dict[int, int] | None = None,
     ) -> object | None:
-        ftype = (field_type or "").lower()
-        if "float" in ftype:
-            try:
-                if not self.mem.open_process():
-                    return None
-                record_addr = self._stadium_record_address(stadium_index)
-                if record_addr is None:
-                    return None
-                addr = record_addr + offset
-                if requires_deref and deref_offset:
-                    struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                    if not struct_ptr:
-                        return None
-                    addr = struct_ptr + offset
-                byte_len = self._effective_byte_length(byte_length, length, default=4)
-                fmt = "<d" if byte_len >= 8 else "<f"
-                raw = self.mem.read_bytes(addr, 8 if fmt == "<d" else 4)
-                return struct.unpack(fmt, raw[: 8 if fmt == "<d" else 4])[0]
-            except Exception:
-                return None
-        return self.get_stadium_field_value(
+        return self._record_field_value_typed(
+            "stadium",
             stadium_index,
             offset,
             start_bit,
             length,
             requires_deref=requires_deref,
             deref_offset=deref_offset,
+            field_type=field_type,
+            byte_length=byte_length,
+            deref_cache=deref_cache,
         )
 
     def set_stadium_field_value(
@@ -3796,24 +5192,17 @@ class PlayerDataModel:
         deref_offset: int = 0,
         deref_cache: dict[int, int] | None = None,
     ) -> bool:
-        try:
-            if not self.mem.open_process():
-                return False
-            record_addr = self._stadium_record_address(stadium_index)
-            if record_addr is None:
-                return False
-            return self._write_field_bits(
-                record_addr,
-                offset,
-                start_bit,
-                length,
-                value,
-                requires_deref=requires_deref,
-                deref_offset=deref_offset,
-                deref_cache=deref_cache,
-            )
-        except Exception:
-            return False
+        return self._set_record_field_value(
+            "stadium",
+            stadium_index,
+            offset,
+            start_bit,
+            length,
+            value,
+            requires_deref=requires_deref,
+            deref_offset=deref_offset,
+            deref_cache=deref_cache,
+        )
 
     def set_stadium_field_value_typed(
         self,
@@ -3829,49 +5218,17 @@ class PlayerDataModel:
         byte_length: int = 0,
         deref_cache: dict[int, int] | None = None,
     ) -> bool:
-        ftype = (field_type or "").lower()
-        if "float" in ftype:
-            try:
-                if not self.mem.open_process():
-                    return False
-                record_addr = self._stadium_record_address(stadium_index)
-                if record_addr is None:
-                    return False
-                addr = record_addr + offset
-                if requires_deref and deref_offset:
-                    struct_ptr = self.mem.read_uint64(record_addr + deref_offset)
-                    if not struct_ptr:
-                        return False
-                    addr = struct_ptr + offset
-                byte_len = self._effective_byte_length(byte_length, length, default=4)
-                fmt = "<d" if byte_len >= 8 else "<f"
-                if isinstance(value, (int, float)):
-                    fval = float(value)
-                else:
-                    fval = float(str(value).strip())
-                data = struct.pack(fmt, fval)
-                self.mem.write_bytes(addr, data[: 8 if fmt == "<d" else 4])
-                return True
-            except Exception:
-                return False
-        try:
-            if isinstance(value, (int, float, bool)):
-                int_val = int(value)
-            else:
-                text = str(value).strip()
-                if not text:
-                    return False
-                int_val = int(text)
-        except Exception:
-            return False
-        return self.set_stadium_field_value(
+        return self._set_record_field_value_typed(
+            "stadium",
             stadium_index,
             offset,
             start_bit,
             length,
-            int_val,
+            value,
             requires_deref=requires_deref,
             deref_offset=deref_offset,
+            field_type=field_type,
+            byte_length=byte_length,
             deref_cache=deref_cache,
         )
 
@@ -3881,9 +5238,6 @@ class PlayerDataModel:
     def _player_flag_entry(self, entry_name: str) -> dict | None:
         if entry_name in self._player_flag_entries:
             return self._player_flag_entries[entry_name]
-        # Local import to avoid widening the public surface of core.offsets
-        from ..core.offsets import _find_offset_entry  # type: ignore
-
         entry = _find_offset_entry(entry_name, "Vitals") or _find_offset_entry(entry_name)
         self._player_flag_entries[entry_name] = entry
         return entry
@@ -3894,25 +5248,115 @@ class PlayerDataModel:
         entry = self._player_flag_entry(entry_name)
         if not entry:
             return False
-        cached = self._player_flag_cache.setdefault(entry_name, {})
-        if player.index in cached:
-            return cached[player.index]
-        record_addr = self._player_record_address(player.index, record_ptr=getattr(player, "record_ptr", None))
+        idx = player.index
+        column = self._player_flag_column(entry_name, idx + 1) if idx >= 0 else None
+        if column is not None and column[idx] != _FLAG_UNKNOWN:
+            return column[idx] == _FLAG_TRUE
+        record_addr = self._player_record_address(idx, record_ptr=getattr(player, "record_ptr", None))
         if record_addr is None:
-            cached[player.index] = False
+            if column is not None:
+                column[idx] = _FLAG_FALSE
             return False
         value = self.decode_field_value(
             entity_type="player",
-            entity_index=player.index,
+            entity_index=idx,
             category="Vitals",
             field_name=entry_name,
             meta=entry,
             record_ptr=record_addr,
         )
         flag = bool(to_int(value))
-        cached[player.index] = flag
+        if column is not None:
+            column[idx] = _FLAG_TRUE if flag else _FLAG_FALSE
         return flag
 
+    def _player_flag_column(self, entry_name: str, size: int) -> bytearray:
+        """Cached ``_FLAG_*`` state of ``entry_name`` for each player index, grown to at least ``size`` entries."""
+        column = self._player_flag_cache.get(entry_name)
+        if column is None:
+            column = self._player_flag_cache[entry_name] = bytearray(size)
+        elif len(column) < size:
+            column.extend(bytes(size - len(column)))
+        return column
+
+    def _player_flag_columns_ready(self, entry_names: Sequence[str]) -> bool:
+        """True when every loaded player already has a known state in each named flag column."""
+        players = self.players
+        if not players:
+            return False
+        count = max(p.index for p in players) + 1
+        for entry_name in entry_names:
+            column = self._player_flag_cache.get(entry_name)
+            if column is None or len(column) < count:
+                return False
+            if _FLAG_UNKNOWN in column[:count] and any(column[p.index] == _FLAG_UNKNOWN for p in players):
+                return False
+        return True
+
+    def _prime_player_flag_cache(self, entry_names: Sequence[str]) -> bool:
+        """
+        Fill ``_player_flag_cache`` for every loaded player from one read of the player table.
+
+        Only inline bitfields are handled; dereferenced or enumerated flags, and players whose
+        record does not sit at ``base + index * PLAYER_STRIDE``, are left to ``_read_player_flag``.
+        """
+        players = self.players
+        stride = PLAYER_STRIDE
+        if not players or stride <= 0:
+            return False
+        layouts: list[tuple[str, int, int, int, int]] = []
+        for entry_name in entry_names:
+            entry = self._player_flag_entry(entry_name)
+            if not entry:
+                return False
+            (
+                offset,
+                start_bit,
+                length_bits,
+                requires_deref,
+                deref_offset,
+                field_type,
+                byte_length,
+                values,
+            ) = self._extract_field_parts(entry)
+            if length_bits <= 0 and byte_length > 0:
+                length_bits = byte_length * 8
+            bytes_needed = (start_bit + length_bits + 7) // 8
+            if (
+                (requires_deref and deref_offset)
+                or values
+                or field_type_flags(field_type) & (TYPE_STRING | TYPE_FLOAT | TYPE_POINTER | TYPE_COLOR)
+                or length_bits <= 0
+                or offset < 0
+                or offset + bytes_needed > stride
+            ):
+                return False
+            layouts.append((entry_name, offset, start_bit, (1 << length_bits) - 1, bytes_needed))
+        base = self._resolve_player_base_ptr()
+        if base is None:
+            return False
+        count = max(p.index for p in players) + 1
+        table = self._read_table_block(base, count, stride)
+        if table is None or len(table) < count * stride:
+            return False
+        view = memoryview(table)
+        for entry_name, offset, start_bit, mask, bytes_needed in layouts:
+            if bytes_needed == 1:
+                # Strided slicing walks the column in C; each row yields its flag byte.
+                column = [(b >> start_bit) & mask for b in view[offset : count * stride : stride]]
+            else:
+                column = [
+                    (int.from_bytes(view[pos : pos + bytes_needed], "little") >> start_bit) & mask
+                    for pos in range(offset, count * stride, stride)
+                ]
+            states = bytearray(_FLAG_TRUE if bit else _FLAG_FALSE for bit in column)
+            for p in players:
+                record_ptr = getattr(p, "record_ptr", None)
+                if record_ptr and record_ptr != base + p.index * stride:
+                    states[p.index] = _FLAG_UNKNOWN
+            self._player_flag_cache[entry_name] = states
+        return True
+
     def is_player_draft_prospect(self, player: Player) -> bool:
         return self._read_player_flag(player, "IS_DRAFT_PROSPECT")
 
@@ -3924,6 +5368,9 @@ class PlayerDataModel:
             return []
         if not self._player_flag_entry("IS_DRAFT_PROSPECT"):
             return []
+        entry_names = ("IS_DRAFT_PROSPECT",)
+        if not self._player_flag_columns_ready(entry_names):
+            self._prime_player_flag_cache(entry_names)
         return [p for p in self.players if self.is_player_draft_prospect(p)]
 
     def is_player_free_agent_group(self, player: Player) -> bool:
@@ -3939,12 +5386,31 @@ class PlayerDataModel:
         entry_hidden = self._player_flag_entry("IS_HIDDEN")
         entry_draft = self._player_flag_entry("IS_DRAFT_PROSPECT")
         if not entry_hidden or not entry_draft:
-            return self._get_free_agents()
-        return [p for p in self.players if self.is_player_free_agent_group(p)]
+            return list(self._get_free_agents())
+        players = self.players
+        entry_names = ("IS_HIDDEN", "IS_DRAFT_PROSPECT")
+        if self._player_flag_columns_ready(entry_names) or self._prime_player_flag_cache(entry_names):
+            hidden = self._player_flag_column("IS_HIDDEN", 0)
+            draft = self._player_flag_column("IS_DRAFT_PROSPECT", 0)
+            # Primed columns decide most players outright; only unknown states (relocated
+            # records) go back through the per-player read.
+            mask = (
+                self.is_player_free_agent_group(p)
+                if hidden[p.index] == _FLAG_UNKNOWN or draft[p.index] == _FLAG_UNKNOWN
+                else hidden[p.index] == _FLAG_FALSE and draft[p.index] == _FLAG_FALSE
+                for p in players
+            )
+            return list(itertools.compress(players, mask))
+        return [p for p in players if self.is_player_free_agent_group(p)]
+
+    def _get_free_agents(self) -> tuple[Player, ...]:
+        """
+        Return the free agents as a cached tuple.
 
-    def _get_free_agents(self) -> list[Player]:
+        The tuple is shared between calls, so public callers copy it into a list once.
+        """
         if self._cached_free_agents:
-            return list(self._cached_free_agents)
+            return self._cached_free_agents
         if not self.players:
             players = self._scan_all_players(self.max_players)
             if players:
@@ -3952,18 +5418,36 @@ class PlayerDataModel:
                 self._apply_team_display_to_players(self.players)
                 self._build_name_index_map_async()
         if not self.players:
-            return []
-        free_agents = [p for p in self.players if p.team_id == FREE_AGENT_TEAM_ID]
-        if free_agents:
-            self._cached_free_agents = list(free_agents)
-            return list(free_agents)
-        assigned = self._collect_assigned_player_indexes()
-        if assigned:
-            free_agents = [p for p in self.players if p.index not in assigned]
-        else:
-            free_agents = [p for p in self.players if (p.team or "").strip().lower().startswith("free")]
-        self._cached_free_agents = list(free_agents)
-        return list(free_agents)
+            return ()
+        column = self._player_team_id_column()
+        free_agents = tuple(itertools.compress(self.players, map(FREE_AGENT_TEAM_ID.__eq__, column)))
+        if not free_agents:
+            assigned = self._collect_assigned_player_indexes()
+            if assigned:
+                assigned_flags = map(assigned.__contains__, self._player_index_column())
+                free_agents = tuple(itertools.compress(self.players, map(operator.not_, assigned_flags)))
+            else:
+                free_agents = tuple(p for p in self.players if (p.team or "").strip().lower().startswith("free"))
+        self._cached_free_agents = free_agents
+        return free_agents
+
+
+# Route names produced by PlayerDataModel._classify_coerce_route.
+_COERCE_HANDLERS = {
+    "string": PlayerDataModel._coerce_string,
+    "weight": PlayerDataModel._coerce_weight,
+    "float": PlayerDataModel._coerce_float,
+    "enum": PlayerDataModel._coerce_enum,
+    "team_pointer": PlayerDataModel._coerce_team_pointer,
+    "hex": PlayerDataModel._coerce_hex,
+    "height": PlayerDataModel._coerce_height,
+    "rating": PlayerDataModel._coerce_rating,
+    "minmax_potential": PlayerDataModel._coerce_minmax_potential,
+    "tendency": PlayerDataModel._coerce_tendency,
+    "year": PlayerDataModel._coerce_year,
+    "badge": PlayerDataModel._coerce_badge,
+    "int": PlayerDataModel._coerce_int,
+}
 
 
 __all__ = ["PlayerDataModel"]
@@ -1,9 +1,78 @@
 """Typed definitions and schema metadata placeholders."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TypedDict, NotRequired
 
+# Bits of FieldMetadata.type_flags / field_type_flags().
+TYPE_STRING = 1
+TYPE_FLOAT = 2
+TYPE_POINTER = 4
+TYPE_COLOR = 8
+
+
+@lru_cache(maxsize=256)
+def field_type_flags(field_type: str | None) -> int:
+    """Classify a schema type string into TYPE_* bits (substring match, case-insensitive)."""
+    ftype = str(field_type or "").strip().lower()
+    flags = 0
+    if any(tag in ftype for tag in ("string", "text", "wstring", "wstr", "utf16", "wide", "char")):
+        flags |= TYPE_STRING
+    if "float" in ftype or "double" in ftype:
+        flags |= TYPE_FLOAT
+    if "pointer" in ftype or "ptr" in ftype:
+        flags |= TYPE_POINTER
+    if "color" in ftype:
+        flags |= TYPE_COLOR
+    return flags
+
+
+@lru_cache(maxsize=256)
+def field_value_kind(field_type: str | None) -> str:
+    """
+    Return how an editor control holds a field's value: ``"text"``, ``"float"`` or ``"int"``.
+
+    Mirrors the editors' substring checks (pointers are shown as text); memoized because the
+    type vocabulary is tiny and the check runs for every field on each load and save.
+    """
+    ftype = str(field_type or "").lower()
+    if any(tag in ftype for tag in ("string", "text", "char", "pointer", "wide")):
+        return "text"
+    if "float" in ftype:
+        return "float"
+    return "int"
+
+
+def effective_byte_length(byte_length_hint: int, length_bits: int, default: int = 4) -> int:
+    """
+    Heuristically derive a byte length from schema hints.
+    Offsets often store either a bit-length or a byte-length; handle both.
+    """
+    if byte_length_hint and byte_length_hint > 0:
+        if byte_length_hint > 8 and byte_length_hint % 8 == 0:
+            # Likely provided as bits (e.g., 32, 64)
+            return max(1, byte_length_hint // 8)
+        return max(1, byte_length_hint)
+    if length_bits and length_bits > 0:
+        return max(1, (int(length_bits) + 7) // 8)
+    return max(1, default)
+
+
+@lru_cache(maxsize=1024)
+def field_bit_layout(start_bit: int, length: int, byte_length: int, type_flags: int) -> tuple[int, int, int, int]:
+    """
+    Return ``(length_bits, bytes_needed, mask, read_len)`` for a field's declared geometry.
+
+    ``length_bits`` falls back to ``byte_length * 8`` when no bit length is given; ``read_len``
+    is the byte width of a float field's value and ``bytes_needed`` for everything else.
+    """
+    length_bits = length if length > 0 else (byte_length * 8 if byte_length > 0 else length)
+    bytes_needed = (start_bit + length_bits + 7) // 8 if length_bits > 0 else 0
+    mask = (1 << length_bits) - 1 if length_bits > 0 else 0
+    read_len = effective_byte_length(byte_length, length_bits, default=4) if type_flags & TYPE_FLOAT else bytes_needed
+    return length_bits, bytes_needed, mask, read_len
+
 
 class PreparedImportRows(TypedDict):
     header: list[str]
@@ -27,6 +96,16 @@ class FieldMetadata:
     values: tuple[str, ...] | None = None
     data_type: str | None = None
     byte_length: int = 0
+    type_flags: int = field(default=0, init=False, repr=False, compare=False)
+    bytes_needed: int = field(default=0, init=False, repr=False, compare=False)
+    mask: int = field(default=0, init=False, repr=False, compare=False)
+    read_len: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.type_flags = field_type_flags(self.data_type)
+        _, self.bytes_needed, self.mask, self.read_len = field_bit_layout(
+            self.start_bit, self.length, self.byte_length, self.type_flags
+        )
 
 
 FieldWriteSpec = tuple[int, int, int, int, bool, int]
@@ -44,4 +123,17 @@ class ExportFieldSpec(TypedDict):
     meta: dict[str, object]
 
 
-__all__ = ["PreparedImportRows", "FieldMetadata", "FieldWriteSpec", "ExportFieldSpec"]
+__all__ = [
+    "PreparedImportRows",
+    "FieldMetadata",
+    "FieldWriteSpec",
+    "ExportFieldSpec",
+    "TYPE_STRING",
+    "TYPE_FLOAT",
+    "TYPE_POINTER",
+    "TYPE_COLOR",
+    "field_type_flags",
+    "field_value_kind",
+    "effective_byte_length",
+    "field_bit_layout",
+]
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from nba2k_editor.core.conversions import (
+    RATING_MIN,
+    _compute_raw_to_rating,
+    convert_raw_to_rating,
+)
+
+
+def test_rating_table_matches_proportional_mapping():
+    for length in (1, 7, 8, 10):
+        for raw in range(1 << length):
+            assert convert_raw_to_rating(raw, length) == _compute_raw_to_rating(raw, length)
+    # Out-of-range and wide inputs skip the table.
+    assert convert_raw_to_rating(-1, 8) == RATING_MIN
+    assert convert_raw_to_rating(300, 8) == _compute_raw_to_rating(300, 8)
+    assert convert_raw_to_rating(1 << 20, 24) == _compute_raw_to_rating(1 << 20, 24)
+
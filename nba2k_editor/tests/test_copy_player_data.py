@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import struct
+
+from nba2k_editor.models.data_model import PlayerDataModel
+
+SRC = 0x1000
+DST = 0x2000
+HEAP = 0x9000
+
+
+class _FakeMem:
+    def __init__(self) -> None:
+        self.hproc = 1
+        self.base_addr = 0x140000000
+        self.buf = bytearray(0x10000)
+        self.reads: list[tuple[int, int]] = []
+        self.writes: list[tuple[int, int]] = []
+
+    def open_process(self) -> bool:
+        return True
+
+    def read_bytes(self, addr: int, length: int) -> bytes:
+        self.reads.append((addr, length))
+        return bytes(self.buf[addr : addr + length])
+
+    def write_bytes(self, addr: int, data: bytes) -> None:
+        self.writes.append((addr, len(data)))
+        self.buf[addr : addr + len(data)] = data
+
+    def read_uint64(self, addr: int) -> int:
+        return struct.unpack_from("<Q", self.buf, addr)[0]
+
+
+def _model(mem: _FakeMem) -> PlayerDataModel:
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    model.mem = mem
+    model.external_loaded = False
+    model._record_buf_cache = None
+    model._category_key_cache = None
+    model._copy_spec_cache = None
+    model._bulk_deref_caches = None
+    model.categories = {
+        "Attributes": [
+            {"name": "Speed", "offset": 0x10, "startBit": 3, "length": 5},
+            {"name": "Height", "offset": 0x20, "length": 32, "type": "Float"},
+        ],
+        "Tendencies": [
+            {"name": "Shot", "offset": 0x4, "length": 8, "requiresDereference": True, "dereferenceAddress": 0x40},
+        ],
+    }
+    model._player_record_address = lambda index, record_ptr=None: SRC if index == 0 else DST  # type: ignore[method-assign]
+    return model
+
+
+def test_copy_player_data_splices_inline_fields_with_one_write() -> None:
+    mem = _FakeMem()
+    mem.buf[SRC + 0x10] = 0b1010_1000
+    struct.pack_into("<f", mem.buf, SRC + 0x20, 6.5)
+    mem.buf[DST + 0x10] = 0b0000_0111
+    mem.buf[DST + 0x11] = 0xEE
+    struct.pack_into("<Q", mem.buf, SRC + 0x40, HEAP)
+    struct.pack_into("<Q", mem.buf, DST + 0x40, HEAP + 0x100)
+    mem.buf[HEAP + 0x4] = 0x5A
+    model = _model(mem)
+
+    assert model.copy_player_data(0, 1, ["attributes", "tendencies"]) is True
+
+    assert mem.buf[DST + 0x10] == 0b1010_1111
+    assert mem.buf[DST + 0x11] == 0xEE
+    assert struct.unpack_from("<f", mem.buf, DST + 0x20)[0] == 6.5
+    assert mem.buf[HEAP + 0x104] == 0x5A
+    assert (DST + 0x10, 0x14) in mem.writes
+    assert [w for w in mem.writes if DST <= w[0] < DST + 0x100] == [(DST + 0x10, 0x14)]
+
+
+def test_category_key_lookup_is_case_insensitive_and_tracks_reassignment() -> None:
+    model = _model(_FakeMem())
+
+    assert model._category_key_for_lower("attributes") == "Attributes"
+    assert model._category_key_for_lower("badges") is None
+
+    model.categories = {"Badges": []}
+    assert model._category_key_for_lower("badges") == "Badges"
+    assert model._category_key_for_lower("attributes") is None
+
+
+def test_category_copy_specs_are_parsed_once_per_categories_dict() -> None:
+    model = _model(_FakeMem())
+
+    specs = model._category_copy_specs("Attributes")
+    assert specs == ((0x10, 3, 5, False, 0, "", 5), (0x20, 0, 32, False, 0, "float", 32))
+    assert model._category_copy_specs("Attributes") is specs
+
+    model.categories = dict(model.categories)
+    assert model._category_copy_specs("Attributes") is not specs
+
+
+def test_write_field_bits_skips_read_for_whole_byte_fields() -> None:
+    mem = _FakeMem()
+    mem.buf[DST + 0x8 : DST + 0xA] = b"\xff\xff"
+    model = _model(mem)
+
+    assert model._write_field_bits(DST, 0x8, 0, 16, 0x1234) is True
+    assert mem.reads == []
+    assert mem.buf[DST + 0x8 : DST + 0xA] == b"\x34\x12"
+
+    assert model._write_field_bits(DST, 0x8, 4, 4, 0xA) is True
+    assert mem.buf[DST + 0x8] == 0xA4
+    assert mem.buf[DST + 0x9] == 0x12
+
+
+def test_apply_field_assignments_coalesces_touching_fields() -> None:
+    mem = _FakeMem()
+    mem.buf[DST + 0x10 : DST + 0x14] = b"\xff\xff\xff\xff"
+    struct.pack_into("<Q", mem.buf, DST + 0x40, HEAP)
+    model = _model(mem)
+    assignments = [
+        (0x10, 0, 4, 0x1, False, 0),
+        (0x10, 4, 12, 0x234, False, 0),
+        (0x12, 0, 8, 0x56, False, 0),
+        (0x30, 0, 8, 0x78, False, 0),
+        (0x4, 0, 8, 0x9A, True, 0x40),
+    ]
+
+    assert model._apply_field_assignments(DST, assignments) == 5
+
+    assert mem.buf[DST + 0x10 : DST + 0x14] == b"\x41\x23\x56\xff"
+    assert mem.buf[DST + 0x30] == 0x78
+    assert mem.buf[HEAP + 0x4] == 0x9A
+    assert [w for w in mem.writes if DST <= w[0] < DST + 0x20] == [(DST + 0x10, 3)]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from nba2k_editor.models.data_model import PlayerDataModel, _setter_int
+from nba2k_editor.models.schema import TYPE_COLOR, TYPE_FLOAT, TYPE_POINTER, TYPE_STRING, FieldMetadata, field_bit_layout
+
+
+def _coerce(model: PlayerDataModel, category: str, field_name: str, value: object, **overrides: object):
+    kwargs: dict[str, object] = {
+        "entity_type": "player",
+        "category": category,
+        "field_name": field_name,
+        "display_value": value,
+        "field_type": "Integer",
+        "values": None,
+        "length_bits": 8,
+        "length_raw": 8,
+        "byte_length": 1,
+    }
+    kwargs.update(overrides)
+    return model._coerce_field_value(**kwargs)
+
+
+def test_coerce_routes_follow_rule_precedence_and_are_cached() -> None:
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    model._coerce_route_cache = {}
+
+    assert _coerce(model, "Vitals", "Weight", "215.5", field_type="Float") == ("weight", 215.5, 0, "")
+    assert _coerce(model, "Vitals", "Nickname", "Flash", field_type="WString", length_raw=16) == (
+        "string",
+        "Flash",
+        16,
+        "utf16",
+    )
+    assert _coerce(model, "Vitals", "Hand", "Left", values=["Right", "Left"]) == ("int", 1, 0, "")
+    assert _coerce(model, "Vitals", "Jersey", "0x1ff", field_type="Pointer") == ("int", 0xFF, 0, "")
+    assert _coerce(model, "Vitals", "Jersey", "abc") == ("skip", None, 0, "")
+    assert _coerce(model, "Badges", "Deadeye", 99, length_bits=3)[0:2] == ("int", 4)
+
+    route_count = len(model._coerce_route_cache)
+    _coerce(model, "Vitals", "Weight", "230", field_type="Float")
+    assert len(model._coerce_route_cache) == route_count
+
+
+def test_field_metadata_precomputes_type_flags() -> None:
+    assert FieldMetadata(0, 0, 32, data_type="WString").type_flags == TYPE_STRING
+    assert FieldMetadata(0, 0, 32, data_type=" Float ").type_flags == TYPE_FLOAT
+    assert FieldMetadata(0, 0, 64, data_type="Color Pointer").type_flags == TYPE_POINTER | TYPE_COLOR
+    assert FieldMetadata(0, 0, 8).type_flags == 0
+    assert FieldMetadata(0, 0, 8, data_type="Integer") == FieldMetadata(0, 0, 8, data_type="Integer")
+
+
+def test_format_hex_value_pads_and_masks_to_field_width() -> None:
+    model = PlayerDataModel.__new__(PlayerDataModel)
+
+    assert model._format_hex_value(-1, 12, 0) == "0xFFF"
+    assert model._format_hex_value(0xABC, 0, 0) == "0x00000ABC"
+    assert model._format_hex_value(5, 0, 64) == "0x0000000000000005"
+
+
+def test_field_metadata_precomputes_bit_layout():
+    packed = FieldMetadata(4, 3, 10)
+    assert (packed.bytes_needed, packed.mask, packed.read_len) == (2, 0x3FF, 2)
+    from_bytes = FieldMetadata(0, 0, 0, byte_length=2)
+    assert (from_bytes.bytes_needed, from_bytes.mask) == (2, 0xFFFF)
+    double = FieldMetadata(0, 0, 64, data_type="Double")
+    assert double.read_len == 8
+    assert field_bit_layout(3, 10, 0, 0) == (10, 2, 0x3FF, 2)
+    assert field_bit_layout(0, 0, 0, 0) == (0, 0, 0, 0)
+
+
+def test_setter_int_parses_numbers_decimal_and_hex_text():
+    assert _setter_int(True) == 1
+    assert _setter_int(7.9) == 7
+    assert _setter_int(" 42 ") == 42
+    assert _setter_int("0x1F") == 31
+    assert _setter_int("") is None
+    assert _setter_int("abc") is None
+    assert _setter_int(float("inf")) is None
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from nba2k_editor.memory.game_memory import GameMemory
+
+
+def _make_mem(values: dict[int, int], missing_pages: set[int] | None = None):
+    mem = GameMemory()
+    mem.hproc = 1
+    mem.base_addr = 0x140000000
+    calls: list[tuple[int, int]] = []
+    missing = missing_pages or set()
+
+    def fake_read_bytes(addr: int, length: int) -> bytes:
+        calls.append((addr, length))
+        for page in range(addr, addr + length, 0x1000):
+            if page in missing:
+                raise RuntimeError("unreadable")
+        buf = bytearray(length)
+        for value_addr, value in values.items():
+            for i, byte in enumerate(struct.pack("<Q", value)):
+                offset = value_addr + i - addr
+                if 0 <= offset < length:
+                    buf[offset] = byte
+        return bytes(buf)
+
+    mem.read_bytes = fake_read_bytes  # type: ignore[method-assign]
+    return mem, calls
+
+
+def test_read_uint64_many_coalesces_contiguous_pages():
+    values = {0x10008: 0x1111, 0x11010: 0x2222, 0x30000: 0x3333}
+    mem, calls = _make_mem(values)
+    result = mem.read_uint64_many([0x10008, 0x11010, 0x30000])
+    assert result == [0x1111, 0x2222, 0x3333]
+    assert calls == [(0x10000, 0x2000), (0x30000, 0x1000)]
+    # Cached pages are reused until the cache is cleared.
+    assert mem.read_uint64_many([0x10008]) == [0x1111]
+    assert len(calls) == 2
+    mem.clear_page_cache()
+    mem.read_uint64_many([0x10008])
+    assert len(calls) == 3
+
+
+def test_read_uint64_many_handles_page_straddle_and_unreadable_pages():
+    values = {0x10FFC: 0xAABBCCDD11223344}
+    mem, _calls = _make_mem(values, missing_pages={0x50000})
+    assert mem.read_uint64_many([0x10FFC, 0x50010]) == [0xAABBCCDD11223344, None]
+
+
+def test_read_uint64_offsets_reads_nearby_offsets_together():
+    base = 0x20000
+    mem, calls = _make_mem({base + 0x40: 0x1111, base + 0x58: 0x2222, base + 0x3000: 0x3333})
+    assert mem.read_uint64_offsets(base, [0x58, 0x40, 0x3000, 0x40]) == {0x40: 0x1111, 0x58: 0x2222, 0x3000: 0x3333}
+    assert calls == [(base + 0x40, 0x20), (base + 0x3000, 8)]
+
+
+def test_fixed_string_writes_reuse_scratch_and_pad_field():
+    mem = GameMemory()
+    writes: list[tuple[int, bytes]] = []
+    mem.write_bytes = lambda addr, data: writes.append((addr, bytes(data)))  # type: ignore[method-assign]
+
+    mem.write_wstring_fixed(0x100, "LeBron", 4)
+    mem.write_ascii_fixed(0x200, "Oké", 6)
+    scratch = mem._str_scratch
+    mem.write_wstring_fixed(0x300, "", 2)
+
+    assert writes == [
+        (0x100, "LeB".encode("utf-16le") + b"\x00\x00"),
+        (0x200, b"Ok\x00\x00\x00\x00"),
+        (0x300, b"\x00\x00\x00\x00"),
+    ]
+    assert mem._str_scratch is scratch
+
+
+def test_session_validates_process_once(monkeypatch):
+    from nba2k_editor.memory import game_memory as game_memory_mod
+
+    monkeypatch.setattr(game_memory_mod.sys, "platform", "win32")
+    mem = GameMemory()
+    mem.pid = 42
+    mem.hproc = 1
+    mem.base_addr = 0
+    lookups: list[int] = []
+    mem.find_pid = lambda: lookups.append(1) or 42  # type: ignore[method-assign]
+
+    with mem.session() as ok:
+        assert ok is True
+        with mem.session():
+            assert all(mem.open_process() for _ in range(5))
+    assert len(lookups) == 1
+    # The validated handle stays trusted until a read finds the process gone.
+    assert mem.open_process() is True
+    assert len(lookups) == 1
+
+    exit_codes = [game_memory_mod.STILL_ACTIVE]
+
+    def fake_exit_code(_handle, code):
+        code._obj.value = exit_codes[0]
+        return True
+
+    monkeypatch.setattr(game_memory_mod, "GetExitCodeProcess", fake_exit_code)
+    monkeypatch.setattr(game_memory_mod.ctypes, "get_last_error", lambda: 299, raising=False)
+    monkeypatch.setattr(game_memory_mod, "ReadProcessMemory", lambda *_args: False)
+    # A partial copy from a live process (e.g. probing the end of a region) keeps the handle.
+    with pytest.raises(RuntimeError):
+        mem.read_bytes(0x1000, 4)
+    assert mem.open_process() is True
+    assert len(lookups) == 1
+
+    def failing_rpm(*_args):
+        raise OSError("process exited")
+
+    exit_codes[0] = 0
+    monkeypatch.setattr(game_memory_mod, "ReadProcessMemory", failing_rpm)
+    with pytest.raises(OSError):
+        mem.read_bytes(0x1000, 4)
+    assert mem.open_process() is True
+    assert len(lookups) == 2
+
+
+def test_read_into_fills_caller_buffer(monkeypatch):
+    import ctypes
+
+    from nba2k_editor.memory import game_memory as game_memory_mod
+
+    source = bytes(range(16))
+
+    def fake_rpm(_handle, addr, buf, length, read_count):
+        ctypes.memmove(buf, source[addr.value : addr.value + length], length)
+        read_count._obj.value = length
+        return True
+
+    monkeypatch.setattr(game_memory_mod, "ReadProcessMemory", fake_rpm)
+    mem = GameMemory()
+    mem.hproc = 1
+    mem.base_addr = 0
+    target = bytearray(b"\xff" * 6)
+    assert mem.read_into(4, target, 4) == 4
+    assert target == bytes(range(4, 8)) + b"\xff\xff"
+    assert mem.read_bytes(10, 3) == bytes([10, 11, 12])
+
+
+def test_string_reads_stop_at_terminator():
+    mem = GameMemory()
+    # "AĀ" encodes as 41 00 00 01: the zero pair at offset 1 is not a terminator.
+    wide = "AĀB".encode("utf-16le") + b"\x00\x00" + "junk".encode("utf-16le")
+    mem.read_bytes = lambda addr, length: (wide if addr == 0 else b"Hi\x00there")[:length]  # type: ignore[method-assign]
+    assert mem.read_wstring(0, 9) == "AĀB"
+    assert mem.read_ascii(1, 8) == "Hi"
+
+
+def test_small_reads_share_per_thread_scratch(monkeypatch):
+    import ctypes
+
+    from nba2k_editor.memory import game_memory as game_memory_mod
+
+    source = struct.pack("<QQ", 0x1122334455667788, 0xAABBCCDD)
+
+    def fake_rpm(_handle, addr, buf, length, read_count):
+        start = addr.value - 0x1000
+        ctypes.memmove(buf, source[start : start + length], length)
+        read_count._obj.value = length
+        return True
+
+    monkeypatch.setattr(game_memory_mod, "ReadProcessMemory", fake_rpm)
+    mem = GameMemory()
+    mem.hproc = 1
+    mem.base_addr = 0
+    assert mem.read_uint64(0x1000) == 0x1122334455667788
+    assert mem.read_uint32(0x1008) == 0xAABBCCDD
+    first = mem.read_small(0x1000, 2)
+    assert first.tobytes() == b"\x88\x77"
+    second = mem.read_small(0x1008, 2)
+    assert second.obj is first.obj
+    assert len(mem.read_small(0x1000, 16)) == 16
+    # Integer reads decode through aliases of the same scratch rather than a new buffer.
+    assert mem.read_uint64(0x1000) == 0x1122334455667788
+    assert mem._scratch_local.scratch[0].obj is first.obj
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import threading
+
+from nba2k_editor.models import data_model as data_model_mod
+from nba2k_editor.models.data_model import FREE_AGENT_TEAM_ID, PlayerDataModel
+from nba2k_editor.models.player import Player
+
+
+def _model(players: list[Player]) -> PlayerDataModel:
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    model.players = players
+    model.team_list = [(0, "Hawks"), (1, "Celtics")]
+    model._cached_free_agents = ()
+    model._team_name_index_cache = None
+    model._team_name_index_lower_cache = None
+    model._player_team_ids = None
+    model._player_team_ids_source = None
+    model._team_filter_index_cache = None
+    model._name_index_lock = threading.Lock()
+    model._name_index_build_token = 0
+    model._name_index_executor = None
+    model._name_index_future = None
+    return model
+
+
+def _roster() -> list[Player]:
+    return [
+        Player(0, "A", "One", "Hawks", 0),
+        Player(1, "B", "Two", "Celtics", 1),
+        Player(2, "C", "Three", "", None),
+        Player(3, "D", "Four", "Hawks", 0),
+    ]
+
+
+def test_get_players_by_team_filters_on_team_id_column() -> None:
+    model = _model(_roster())
+
+    assert [p.index for p in model.get_players_by_team("Hawks")] == [0, 3]
+    assert [p.index for p in model.get_players_by_team("Celtics")] == [1]
+
+
+def test_team_id_column_follows_roster_edits() -> None:
+    model = _model(_roster())
+    assert [p.index for p in model.get_players_by_team("Celtics")] == [1]
+
+    model.players[0].team_id = 1
+    model._build_name_index_map()
+    assert [p.index for p in model.get_players_by_team("Celtics")] == [0, 1]
+
+    model.players = [Player(7, "E", "Five", "Celtics", 1)]
+    assert [p.index for p in model.get_players_by_team("Celtics")] == [7]
+
+
+def test_mark_dirty_drops_player_column_snapshots() -> None:
+    model = _model(_roster())
+    model._dirty_entities = {}
+    model._player_flag_cache = {"IS_HIDDEN": bytearray(4)}
+    assert [p.index for p in model.get_players_by_team("Celtics")] == [1]
+
+    model.players[0].team_id = 1
+    model.mark_dirty("players")
+    assert model._player_flag_cache == {}
+    assert [p.index for p in model.get_players_by_team("Celtics")] == [0, 1]
+
+
+def test_team_display_name_to_pointer_uses_case_insensitive_index(monkeypatch) -> None:
+    monkeypatch.setattr(data_model_mod, "TEAM_STRIDE", 0x100)
+    model = _model(_roster())
+    model._resolve_team_base_ptr = lambda: 0x5000  # type: ignore[method-assign]
+
+    assert model._team_display_name_to_pointer(" celtics ") == 0x5100
+    assert model._team_display_name_to_pointer("Team 3") == 0x5300
+    assert model._team_display_name_to_pointer("Lakers") is None
+
+
+def test_free_agents_are_built_from_team_id_column_and_cached() -> None:
+    roster = _roster() + [Player(4, "F", "Six", "Free Agents", FREE_AGENT_TEAM_ID)]
+    model = _model(roster)
+
+    free_agents = model._get_free_agents()
+    assert [p.index for p in free_agents] == [4]
+    assert model._cached_free_agents == free_agents
+    assert model._get_free_agents() is free_agents
+    assert [p.index for p in model.get_players_by_team("Free Agents")] == [4]
+
+
+def test_player_instances_use_slots() -> None:
+    player = Player(0, "A", "One", "Hawks", 0)
+
+    assert not hasattr(player, "__dict__")
+    assert set(Player.__slots__) >= {"index", "first_name", "last_name", "team", "team_id", "record_ptr"}
+
+
+def test_apply_team_display_maps_regular_and_special_team_ids() -> None:
+    roster = _roster() + [Player(4, "F", "Six", "", FREE_AGENT_TEAM_ID), Player(5, "G", "Seven", "Old", 9)]
+    model = _model(roster)
+    model.team_list = [(0, "Hawks (ID 0)"), (1, "Celtics"), (FREE_AGENT_TEAM_ID, "Free Agents")]
+    model._team_display_map_cache = None
+
+    model._apply_team_display_to_players(model.players)
+
+    assert [p.team for p in model.players] == ["Hawks (ID 0)", "Celtics", "", "Hawks (ID 0)", "Free Agents", "Old"]
+
+
+def test_name_matching_waits_for_background_index_build() -> None:
+    model = _model(_roster())
+    model.name_index_map = {}
+
+    model._build_name_index_map_async()
+
+    assert model._match_name_tokens("D", "Four") == [3]
+    assert model._name_index_future is not None and model._name_index_future.done()
+    assert model.name_index_map
+
+
+def test_free_agent_fallback_uses_index_column_against_assigned_rosters() -> None:
+    model = _model(_roster())
+    model._collect_assigned_player_indexes = lambda: {0, 1}  # type: ignore[method-assign]
+
+    assert [p.index for p in model._get_free_agents()] == [2, 3]
+    assert list(model._player_index_column()) == [0, 1, 2, 3]
+
+
+def test_lru_cache_evicts_least_recently_used_key() -> None:
+    cache = data_model_mod._LRUCache(2)
+    cache[1] = True
+    cache[2] = False
+    assert cache[1] is True
+    cache[3] = True
+
+    assert list(cache) == [1, 3]
+
+
+def test_get_players_by_team_fast_path_leaves_special_names_to_slow_path() -> None:
+    roster = _roster() + [Player(4, "F", "Six", "Free Agents", FREE_AGENT_TEAM_ID)]
+    model = _model(roster)
+    model.team_list = [(0, "Hawks"), (1, "Celtics"), (FREE_AGENT_TEAM_ID, "Free Agents")]
+
+    assert model._team_filter_index() == {"Hawks": 0, "Celtics": 1}
+    assert [p.index for p in model.get_players_by_team(" Hawks ")] == [0, 3]
+    assert [p.index for p in model.get_players_by_team("Free Agents")] == [4]
+    assert len(model.get_players_by_team("All Players")) == 5
+
+
+def test_free_agents_by_flags_reads_player_table_once(monkeypatch) -> None:
+    stride = 0x20
+    base = 0x9000
+    monkeypatch.setattr(data_model_mod, "PLAYER_STRIDE", stride)
+    table = bytearray(4 * stride)
+    table[1 * stride + 5] = 0b0000_0100  # player 1 hidden (bit 2)
+    table[2 * stride + 6] = 0b0000_0001  # player 2 draft prospect (bit 0)
+
+    class _Mem:
+        reads: list[tuple[int, int]] = []
+
+        def open_process(self) -> bool:
+            return True
+
+        def read_bytes(self, addr: int, length: int) -> bytes:
+            self.reads.append((addr, length))
+            return bytes(table[addr - base : addr - base + length])
+
+    model = _model(_roster())
+    model.mem = _Mem()
+    model._player_flag_cache = {}
+    model._dirty_entities = {}
+    model._player_flag_entries = {
+        "IS_HIDDEN": {"offset": 5, "startBit": 2, "length": 1},
+        "IS_DRAFT_PROSPECT": {"offset": 6, "startBit": 0, "length": 1},
+    }
+    model._resolve_player_base_ptr = lambda: base  # type: ignore[method-assign]
+
+    assert [p.index for p in model.get_free_agents_by_flags()] == [0, 3]
+    assert [p.index for p in model.get_draft_prospects()] == [2]
+    # Once the flag columns are filled, switching filters does not re-read the table.
+    assert [p.index for p in model.get_free_agents_by_flags()] == [0, 3]
+    assert model.mem.reads == [(base, 4 * stride)]
+    model.mark_dirty("players")
+    assert [p.index for p in model.get_draft_prospects()] == [2]
+    assert model.mem.reads == [(base, 4 * stride), (base, 4 * stride)]
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import struct
+
+from nba2k_editor.models.data_model import (
+    PlayerDataModel,
+    _PLAN_DISPLAY,
+    _PLAN_TABLE,
+    _U32,
+    _U64,
+    _decode_fixed_string,
+    _int_postprocessor,
+    _decode_string_column,
+    _unpack_int_column,
+)
+
+
+def test_decode_string_column_matches_per_row_decode():
+    stride = 16
+    records = [
+        "Young".encode("utf-16le").ljust(stride, b"\x00"),
+        b"\x00" * stride,
+        " Ball ".encode("utf-16le") + b"\x00\x00" + b"X\x00",
+    ]
+    buf = b"".join(records)
+    column = _decode_string_column(buf, 4, stride, 0, 6, "utf16")
+    assert column == ["Young", "", "Ball", ""]
+    view = memoryview(buf)
+    assert column[:3] == [_decode_fixed_string(view, row * stride, 6, "utf16").strip() for row in range(3)]
+
+
+def test_decode_string_column_ascii():
+    buf = b"ABC\x00zz" + b"DEFGHI"
+    assert _decode_string_column(buf, 2, 6, 0, 4, "ascii") == ["ABC", "DEFG"]
+
+
+def test_unpack_int_column_reads_strided_fields():
+    stride = 12
+    buf = b"".join(struct.pack("<IQ", i, 0x1000 + i) for i in range(3))
+    assert _unpack_int_column(buf, 3, stride, 4, _U64) == [0x1000, 0x1001, 0x1002]
+    assert _unpack_int_column(buf, 3, stride, 0, _U32) == [0, 1, 2]
+    # A short buffer falls back to per-row reads and marks missing rows.
+    assert _unpack_int_column(buf[:-4], 3, stride, 4, _U64) == [0x1000, 0x1001, None]
+
+
+def test_utf16_decode_stops_only_at_aligned_nul():
+    # "A\u0100" encodes as 41 00 00 01: the zero pair at offset 1 is not a terminator.
+    raw = "A\u0100\u4200".encode("utf-16le") + b"\x00\x00" + "Z".encode("utf-16le")
+    assert _decode_fixed_string(memoryview(raw), 0, 5, "utf16") == "A\u0100\u4200"
+
+
+def test_decode_field_value_from_buffer_aligned_and_packed_ints():
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    buf = bytearray(16)
+    struct.pack_into("<H", buf, 2, 0xBEEF)
+    buf[8] = 0b1011_0100
+
+    def _decode(meta):
+        return model.decode_field_value_from_buffer(
+            entity_type="player",
+            entity_index=0,
+            category="Misc",
+            field_name="Value",
+            meta=meta,
+            record_buffer=buf,
+        )
+
+    assert _decode({"offset": 2, "length": 16, "startBit": 0}) == 0xBEEF
+    assert _decode({"offset": 8, "length": 4, "startBit": 2}) == 0b1101
+    assert _decode({"offset": 15, "length": 16, "startBit": 0}) is None
+
+
+def test_decode_fields_from_buffer_matches_per_field_decode():
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    buf = bytearray(24)
+    struct.pack_into("<I", buf, 0, 0x12345678)
+    buf[5] = 0b1110_0110
+    buf[6:14] = "Bos".encode("utf-16le").ljust(8, b"\x00")
+    struct.pack_into("<f", buf, 16, 1.5)
+    fields = [
+        ("Id", {"offset": 0, "length": 32, "startBit": 0}),
+        ("Packed", {"offset": 5, "length": 5, "startBit": 3}),
+        ("Spanning", {"offset": 3, "length": 12, "startBit": 4}),
+        ("Name", {"offset": 6, "length": 4, "type": "wstring"}),
+        ("Scale", {"offset": 16, "length": 32, "type": "float"}),
+        ("Missing", {"offset": 22, "length": 32, "startBit": 0}),
+    ]
+    batched = model.decode_fields_from_buffer(
+        entity_type="league",
+        entity_index=0,
+        category="Seasons",
+        fields=fields,
+        record_buffer=buf,
+    )
+    expected = [
+        model.decode_field_value_from_buffer(
+            entity_type="league",
+            entity_index=0,
+            category="Seasons",
+            field_name=name,
+            meta=meta,
+            record_buffer=buf,
+        )
+        for name, meta in fields
+    ]
+    assert batched == expected
+    assert batched[0] == 0x12345678
+    assert batched[1] == 0b11100
+    assert batched[-1] is None
+
+
+def test_read_bitfield_uses_narrowest_reader_and_falls_back_at_region_end():
+    class _Mem:
+        def __init__(self, data: bytes) -> None:
+            self.data = data
+            self.calls: list[tuple[str, int, int]] = []
+
+        def read_bytes(self, addr: int, length: int) -> bytes:
+            self.calls.append(("bytes", addr, length))
+            if addr + length > len(self.data):
+                raise OSError("unmapped")
+            return self.data[addr : addr + length]
+
+        def read_uint8(self, addr: int) -> int:
+            self.calls.append(("u8", addr, 1))
+            return self.read_bytes(addr, 1)[0]
+
+        def read_uint32(self, addr: int) -> int:
+            self.calls.append(("u32", addr, 4))
+            return struct.unpack("<I", self.read_bytes(addr, 4))[0]
+
+    mem = _Mem(bytes([0b1011_0110, 0xAB, 0xCD]) + bytes(9))
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    model.mem = mem
+    assert model._read_bitfield(0, 1, 4) == 0b1011
+    assert model._read_bitfield(1, 4, 20) == 0xCDA
+    assert [call[0] for call in mem.calls] == ["u8", "bytes", "u32", "bytes"]
+    mem.calls.clear()
+    # Two-byte fields have no reader on this stub, so an exact read is used.
+    assert model._read_bitfield(1, 0, 16) == 0xCDAB
+    assert mem.calls == [("bytes", 1, 2)]
+    mem.calls.clear()
+    # Near the end of the region the dword window fails and an exact read is used.
+    assert model._read_bitfield(9, 0, 20) == 0
+    assert mem.calls[-1] == ("bytes", 9, 3)
+
+
+def test_compiled_field_plan_matches_per_field_decode_for_ratings():
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    buf = bytes(range(7, 7 + 16))
+    fields = [
+        ("Speed", {"offset": 1, "length": 7, "startBit": 1}),
+        ("Durability", {"offset": 3, "length": 16, "startBit": 0}),
+        ("Birth Year", {"offset": 5, "length": 8, "startBit": 0}),
+        ("Height", {"offset": 6, "length": 16, "startBit": 0}),
+    ]
+    plan = model._compile_field_plan(entity_type="player", category="Attributes", fields=fields, record_size=len(buf))
+    # 7-bit ratings use the lookup table, the 16-bit field is too wide and height keeps its display rule.
+    assert [step[0] for step in plan] == [_PLAN_TABLE, _PLAN_DISPLAY, _PLAN_TABLE, _PLAN_DISPLAY]
+    batched = model.decode_fields_from_buffer(
+        entity_type="player",
+        entity_index=0,
+        category="Attributes",
+        fields=fields,
+        record_buffer=buf,
+        plan=plan,
+    )
+    expected = [
+        model.decode_field_value_from_buffer(
+            entity_type="player",
+            entity_index=0,
+            category="Attributes",
+            field_name=name,
+            meta=meta,
+            record_buffer=buf,
+        )
+        for name, meta in fields
+    ]
+    assert batched == expected
+
+
+def test_int_postprocessor_dispatch_follows_category_and_name():
+    assert _int_postprocessor(True, "vitals", "height", "Height")(254 * 80, 16) == 80
+    assert _int_postprocessor(False, "vitals", "height", "Height")(5, 8) == 5
+    assert _int_postprocessor(True, "attributes", "speed", "Speed")(255, 8) == 99
+    assert _int_postprocessor(True, "potential", "min potential", "Min Potential")(10, 8) == 40
+    assert _int_postprocessor(True, "tendencies", "shot", "Shot")(150, 8) == 100
+    assert _int_postprocessor(True, "badges", "limitless", "Limitless")(9, 3) == 4
+    assert _int_postprocessor(True, "vitals", "misc", "Misc")(77, 8) == 77
+    assert _int_postprocessor(True, "vitals", "misc", "Misc") is _int_postprocessor(True, "vitals", "misc", "Misc")
+
+
+def test_decode_field_value_from_buffer_rejects_invalid_geometry_without_raising():
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    buf = bytearray(8)
+    struct.pack_into("<f", buf, 0, float("nan"))
+
+    def _decode(field_name, meta):
+        return model.decode_field_value_from_buffer(
+            entity_type="player",
+            entity_index=0,
+            category="Vitals",
+            field_name=field_name,
+            meta=meta,
+            record_buffer=buf,
+        )
+
+    assert _decode("Weight", {"offset": 0, "length": 32, "type": "float"}) is None
+    assert _decode("Value", {"offset": 0, "length": 4, "startBit": -1}) is None
+    assert _decode("Value", {"offset": 6, "length": 64, "type": "double"}) is None
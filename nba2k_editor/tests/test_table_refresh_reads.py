@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from nba2k_editor.models import data_model as data_model_mod
+from nba2k_editor.models.data_model import PlayerDataModel
+
+BASE = 0x200000
+RECORD = 0x40
+
+
+class _TableMem:
+    def __init__(self, table: bytes) -> None:
+        self.table = table
+        self.reads: list[tuple[int, int]] = []
+
+    def open_process(self) -> bool:
+        return True
+
+    def read_bytes(self, addr: int, length: int) -> bytes:
+        self.reads.append((addr, length))
+        offset = addr - BASE
+        return self.table[offset : offset + length].ljust(length, b"\x00")
+
+
+def _records(names: list[str]) -> bytes:
+    return b"".join((b"\x00" * 8 + name.encode("utf-16le")).ljust(RECORD, b"\x00") for name in names)
+
+
+def _model(monkeypatch, mem: _TableMem) -> PlayerDataModel:
+    monkeypatch.setattr(data_model_mod, "STADIUM_RECORD_SIZE", RECORD)
+    monkeypatch.setattr(data_model_mod, "MAX_STADIUM_SCAN", 4)
+    monkeypatch.setattr(data_model_mod, "STAFF_RECORD_SIZE", RECORD)
+    monkeypatch.setattr(data_model_mod, "MAX_STAFF_SCAN", 4)
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    model.mem = mem
+    model._record_buf_cache = None
+    model._bulk_deref_caches = None
+    model._held_bases = None
+    model._record_addr_cache = {}
+    model._dirty_entities = {"staff": True, "stadiums": True}
+    model._stadium_name_field = {"offset": 8, "length": 16, "encoding": "utf16"}
+    model._staff_name_fields = {"first": {"offset": 8, "length": 8, "encoding": "utf16"}, "last": None}
+    model._resolve_stadium_base_ptr = lambda: BASE  # type: ignore[method-assign]
+    model._resolve_staff_base_ptr = lambda: BASE  # type: ignore[method-assign]
+    return model
+
+
+def test_refresh_stadiums_reads_table_once(monkeypatch):
+    mem = _TableMem(_records(["State Farm Arena", "", "TD Garden", "\x01bad"]))
+    model = _model(monkeypatch, mem)
+    assert model.refresh_stadiums() == [(0, "State Farm Arena"), (2, "TD Garden")]
+    assert mem.reads == [(BASE, 4 * RECORD)]
+
+
+def test_refresh_staff_reads_table_once(monkeypatch):
+    mem = _TableMem(_records(["Quin", "Joe", "", "Erik"]))
+    model = _model(monkeypatch, mem)
+    assert model.refresh_staff() == [(0, "Quin"), (1, "Joe"), (3, "Erik")]
+    assert len(mem.reads) == 1
+
+
+def test_scan_team_names_decodes_from_one_block_read(monkeypatch):
+    mem = _TableMem(_records(["Hawks", "", "Celtics", "\x01bad"]))
+    mem.hproc = 1
+    mem.base_addr = 0x140000000
+    model = _model(monkeypatch, mem)
+    monkeypatch.setattr(data_model_mod, "TEAM_STRIDE", RECORD)
+    monkeypatch.setattr(data_model_mod, "TEAM_NAME_OFFSET", 8)
+    monkeypatch.setattr(data_model_mod, "TEAM_NAME_LENGTH", 16)
+    monkeypatch.setattr(data_model_mod, "TEAM_NAME_ENCODING", "utf16")
+    monkeypatch.setattr(data_model_mod, "MAX_TEAMS_SCAN", 4)
+    model._resolve_team_base_ptr = lambda: BASE  # type: ignore[method-assign]
+
+    assert model._scan_team_names() == [(0, "Hawks"), (2, "Celtics")]
+    assert mem.reads == [(BASE, 4 * RECORD)]
+
+
+def test_record_buffer_scope_reads_each_record_once(monkeypatch):
+    record = bytearray(RECORD)
+    record[0] = 7
+    record[1] = 0b0101_0000
+    mem = _TableMem(b"\x00" * RECORD + bytes(record))
+    model = _model(monkeypatch, mem)
+    fields = [
+        ("Capacity", {"offset": 0, "length": 8, "startBit": 0}),
+        ("Style", {"offset": 1, "length": 3, "startBit": 4}),
+    ]
+
+    def _decode_all() -> list[object]:
+        return [
+            model.decode_field_value(
+                entity_type="stadium",
+                entity_index=1,
+                category="Stadium",
+                field_name=name,
+                meta=meta,
+            )
+            for name, meta in fields
+        ]
+
+    with model.record_buffer_scope():
+        assert _decode_all() == [7, 0b101]
+        assert _decode_all() == [7, 0b101]
+    assert mem.reads == [(BASE + RECORD, RECORD)]
+    assert model._record_buf_cache is None
+
+
+def test_staff_record_address_cached_until_refresh(monkeypatch):
+    mem = _TableMem(_records(["Quin", "Joe"]))
+    model = _model(monkeypatch, mem)
+    resolves: list[int] = []
+
+    def _base() -> int:
+        resolves.append(1)
+        return BASE
+
+    model._resolve_staff_base_ptr = _base  # type: ignore[method-assign]
+    assert model._cached_record_address("staff", 1) == BASE + RECORD
+    assert model._cached_record_address("staff", 1) == BASE + RECORD
+    assert len(resolves) == 1
+    model.refresh_staff()
+    assert model._record_addr_cache == {}
+
+
+def test_float_setters_share_deref_cache(monkeypatch):
+    mem = _TableMem(_records(["Quin"]))
+    ptr_reads: list[int] = []
+    writes: list[tuple[int, bytes]] = []
+
+    def _read_uint64(addr: int) -> int:
+        ptr_reads.append(addr)
+        return 0x7000
+
+    mem.read_uint64 = _read_uint64  # type: ignore[attr-defined]
+    mem.write_bytes = lambda addr, data: writes.append((addr, bytes(data)))  # type: ignore[attr-defined]
+    model = _model(monkeypatch, mem)
+    cache: dict[int, int] = {}
+    for offset, value in ((0x10, 1.5), (0x14, 2.5)):
+        assert model.set_staff_field_value_typed(
+            0, offset, 0, 32, value, requires_deref=True, deref_offset=0x30, field_type="Float", deref_cache=cache
+        )
+    assert ptr_reads == [BASE + 0x30]
+    assert [addr for addr, _data in writes] == [0x7010, 0x7014]
+
+
+def test_bulk_write_shares_struct_pointers_per_record(monkeypatch):
+    mem = _TableMem(_records(["Quin", "Rae"]))
+    ptr_reads: list[int] = []
+
+    def _read_uint64(addr: int) -> int:
+        ptr_reads.append(addr)
+        return 0x7000
+
+    mem.read_uint64 = _read_uint64  # type: ignore[attr-defined]
+    mem.write_bytes = lambda addr, data: None  # type: ignore[attr-defined]
+    model = _model(monkeypatch, mem)
+    model._resolve_player_base_ptr = lambda: None  # type: ignore[method-assign]
+    model._resolve_team_base_ptr = lambda: None  # type: ignore[method-assign]
+    with model.bulk_write():
+        for index in (0, 0, 1):
+            assert model.set_staff_field_value_typed(
+                index, 0x10, 0, 32, 1.5, requires_deref=True, deref_offset=0x30, field_type="Float"
+            )
+    assert ptr_reads == [BASE + 0x30, BASE + RECORD + 0x30]
+    model.set_staff_field_value_typed(0, 0x10, 0, 32, 1.5, requires_deref=True, deref_offset=0x30, field_type="Float")
+    assert len(ptr_reads) == 3
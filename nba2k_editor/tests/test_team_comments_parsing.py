@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from nba2k_editor.models.data_model import PlayerDataModel
+
+
+def test_parse_team_comments_reads_decimal_and_hex_indexes(tmp_path):
+    table = tmp_path / "teams.CT"
+    table.write_text(
+        "<CheatTable>\n"
+        "  <Comments>\n"
+        "    0 - 76ers\n"
+        "    1 - Bucks\n"
+        "    1A - Legends - East\n"
+        "    not a team line\n"
+        "    0x20 - Skipped\n"
+        "  </Comments>\n"
+        "</CheatTable>\n",
+        encoding="utf-8",
+    )
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    mapping = model.parse_team_comments(str(table))
+    assert mapping == {0: "76ers", 1: "Bucks", 0x1A: "Legends - East"}
+
+
+def test_parse_team_comments_without_block_returns_empty(tmp_path):
+    table = tmp_path / "teams.CT"
+    table.write_text("<CheatTable></CheatTable>", encoding="utf-8")
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    assert model.parse_team_comments(str(table)) == {}
+    assert model.parse_team_comments(str(tmp_path / "missing.CT")) == {}
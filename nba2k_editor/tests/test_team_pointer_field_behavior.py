@@ -11,6 +11,7 @@ def test_decode_team_pointer_field_displays_team_name(monkeypatch) -> None:
 
     model = PlayerDataModel.__new__(PlayerDataModel)
     model.team_list = [(3, "Lakers")]
+    model._team_pointer_name_cache = None
     model._resolve_team_base_ptr = lambda: 0x1000  # type: ignore[method-assign]
 
     pointer = 0x1000 + (3 * 32)
@@ -35,6 +36,7 @@ def test_decode_non_team_pointer_field_stays_hex(monkeypatch) -> None:
 
     model = PlayerDataModel.__new__(PlayerDataModel)
     model.team_list = [(3, "Lakers")]
+    model._team_pointer_name_cache = None
     model._resolve_team_base_ptr = lambda: 0x1000  # type: ignore[method-assign]
 
     pointer = 0x1000 + (3 * 32)
@@ -60,6 +62,10 @@ def test_encode_team_pointer_field_accepts_team_name(monkeypatch) -> None:
     model = PlayerDataModel.__new__(PlayerDataModel)
     model.mem = SimpleNamespace(open_process=lambda: True)
     model.team_list = [(3, "Lakers")]
+    model._team_pointer_name_cache = None
+    model._team_name_index_cache = None
+    model._team_name_index_lower_cache = None
+    model._coerce_route_cache = {}
     model._resolve_team_base_ptr = lambda: 0x1000  # type: ignore[method-assign]
 
     captured: dict[str, int] = {}
@@ -90,3 +96,24 @@ def test_encode_team_pointer_field_accepts_team_name(monkeypatch) -> None:
 
     assert ok is True
     assert captured["value"] == 0x1060
+
+
+def test_team_pointer_names_are_cached_until_team_caches_reset(monkeypatch) -> None:
+    monkeypatch.setattr(data_model_mod, "TEAM_STRIDE", 32, raising=False)
+
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    model.team_list = [(3, "Lakers")]
+    model._team_pointer_name_cache = None
+    model._resolve_team_base_ptr = lambda: 0x1000  # type: ignore[method-assign]
+    lookups: list[int] = []
+    model._get_team_display_name = lambda idx: lookups.append(idx) or "Lakers"  # type: ignore[method-assign]
+
+    pointer = 0x1000 + (3 * 32)
+    assert model._team_pointer_to_display_name(pointer) == "Lakers"
+    assert model._team_pointer_to_display_name(pointer) == "Lakers"
+    assert model._team_pointer_to_display_name(pointer + 1) is None
+    assert lookups == [3]
+
+    model._invalidate_team_caches()
+    assert model._team_pointer_to_display_name(pointer) == "Lakers"
+    assert lookups == [3, 3]
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import struct
+from types import SimpleNamespace
+
+from nba2k_editor.models import data_model as data_model_mod
+from nba2k_editor.models.data_model import PlayerDataModel
+
+PLAYER_BASE = 0x10000
+TEAM_BASE = 0x80000
+STRIDE = 0x100
+
+
+class _FakeMem:
+    def __init__(self, memory: dict[int, bytes]) -> None:
+        self.hproc = 1
+        self.base_addr = 0x140000000
+        self.memory = memory
+        self.reads: list[tuple[int, int]] = []
+
+    def read_bytes(self, addr: int, length: int) -> bytes:
+        self.reads.append((addr, length))
+        out = bytearray(length)
+        for start, blob in self.memory.items():
+            for i, byte in enumerate(blob):
+                pos = start + i - addr
+                if 0 <= pos < length:
+                    out[pos] = byte
+        return bytes(out)
+
+    def read_uint64(self, addr: int) -> int:
+        return struct.unpack("<Q", self.read_bytes(addr, 8))[0]
+
+    def read_uint32(self, addr: int) -> int:
+        return struct.unpack("<I", self.read_bytes(addr, 4))[0]
+
+    def read_wstring(self, addr: int, max_chars: int) -> str:
+        return self.read_bytes(addr, max_chars * 2).decode("utf-16le").split("\x00", 1)[0]
+
+
+def _model(monkeypatch, mem: _FakeMem) -> PlayerDataModel:
+    monkeypatch.setattr(data_model_mod, "OFF_FIRST_NAME", 0x28)
+    monkeypatch.setattr(data_model_mod, "OFF_LAST_NAME", 0x0)
+    monkeypatch.setattr(data_model_mod, "NAME_MAX_CHARS", 20)
+    monkeypatch.setattr(data_model_mod, "FIRST_NAME_ENCODING", "utf16")
+    monkeypatch.setattr(data_model_mod, "LAST_NAME_ENCODING", "utf16")
+    monkeypatch.setattr(data_model_mod, "PLAYER_STRIDE", STRIDE)
+    monkeypatch.setattr(data_model_mod, "TEAM_STRIDE", 0x1000)
+    monkeypatch.setattr(data_model_mod, "TEAM_RECORD_SIZE", 0x1000)
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    model.mem = mem
+    model.max_players = 100
+    model.team_list = [(0, "Hawks")]
+    model._team_display_map_cache = None
+    model._scan_read_executor = None
+    model._roster_version = 0
+    model._assigned_indexes_cache = None
+    model._resolve_player_base_ptr = lambda: PLAYER_BASE  # type: ignore[method-assign]
+    model._resolve_team_base_ptr = lambda: TEAM_BASE  # type: ignore[method-assign]
+    return model
+
+
+def _roster_memory() -> dict[int, bytes]:
+    slots = [0] * data_model_mod.TEAM_PLAYER_SLOT_COUNT
+    slots[0] = PLAYER_BASE + 3 * STRIDE
+    slots[2] = PLAYER_BASE + 7 * STRIDE
+    memory = {TEAM_BASE: struct.pack(f"<{len(slots)}Q", *slots)}
+    for idx, first, last in ((3, "Trae", "Young"), (7, "Jalen", "Johnson")):
+        addr = PLAYER_BASE + idx * STRIDE
+        memory[addr] = last.encode("utf-16le")
+        memory[addr + 0x28] = first.encode("utf-16le")
+    return memory
+
+
+def test_scan_team_players_reads_slots_and_names_in_blocks(monkeypatch):
+    mem = _FakeMem(_roster_memory())
+    model = _model(monkeypatch, mem)
+    players = model.scan_team_players(0)
+    assert [(p.index, p.first_name, p.last_name, p.team) for p in players] == [
+        (3, "Trae", "Young", "Hawks"),
+        (7, "Jalen", "Johnson", "Hawks"),
+    ]
+    # One block for the roster slots plus one read per live player.
+    assert len(mem.reads) == 3
+
+
+def test_collect_assigned_player_indexes_uses_one_read_per_team(monkeypatch):
+    mem = _FakeMem(_roster_memory())
+    model = _model(monkeypatch, mem)
+    assert model._collect_assigned_player_indexes() == {3, 7}
+    assert mem.reads == [(TEAM_BASE, data_model_mod.TEAM_PLAYER_SLOT_COUNT * 8)]
+
+
+def test_collect_assigned_player_indexes_without_process_is_empty(monkeypatch):
+    model = _model(monkeypatch, _FakeMem({}))
+    model.mem = SimpleNamespace(hproc=None, base_addr=None)
+    assert model._collect_assigned_player_indexes() == set()
+
+
+def test_scan_all_players_resolves_teams_from_team_table(monkeypatch):
+    memory = _roster_memory()
+    team_stride = 0x1000
+    monkeypatch.setattr(data_model_mod, "OFF_TEAM_PTR", 0x60)
+    monkeypatch.setattr(data_model_mod, "OFF_TEAM_NAME", 0x300)
+    monkeypatch.setattr(data_model_mod, "TEAM_NAME_LENGTH", 12)
+    monkeypatch.setattr(data_model_mod, "TEAM_NAME_ENCODING", "utf16")
+    monkeypatch.setattr(data_model_mod, "MAX_TEAMS_SCAN", 2)
+    memory[TEAM_BASE + team_stride + 0x300] = "Celtics".encode("utf-16le")
+    memory[PLAYER_BASE + 3 * STRIDE + 0x60] = struct.pack("<Q", TEAM_BASE + team_stride)
+    memory[0x900010 + 0x300] = "Legends".encode("utf-16le")
+    memory[PLAYER_BASE + 7 * STRIDE + 0x60] = struct.pack("<Q", 0x900010)
+    mem = _FakeMem(memory)
+    model = _model(monkeypatch, mem)
+    players = model._scan_all_players(10)
+    assert [(p.index, p.team, p.team_id) for p in players] == [(3, "Celtics", 1), (7, "Legends", None)]
+
+
+def test_scan_all_players_keeps_records_before_unreadable_memory(monkeypatch):
+    mem = _FakeMem(_roster_memory())
+    limit_addr = PLAYER_BASE + 5 * STRIDE
+    read_bytes = mem.read_bytes
+
+    def bounded_read(addr: int, length: int) -> bytes:
+        if addr + length > limit_addr and addr < limit_addr + 0x1000:
+            raise RuntimeError("unreadable")
+        return read_bytes(addr, length)
+
+    mem.read_bytes = bounded_read  # type: ignore[method-assign]
+    monkeypatch.setattr(data_model_mod, "OFF_TEAM_PTR", 0)
+    monkeypatch.setattr(data_model_mod, "OFF_TEAM_ID", 0)
+    model = _model(monkeypatch, mem)
+    players = model._scan_all_players(10)
+    # Player 7 sits past the unreadable gap; player 3 is still returned.
+    assert [p.index for p in players] == [3]
+
+
+def test_scan_all_players_stops_prefetching_after_failed_batch(monkeypatch):
+    mem = _FakeMem(_roster_memory())
+    limit_addr = PLAYER_BASE + 5 * STRIDE
+    read_bytes = mem.read_bytes
+    attempts: list[int] = []
+
+    def bounded_read(addr: int, length: int) -> bytes:
+        if PLAYER_BASE <= addr < PLAYER_BASE + 10 * STRIDE:
+            attempts.append((addr - PLAYER_BASE) // STRIDE)
+        if addr + length > limit_addr and addr < limit_addr + 0x1000:
+            raise RuntimeError("unreadable")
+        return read_bytes(addr, length)
+
+    mem.read_bytes = bounded_read  # type: ignore[method-assign]
+    monkeypatch.setattr(data_model_mod, "OFF_TEAM_PTR", 0)
+    monkeypatch.setattr(data_model_mod, "OFF_TEAM_ID", 0)
+    monkeypatch.setattr(data_model_mod, "_SCAN_WINDOW_BYTES", 2 * STRIDE)
+    model = _model(monkeypatch, mem)
+    assert [p.index for p in model._scan_all_players(10)] == [3]
+    executor = model._scan_read_executor
+    assert executor is not None
+    model._scan_all_players(10)
+    assert model._scan_read_executor is executor
+    executor.shutdown(wait=True)
+    # Batches start every two records; the one holding record 5 fails, so at most one batch
+    # of lookahead (records 6-7) is ever requested past it.
+    assert max(attempts) <= 6
+
+
+def test_hold_resolved_bases_does_not_retry_failed_resolution():
+    calls: list[str] = []
+
+    class _ClosedMem:
+        hproc = None
+        base_addr = None
+
+        def open_process(self) -> bool:
+            calls.append("open")
+            return False
+
+    model = PlayerDataModel.__new__(PlayerDataModel)
+    model.mem = _ClosedMem()
+    model._resolved_player_base = None
+    model._resolved_team_base = None
+    model._held_bases = None
+    with model._hold_resolved_bases():
+        assert model._resolve_player_base_ptr() is None
+        assert model._resolve_team_base_ptr() is None
+        assert model._resolve_team_base_ptr() is None
+    assert calls == ["open", "open"]
+    model._resolve_team_base_ptr()
+    assert len(calls) == 3
+
+
+def test_collect_assigned_player_indexes_is_cached_per_roster_version(monkeypatch):
+    mem = _FakeMem(_roster_memory())
+    model = _model(monkeypatch, mem)
+    model._dirty_entities = {}
+    first = model._collect_assigned_player_indexes()
+    assert isinstance(first, frozenset)
+    assert model._collect_assigned_player_indexes() is first
+    assert len(mem.reads) == 1
+    model.mark_dirty("teams")
+    assert model._collect_assigned_player_indexes() == first
+    assert len(mem.reads) == 2
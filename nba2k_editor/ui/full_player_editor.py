@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Collection as CollectionABC
+from contextlib import nullcontext
 from typing import Collection, TYPE_CHECKING, Any, cast
 
 import dearpygui.dearpygui as dpg
@@ -17,7 +18,7 @@ from ..core.conversions import (
 from ..core.extensions import FULL_EDITOR_EXTENSIONS
 from ..models.data_model import PlayerDataModel
 from ..models.player import Player
-from ..models.schema import FieldMetadata
+from ..models.schema import FieldMetadata, field_value_kind
 
 if TYPE_CHECKING:
     class RawFieldInspectorExtension: ...
@@ -484,33 +485,35 @@ class FullPlayerEditor:
         player_record_ptr = getattr(self.player, "record_ptr", None)
         season_record_ptr = self._resolve_selected_season_record_ptr(self.player)
         values: dict[tuple[str, str], object] = {}
-        for category, fields in self.field_vars.items():
-            for field_name in fields.keys():
-                meta = self.field_meta.get((category, field_name))
-                if not meta:
-                    continue
-                if self._is_season_slot_selector_field(category, field_name):
-                    continue
-                try:
-                    source_category = self.field_source_category.get((category, field_name), category)
-                    target_record_ptr = player_record_ptr
-                    if self._is_season_stats_field(category, source_category):
-                        target_record_ptr = season_record_ptr
-                        if target_record_ptr is None:
-                            continue
-                    value = self.model.decode_field_value(
-                        entity_type="player",
-                        entity_index=self.player.index,
-                        category=source_category,
-                        field_name=field_name,
-                        meta=meta,
-                        record_ptr=target_record_ptr,
-                    )
-                except Exception:
-                    value = None
-                if value is None:
-                    continue
-                values[(category, field_name)] = value
+        scope = getattr(self.model, "record_buffer_scope", None)
+        with scope() if callable(scope) else nullcontext():
+            for category, fields in self.field_vars.items():
+                for field_name in fields.keys():
+                    meta = self.field_meta.get((category, field_name))
+                    if not meta:
+                        continue
+                    if self._is_season_slot_selector_field(category, field_name):
+                        continue
+                    try:
+                        source_category = self.field_source_category.get((category, field_name), category)
+                        target_record_ptr = player_record_ptr
+                        if self._is_season_stats_field(category, source_category):
+                            target_record_ptr = season_record_ptr
+                            if target_record_ptr is None:
+                                continue
+                        value = self.model.decode_field_value(
+                            entity_type="player",
+                            entity_index=self.player.index,
+                            category=source_category,
+                            field_name=field_name,
+                            meta=meta,
+                            record_ptr=target_record_ptr,
+                        )
+                    except Exception:
+                        value = None
+                    if value is None:
+                        continue
+                    values[(category, field_name)] = value
         self._loading_values = False
         if not self._closed:
             self._apply_loaded_values(values)
@@ -573,47 +576,49 @@ class FullPlayerEditor:
         targets = self.target_players or [self.player]
         changed_keys: list[tuple[str, str]] = []
 
-        for (category, field_name), baseline_value in baseline_map.items():
-            control = self.field_vars.get(category, {}).get(field_name)
-            meta = self.field_meta.get((category, field_name))
-            if control is None or meta is None or not dpg.does_item_exist(control):
-                continue
-            if self._is_season_slot_selector_field(category, field_name):
-                continue
-            try:
-                ui_value = self._get_ui_value(meta, control)
-            except Exception:
-                any_error = True
-                continue
-            if ui_value == baseline_value:
-                self._unsaved_changes.discard((category, field_name))
-                continue
-            changed_keys.append((category, field_name))
-            source_category = self.field_source_category.get((category, field_name), category)
-            field_ok = True
-            for target in targets:
-                target_record_ptr = getattr(target, "record_ptr", None)
-                if self._is_season_stats_field(category, source_category):
-                    target_record_ptr = self._resolve_selected_season_record_ptr(target)
-                    if target_record_ptr is None:
+        bulk_write = getattr(self.model, "bulk_write", None)
+        with bulk_write() if callable(bulk_write) else nullcontext():
+            for (category, field_name), baseline_value in baseline_map.items():
+                control = self.field_vars.get(category, {}).get(field_name)
+                meta = self.field_meta.get((category, field_name))
+                if control is None or meta is None or not dpg.does_item_exist(control):
+                    continue
+                if self._is_season_slot_selector_field(category, field_name):
+                    continue
+                try:
+                    ui_value = self._get_ui_value(meta, control)
+                except Exception:
+                    any_error = True
+                    continue
+                if ui_value == baseline_value:
+                    self._unsaved_changes.discard((category, field_name))
+                    continue
+                changed_keys.append((category, field_name))
+                source_category = self.field_source_category.get((category, field_name), category)
+                field_ok = True
+                for target in targets:
+                    target_record_ptr = getattr(target, "record_ptr", None)
+                    if self._is_season_stats_field(category, source_category):
+                        target_record_ptr = self._resolve_selected_season_record_ptr(target)
+                        if target_record_ptr is None:
+                            any_error = True
+                            field_ok = False
+                            continue
+                    ok = self.model.encode_field_value(
+                        entity_type="player",
+                        entity_index=target.index,
+                        category=source_category,
+                        field_name=field_name,
+                        meta=meta,
+                        display_value=ui_value,
+                        record_ptr=target_record_ptr,
+                    )
+                    if not ok:
                         any_error = True
                         field_ok = False
-                        continue
-                ok = self.model.encode_field_value(
-                    entity_type="player",
-                    entity_index=target.index,
-                    category=source_category,
-                    field_name=field_name,
-                    meta=meta,
-                    display_value=ui_value,
-                    record_ptr=target_record_ptr,
-                )
-                if not ok:
-                    any_error = True
-                    field_ok = False
-            if field_ok:
-                baseline_map[(category, field_name)] = ui_value
-                self._unsaved_changes.discard((category, field_name))
+                if field_ok:
+                    baseline_map[(category, field_name)] = ui_value
+                    self._unsaved_changes.discard((category, field_name))
 
         if any_error:
             self.app.show_error("Save Error", "One or more fields could not be saved.")
@@ -640,11 +645,11 @@ class FullPlayerEditor:
             if values_list == list(BADGE_LEVEL_NAMES):
                 return BADGE_NAME_TO_VALUE.get(selected, idx)
             return idx
-        data_type = (meta.data_type or "").lower()
+        value_kind = field_value_kind(meta.data_type)
         value = dpg.get_value(control_tag)
-        if any(tag in data_type for tag in ("string", "text", "char", "pointer", "wide")):
+        if value_kind == "text":
             return "" if value is None else str(value)
-        if "float" in data_type:
+        if value_kind == "float":
             try:
                 return float(cast(Any, value))
             except Exception:
@@ -745,11 +750,11 @@ class FullPlayerEditor:
             values_list = list(meta.values)
             dpg.set_value(control_tag, values_list[0] if values_list else "")
             return
-        data_type = (meta.data_type or "").lower()
-        if any(tag in data_type for tag in ("string", "text", "char", "pointer", "wide")):
+        value_kind = field_value_kind(meta.data_type)
+        if value_kind == "text":
             dpg.set_value(control_tag, "")
             return
-        if "float" in data_type:
+        if value_kind == "float":
             dpg.set_value(control_tag, 0.0)
             return
         dpg.set_value(control_tag, 0)
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import threading
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any, cast
 
 import dearpygui.dearpygui as dpg
 
 from ..core.conversions import to_int as _to_int
-from ..models.schema import FieldMetadata
+from ..models.schema import FieldMetadata, field_value_kind
 
 if TYPE_CHECKING:
     from ..models.data_model import PlayerDataModel
@@ -220,21 +221,23 @@ class FullStaffEditor:
 
         def _worker() -> None:
             values: dict[tuple[str, str], object] = {}
-            for category, fields in self.field_vars.items():
-                for field_name in fields.keys():
-                    meta = self.field_meta.get((category, field_name))
-                    if not meta:
-                        continue
-                    value = self.model.decode_field_value(
-                        entity_type="staff",
-                        entity_index=self.staff_index,
-                        category=category,
-                        field_name=field_name,
-                        meta=meta,
-                    )
-                    if value is None:
-                        continue
-                    values[(category, field_name)] = value
+            scope = getattr(self.model, "record_buffer_scope", None)
+            with scope() if callable(scope) else nullcontext():
+                for category, fields in self.field_vars.items():
+                    for field_name in fields.keys():
+                        meta = self.field_meta.get((category, field_name))
+                        if not meta:
+                            continue
+                        value = self.model.decode_field_value(
+                            entity_type="staff",
+                            entity_index=self.staff_index,
+                            category=category,
+                            field_name=field_name,
+                            meta=meta,
+                        )
+                        if value is None:
+                            continue
+                        values[(category, field_name)] = value
 
             def _apply() -> None:
                 if self._closed:
@@ -272,10 +275,10 @@ class FullStaffEditor:
                         pass
                 dpg.set_value(control, selection)
             else:
-                dtype = (meta.data_type or "").lower()
-                if any(tag in dtype for tag in ("string", "text", "char", "pointer", "wide")):
+                value_kind = field_value_kind(meta.data_type)
+                if value_kind == "text":
                     dpg.set_value(control, "" if value is None else str(value))
-                elif "float" in dtype:
+                elif value_kind == "float":
                     try:
                         dpg.set_value(control, float(cast(Any, value)))
                     except Exception:
@@ -304,33 +307,35 @@ class FullStaffEditor:
 
         errors: list[str] = []
         changed_keys: list[tuple[str, str]] = []
-        for (category, field_name), baseline_value in baseline_map.items():
-            control = self.field_vars.get(category, {}).get(field_name)
-            meta = self.field_meta.get((category, field_name))
-            if control is None or meta is None or not dpg.does_item_exist(control):
-                continue
-            try:
-                ui_value = self._get_ui_value(meta, control)
-            except Exception:
-                errors.append(f"{category}/{field_name}")
-                continue
-            if ui_value == baseline_value:
-                self._unsaved_changes.discard((category, field_name))
-                continue
-            changed_keys.append((category, field_name))
-            success = self.model.encode_field_value(
-                entity_type="staff",
-                entity_index=self.staff_index,
-                category=category,
-                field_name=field_name,
-                meta=meta,
-                display_value=ui_value,
-            )
-            if success:
-                baseline_map[(category, field_name)] = ui_value
-                self._unsaved_changes.discard((category, field_name))
-            else:
-                errors.append(f"{category}/{field_name}")
+        bulk_write = getattr(self.model, "bulk_write", None)
+        with bulk_write() if callable(bulk_write) else nullcontext():
+            for (category, field_name), baseline_value in baseline_map.items():
+                control = self.field_vars.get(category, {}).get(field_name)
+                meta = self.field_meta.get((category, field_name))
+                if control is None or meta is None or not dpg.does_item_exist(control):
+                    continue
+                try:
+                    ui_value = self._get_ui_value(meta, control)
+                except Exception:
+                    errors.append(f"{category}/{field_name}")
+                    continue
+                if ui_value == baseline_value:
+                    self._unsaved_changes.discard((category, field_name))
+                    continue
+                changed_keys.append((category, field_name))
+                success = self.model.encode_field_value(
+                    entity_type="staff",
+                    entity_index=self.staff_index,
+                    category=category,
+                    field_name=field_name,
+                    meta=meta,
+                    display_value=ui_value,
+                )
+                if success:
+                    baseline_map[(category, field_name)] = ui_value
+                    self._unsaved_changes.discard((category, field_name))
+                else:
+                    errors.append(f"{category}/{field_name}")
 
         if errors:
             self.app.show_error("Staff Editor", "Failed to save fields:\n" + "\n".join(errors))
@@ -346,11 +351,11 @@ class FullStaffEditor:
             if selected in values_list:
                 return values_list.index(selected)
             return 0
-        dtype = (meta.data_type or "").lower()
+        value_kind = field_value_kind(meta.data_type)
         value = dpg.get_value(control_tag)
-        if any(tag in dtype for tag in ("string", "text", "char", "pointer", "wide")):
+        if value_kind == "text":
             return "" if value is None else str(value)
-        if "float" in dtype:
+        if value_kind == "float":
             try:
                 return float(cast(Any, value))
             except Exception:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import threading
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any, cast
 
 import dearpygui.dearpygui as dpg
@@ -230,21 +231,23 @@ class FullTeamEditor:
 
         def _worker() -> None:
             values: dict[tuple[str, str], object] = {}
-            for category, fields in self.field_vars.items():
-                for field_name in fields.keys():
-                    meta = self.field_meta.get((category, field_name))
-                    if not meta:
-                        continue
-                    value = self.model.decode_field_value(
-                        entity_type="team",
-                        entity_index=self.team_index,
-                        category=category,
-                        field_name=field_name,
-                        meta=meta,
-                    )
-                    if value is None:
-                        continue
-                    values[(category, field_name)] = value
+            scope = getattr(self.model, "record_buffer_scope", None)
+            with scope() if callable(scope) else nullcontext():
+                for category, fields in self.field_vars.items():
+                    for field_name in fields.keys():
+                        meta = self.field_meta.get((category, field_name))
+                        if not meta:
+                            continue
+                        value = self.model.decode_field_value(
+                            entity_type="team",
+                            entity_index=self.team_index,
+                            category=category,
+                            field_name=field_name,
+                            meta=meta,
+                        )
+                        if value is None:
+                            continue
+                        values[(category, field_name)] = value
 
             def _apply() -> None:
                 if self._closed:
@@ -317,33 +320,35 @@ class FullTeamEditor:
 
         any_error = False
         changed_keys: list[tuple[str, str]] = []
-        for (category, field_name), baseline_value in baseline_map.items():
-            control = self.field_vars.get(category, {}).get(field_name)
-            meta = self.field_meta.get((category, field_name))
-            if control is None or meta is None or not dpg.does_item_exist(control):
-                continue
-            try:
-                ui_value = self._get_ui_value(meta, control)
-            except Exception:
-                any_error = True
-                continue
-            if ui_value == baseline_value:
-                self._unsaved_changes.discard((category, field_name))
-                continue
-            changed_keys.append((category, field_name))
-            ok = self.model.encode_field_value(
-                entity_type="team",
-                entity_index=self.team_index,
-                category=category,
-                field_name=field_name,
-                meta=meta,
-                display_value=ui_value,
-            )
-            if ok:
-                baseline_map[(category, field_name)] = ui_value
-                self._unsaved_changes.discard((category, field_name))
-            else:
-                any_error = True
+        bulk_write = getattr(self.model, "bulk_write", None)
+        with bulk_write() if callable(bulk_write) else nullcontext():
+            for (category, field_name), baseline_value in baseline_map.items():
+                control = self.field_vars.get(category, {}).get(field_name)
+                meta = self.field_meta.get((category, field_name))
+                if control is None or meta is None or not dpg.does_item_exist(control):
+                    continue
+                try:
+                    ui_value = self._get_ui_value(meta, control)
+                except Exception:
+                    any_error = True
+                    continue
+                if ui_value == baseline_value:
+                    self._unsaved_changes.discard((category, field_name))
+                    continue
+                changed_keys.append((category, field_name))
+                ok = self.model.encode_field_value(
+                    entity_type="team",
+                    entity_index=self.team_index,
+                    category=category,
+                    field_name=field_name,
+                    meta=meta,
+                    display_value=ui_value,
+                )
+                if ok:
+                    baseline_map[(category, field_name)] = ui_value
+                    self._unsaved_changes.discard((category, field_name))
+                else:
+                    any_error = True
 
         if any_error:
             self.app.show_error("Save Error", "One or more fields could not be saved.")